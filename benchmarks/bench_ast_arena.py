@@ -0,0 +1,62 @@
+import gc
+import timeit
+import tracemalloc
+from collections.abc import Callable
+
+from benchmarks.programs import generate_program, parse
+from vdsh.core.models.arena import ASTArena
+from vdsh.core.models.ast import BaseASTNode, BinaryOperationNode
+from vdsh.core.pipeline.passes.tree import walk
+
+FUNCTIONS = 500
+REPEATS = 5
+
+
+def retained_memory(create: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    value = create()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+
+    return retained
+
+
+def count_binary_operations_in_tree(ast: BaseASTNode) -> int:
+    return sum(isinstance(node, BinaryOperationNode) for node in walk(ast))
+
+
+def count_binary_operations_in_arena(arena: ASTArena) -> int:
+    return sum(1 for _ in arena.ids_of_kind(BinaryOperationNode))
+
+
+def main() -> None:
+    code = generate_program(FUNCTIONS)
+    ast = parse(code)
+    arena = ASTArena.from_ast(ast)
+
+    assert arena.to_ast() == ast
+    assert count_binary_operations_in_tree(ast) == count_binary_operations_in_arena(arena)
+
+    tree_memory = retained_memory(lambda: parse(code))
+    arena_memory = retained_memory(lambda: ASTArena.from_ast(ast))
+    tree_time = min(
+        timeit.repeat(lambda: count_binary_operations_in_tree(ast), number=1, repeat=REPEATS),
+    )
+    arena_time = min(
+        timeit.repeat(lambda: count_binary_operations_in_arena(arena), number=1, repeat=REPEATS),
+    )
+
+    print(f"nodes: {len(arena)}, tokens: {len(arena.token_kinds)}")
+    print(f"tree memory:  {tree_memory / 1024:10.1f} KiB")
+    print(f"arena memory: {arena_memory / 1024:10.1f} KiB")
+    print(f"memory ratio: {tree_memory / arena_memory:10.1f}x")
+    print(f"tree scan:    {tree_time * 1000:10.2f} ms")
+    print(f"arena scan:   {arena_time * 1000:10.2f} ms")
+    print(f"scan speedup: {tree_time / arena_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import timeit
+
+from benchmarks.programs import generate_program, parse
+from vdsh.core.serialization import dumps, loads
+
+FUNCTIONS = 500
+REPEATS = 5
+
+
+def main() -> None:
+    code = generate_program(FUNCTIONS)
+    ast = parse(code)
+    data = dumps(ast)
+
+    assert loads(data) == ast
+
+    parse_time = min(timeit.repeat(lambda: parse(code), number=1, repeat=REPEATS))
+    load_time = min(timeit.repeat(lambda: loads(data), number=1, repeat=REPEATS))
+
+    print(f"source: {len(code)} bytes, cache: {len(data)} bytes")
+    print(f"tokenize + parse: {parse_time * 1000:8.2f} ms")
+    print(f"load cache:       {load_time * 1000:8.2f} ms")
+    print(f"speedup:          {parse_time / load_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import shutil
+import time
+
+from benchmarks.bench_interpreter import REPEATS, run_bash, run_interpreter
+from benchmarks.programs import parse
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.pipeline import OptimizationLevel, PassManager
+from vdsh.core.pipeline.bytecode_compiler import BytecodeCompiler
+from vdsh.core.pipeline.vm import VirtualMachine
+from vdsh.core.serialization import dumps_bytecode, loads_bytecode
+
+DIGEST = bytes(32)
+WORKLOADS = {
+    "loop": (
+        """
+let total = 0;
+for (let i = 0; i < 20000; i = i + 1) { total = total + i * i % 7; }
+""",
+        "total",
+    ),
+    "nested": (
+        """
+let total = 0;
+for (let i = 0; i < 150; i = i + 1) {
+    let j = 0;
+    while j < 150 { if (i + j) % 3 == 0 { total = total + j; } j = j + 1; }
+}
+""",
+        "total",
+    ),
+    "fib(18)": (
+        """
+func fib(n: int) { if n < 2 { return n; } return fib(n - 1) + fib(n - 2); }
+let total = fib(18);
+""",
+        "total",
+    ),
+}
+
+
+def run_vm(ast: BaseASTNode, variable: str) -> tuple[float, str]:
+    program = loads_bytecode(dumps_bytecode(BytecodeCompiler().transform(ast), DIGEST), DIGEST)
+    timings = []
+    output = ""
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        variables = VirtualMachine().transform(program)
+        timings.append(time.perf_counter() - start)
+        output = str(variables[variable])
+
+    return min(timings), output
+
+
+def main() -> None:
+    if shutil.which("bash") is None:
+        print("bash is not installed")
+        return
+
+    for name, (code, variable) in WORKLOADS.items():
+        ast = PassManager.from_level(OptimizationLevel.O1).transform(parse(code))
+        bash_time, bash_output = run_bash(ast, variable)
+        tree_time, tree_output = run_interpreter(ast, variable)
+        vm_time, vm_output = run_vm(ast, variable)
+
+        assert bash_output == tree_output == vm_output
+
+        print(
+            f"{name:8} bash: {bash_time * 1000:8.1f} ms"
+            f"  tree: {tree_time * 1000:8.1f} ms"
+            f"  bytecode: {vm_time * 1000:8.1f} ms"
+            f"  vs tree: {tree_time / vm_time:5.1f}x"
+            f"  vs bash: {bash_time / vm_time:5.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
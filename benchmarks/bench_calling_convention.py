@@ -0,0 +1,51 @@
+import shutil
+import subprocess
+import time
+
+from benchmarks.programs import parse
+from vdsh.core.pipeline import CodeGenerator
+from vdsh.core.pipeline.code_generator import CallingConvention
+
+CALLS = 2000
+REPEATS = 3
+PROGRAM_HEADER = """
+func add(a: int, b: int) { return a + b; }
+let x = 0;
+"""
+CALL_STATEMENT = "let x = add(x, 1);\n"
+
+
+def run_script(script: str) -> tuple[float, str]:
+    start = time.perf_counter()
+    result = subprocess.run(["bash"], input=script, capture_output=True, text=True, check=True)
+
+    return time.perf_counter() - start, result.stdout.strip()
+
+
+def main() -> None:
+    if shutil.which("bash") is None:
+        print("bash is not installed")
+        return
+
+    ast = parse(PROGRAM_HEADER + CALL_STATEMENT * CALLS)
+    timings = {}
+
+    for convention in CallingConvention:
+        script = CodeGenerator(calling_convention=convention).transform(ast)
+        script += '\necho "$__VDSH__x"'
+
+        runs = [run_script(script) for _ in range(REPEATS)]
+        assert all(output == str(CALLS) for _, output in runs)
+        timings[convention] = min(elapsed for elapsed, _ in runs)
+
+    register = timings[CallingConvention.REGISTER]
+    subshell = timings[CallingConvention.SUBSHELL]
+
+    print(f"calls: {CALLS}")
+    print(f"subshell: {subshell * 1000:8.1f} ms ({subshell / CALLS * 1e6:6.1f} us/call)")
+    print(f"register: {register * 1000:8.1f} ms ({register / CALLS * 1e6:6.1f} us/call)")
+    print(f"speedup:  {subshell / register:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
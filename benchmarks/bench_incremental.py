@@ -0,0 +1,30 @@
+import timeit
+
+from benchmarks.programs import generate_program
+from vdsh.core.pipeline.incremental import TextEdit, parse_source, reparse
+
+# Every generated function takes 7 lines, so this is about 10k lines
+FUNCTIONS = 1430
+REPEATS = 5
+
+
+def main() -> None:
+    code = generate_program(FUNCTIONS)
+    parsed = parse_source(code)
+    middle = code.index("% 7", len(code) // 2) + 2
+    edits = {
+        "replace a digit": TextEdit(start=middle, end=middle + 1, text="9"),
+        "insert a newline": TextEdit(start=middle, end=middle, text="\n"),
+    }
+
+    full_time = min(timeit.repeat(lambda: parse_source(code), number=1, repeat=REPEATS))
+    print(f"{code.count(chr(10))} lines, {len(parsed.tokens)} tokens")
+    print(f"full parse:         {full_time * 1000:8.2f} ms")
+
+    for name, edit in edits.items():
+        edit_time = min(timeit.repeat(lambda: reparse(parsed, edit), number=1, repeat=REPEATS))  # noqa: B023
+        print(f"{name + ':':<20}{edit_time * 1000:8.2f} ms ({edit_time / full_time:.2%})")
+
+
+if __name__ == "__main__":
+    main()
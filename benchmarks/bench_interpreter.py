@@ -0,0 +1,77 @@
+import shutil
+import subprocess
+import time
+
+from benchmarks.programs import parse
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.pipeline import CodeGenerator, OptimizationLevel, PassManager
+from vdsh.core.pipeline.interpreter import Interpreter
+
+REPEATS = 3
+WORKLOADS = {
+    "loop": (
+        """
+let total = 0;
+for (let i = 0; i < 20000; i = i + 1) { total = total + i * i % 7; }
+""",
+        "total",
+    ),
+    "fib(18)": (
+        """
+func fib(n: int) { if n < 2 { return n; } return fib(n - 1) + fib(n - 2); }
+let total = fib(18);
+""",
+        "total",
+    ),
+    "tiny": ("let total = 6 * 7;", "total"),
+}
+
+
+def run_bash(ast: BaseASTNode, variable: str) -> tuple[float, str]:
+    script = CodeGenerator().transform(ast) + f'\necho "$__VDSH__{variable}"'
+    timings = []
+    output = ""
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = subprocess.run(["bash"], input=script, capture_output=True, text=True, check=True)
+        timings.append(time.perf_counter() - start)
+        output = result.stdout.strip()
+
+    return min(timings), output
+
+
+def run_interpreter(ast: BaseASTNode, variable: str) -> tuple[float, str]:
+    timings = []
+    output = ""
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        variables = Interpreter().transform(ast)
+        timings.append(time.perf_counter() - start)
+        output = str(variables[variable])
+
+    return min(timings), output
+
+
+def main() -> None:
+    if shutil.which("bash") is None:
+        print("bash is not installed")
+        return
+
+    for name, (code, variable) in WORKLOADS.items():
+        ast = PassManager.from_level(OptimizationLevel.O1).transform(parse(code))
+        bash_time, bash_output = run_bash(ast, variable)
+        interpreter_time, interpreter_output = run_interpreter(ast, variable)
+
+        assert bash_output == interpreter_output
+
+        print(
+            f"{name:8} bash: {bash_time * 1000:8.1f} ms"
+            f"  interpreter: {interpreter_time * 1000:8.1f} ms"
+            f"  speedup: {bash_time / interpreter_time:8.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
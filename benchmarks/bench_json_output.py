@@ -0,0 +1,52 @@
+import io
+import timeit
+
+from rich.console import Console
+from rich.pretty import pprint
+
+from benchmarks.programs import generate_program
+from vdsh.cli.output import write_json_lines
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.token import BaseToken
+from vdsh.core.pipeline import Tokenizer
+
+FUNCTIONS = 50
+REPEATS = 3
+
+
+def tokenize(code: str) -> list[BaseToken]:
+    tokenizer = Tokenizer(SequenceIterator(code))
+    tokens = []
+
+    while not tokenizer.is_over():
+        tokens.append(tokenizer.next())
+
+    return tokens
+
+
+def render_rich(tokens: list[BaseToken]) -> None:
+    console = Console(file=io.StringIO(), width=100)
+
+    for token in tokens:
+        pprint(token, console=console, expand_all=True)
+
+
+def main() -> None:
+    code = generate_program(FUNCTIONS)
+    tokens = tokenize(code)
+
+    tokenize_time = min(timeit.repeat(lambda: tokenize(code), number=1, repeat=REPEATS))
+    rich_time = min(timeit.repeat(lambda: render_rich(tokens), number=1, repeat=REPEATS))
+    jsonl_time = min(
+        timeit.repeat(lambda: write_json_lines(tokens, io.StringIO()), number=1, repeat=REPEATS),
+    )
+
+    print(f"{len(tokens)} tokens")
+    print(f"tokenize:     {tokenize_time * 1000:8.2f} ms")
+    print(f"rich output:  {rich_time * 1000:8.2f} ms")
+    print(f"jsonl output: {jsonl_time * 1000:8.2f} ms")
+    print(f"speedup:      {rich_time / jsonl_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import shutil
+import subprocess
+import time
+
+from benchmarks.programs import parse
+from vdsh.core.pipeline import CodeGenerator
+
+ITERATIONS = 100_000
+REPEATS = 3
+PROGRAM = """
+let total = 0;
+for (let i = 0; i < {iterations}; i = i + 1) {{
+    total = total + i % 7;
+}}
+"""
+SEQ_SCRIPT = """
+total=0
+for i in $(seq 0 $(({iterations} - 1))); do
+    total=$(expr "$total" + "$i" % 7)
+done
+"""
+TEST_SCRIPT = """
+total=0
+i=0
+while [ "$i" -lt {iterations} ]; do
+    total=$(( $total + $i % 7 ))
+    i=$(( $i + 1 ))
+done
+"""
+OUTPUT_FORMAT = '\necho "${variable}"'
+
+
+def run_script(script: str, iterations: int) -> float:
+    expected = sum(index % 7 for index in range(iterations))
+    timings = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = subprocess.run(["bash"], input=script, capture_output=True, text=True, check=True)
+        timings.append(time.perf_counter() - start)
+
+        assert result.stdout.strip() == str(expected)
+
+    return min(timings)
+
+
+def main() -> None:
+    if shutil.which("bash") is None or shutil.which("seq") is None:
+        print("bash and seq are required")
+        return
+
+    generated = CodeGenerator().transform(parse(PROGRAM.format(iterations=ITERATIONS)))
+    generated_time = run_script(
+        generated + OUTPUT_FORMAT.format(variable="__VDSH__total"),
+        ITERATIONS,
+    )
+    test_time = run_script(
+        TEST_SCRIPT.format(iterations=ITERATIONS) + OUTPUT_FORMAT.format(variable="total"),
+        ITERATIONS,
+    )
+
+    # `expr` forks once per iteration, so the seq based loop runs on a smaller input
+    seq_iterations = ITERATIONS // 100
+    seq_time = run_script(
+        SEQ_SCRIPT.format(iterations=seq_iterations) + OUTPUT_FORMAT.format(variable="total"),
+        seq_iterations,
+    )
+
+    print(f"iterations: {ITERATIONS}")
+    print(f"vdsh for ((...)):   {generated_time / ITERATIONS * 1e6:8.2f} us/iteration")
+    print(f"while [ ... ]:      {test_time / ITERATIONS * 1e6:8.2f} us/iteration")
+    print(f"seq with expr:      {seq_time / seq_iterations * 1e6:8.2f} us/iteration")
+    print(f"speedup over test:  {test_time / generated_time:8.1f}x")
+    print(
+        f"speedup over seq:   {seq_time / seq_iterations / (generated_time / ITERATIONS):8.1f}x",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import asyncio
+import io
+import time
+
+from benchmarks.bench_incremental import FUNCTIONS
+from benchmarks.programs import generate_program
+from vdsh.cli.lsp import LanguageServer
+from vdsh.cli.lsp.protocol import encode_message
+
+URI = "file:///bench.vdsh"
+EDITS = 20
+
+
+def _published(output: io.BytesIO) -> int:
+    return output.getvalue().count(b"publishDiagnostics")
+
+
+async def _wait_for(output: io.BytesIO, count: int) -> None:
+    while _published(output) < count:
+        await asyncio.sleep(0.0005)
+
+
+async def measure() -> None:
+    code = generate_program(FUNCTIONS)
+    line = code.count("\n") // 2
+    server = LanguageServer(debounce=0)
+    reader = asyncio.StreamReader()
+    output = io.BytesIO()
+    task = asyncio.create_task(server.serve(reader, output))
+
+    start = time.perf_counter()
+    reader.feed_data(
+        encode_message(
+            {
+                "method": "textDocument/didOpen",
+                "params": {"textDocument": {"uri": URI, "version": 0, "text": code}},
+            },
+        ),
+    )
+    await _wait_for(output, 1)
+    open_time = time.perf_counter() - start
+
+    edit_times = []
+    request_times = []
+    for version in range(1, EDITS + 1):
+        # Indents a line by one more space, so every edit leaves a valid program behind
+        position = {"line": line, "character": 0}
+        change = {"range": {"start": position, "end": position}, "text": " "}
+        start = time.perf_counter()
+        reader.feed_data(
+            encode_message(
+                {
+                    "method": "textDocument/didChange",
+                    "params": {
+                        "textDocument": {"uri": URI, "version": version},
+                        "contentChanges": [change],
+                    },
+                },
+            ),
+        )
+        reader.feed_data(encode_message({"id": version, "method": "initialize", "params": {}}))
+        while f'"id": {version},'.encode() not in output.getvalue():
+            await asyncio.sleep(0.0005)
+        request_times.append(time.perf_counter() - start)
+
+        await _wait_for(output, version + 1)
+        edit_times.append(time.perf_counter() - start)
+
+    reader.feed_eof()
+    await task
+
+    print(f"{code.count(chr(10))} lines")
+    print(f"open:                 {open_time * 1000:8.2f} ms")
+    print(f"edit to diagnostics:  {sorted(edit_times)[EDITS // 2] * 1000:8.2f} ms (median)")
+    print(f"request response:     {max(request_times) * 1000:8.2f} ms (max)")
+
+
+if __name__ == "__main__":
+    asyncio.run(measure())
@@ -0,0 +1,59 @@
+import shutil
+import subprocess
+import time
+
+from benchmarks.programs import parse
+from vdsh.core.pipeline import CodeGenerator
+from vdsh.core.pipeline.passes import Memoizer
+
+ARGUMENT = 16
+REPEATS = 3
+PROGRAM = """
+func fib(n: int) {{
+    if n < 2 {{ return n; }}
+    return fib(n - 1) + fib(n - 2);
+}}
+let x = 0;
+for (let i = 0; i < 10; i = i + 1) {{ x = fib({argument}); }}
+"""
+OUTPUT_LINE = '\necho "$__VDSH__x"'
+
+
+def fibonacci(argument: int) -> int:
+    previous, current = 0, 1
+    for _ in range(argument):
+        previous, current = current, previous + current
+
+    return previous
+
+
+def run_script(script: str) -> float:
+    timings = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = subprocess.run(["bash"], input=script, capture_output=True, text=True, check=True)
+        timings.append(time.perf_counter() - start)
+
+        assert result.stdout.strip() == str(fibonacci(ARGUMENT))
+
+    return min(timings)
+
+
+def main() -> None:
+    if shutil.which("bash") is None:
+        print("bash is not installed")
+        return
+
+    ast = parse(PROGRAM.format(argument=ARGUMENT))
+    plain_time = run_script(CodeGenerator().transform(ast) + OUTPUT_LINE)
+    memoized_time = run_script(CodeGenerator().transform(Memoizer().transform(ast)) + OUTPUT_LINE)
+
+    print(f"10 x fib({ARGUMENT})")
+    print(f"plain:    {plain_time * 1000:8.1f} ms")
+    print(f"memoized: {memoized_time * 1000:8.1f} ms")
+    print(f"speedup:  {plain_time / memoized_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import os
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.bench_incremental import FUNCTIONS
+from benchmarks.programs import generate_program
+from vdsh.core.pipeline.parallel_tokenizer import split_source, tokenize, tokenize_parallel
+
+REPEATS = 3
+JOBS = [2, 4, 8]
+
+
+def main() -> None:
+    code = generate_program(FUNCTIONS)
+    tokens = tokenize(code)
+
+    serial_time = min(timeit.repeat(lambda: tokenize(code), number=1, repeat=REPEATS))
+    split_time = min(timeit.repeat(lambda: split_source(code, max(JOBS)), number=1, repeat=REPEATS))
+    print(f"{code.count(chr(10))} lines, {len(tokens)} tokens, {os.cpu_count()} CPUs")
+    print(f"serial:     {serial_time * 1000:8.2f} ms")
+    print(f"pre-scan:   {split_time * 1000:8.2f} ms")
+
+    for jobs in JOBS:
+        # The pool is started up front, as it would be in a long running process
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            assert tokenize_parallel(code, jobs=jobs, executor=executor) == tokens
+            parallel_time = min(
+                timeit.repeat(
+                    lambda: tokenize_parallel(code, jobs=jobs, executor=executor),  # noqa: B023
+                    number=1,
+                    repeat=REPEATS,
+                ),
+            )
+
+        speedup = serial_time / parallel_time
+        print(f"{jobs} jobs:     {parallel_time * 1000:8.2f} ms ({speedup:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.programs import parse
+from vdsh.core.models.call_profile import CallProfile
+from vdsh.core.pipeline import CodeGenerator, OptimizationLevel, PassManager
+from vdsh.core.pipeline.backends import ProfilingCodeGenerator
+from vdsh.core.pipeline.backends.profiling import (
+    PROFILE_FILE_VARIABLE,
+    collect_call_profile,
+    read_profile,
+)
+
+ITERATIONS = 2000
+REPEATS = 3
+PROGRAM = """
+let total = 0;
+func step(i: int) {{
+    let a = i * 3 + 1;
+    let b = (a % 7) * (i % 5) + a / 3;
+    let c = b * b % 11 + a;
+    total = total + c % 13;
+}}
+func report(n: int) {{ let shown = n; }}
+for (let i = 0; i < {iterations}; i = i + 1) {{ step(i); }}
+report(total);
+"""
+OUTPUT_LINE = '\necho "$__VDSH__total"'
+
+
+def collect_profile(code: str) -> CallProfile:
+    generator = ProfilingCodeGenerator()
+    script = generator.transform(parse(code))
+
+    with tempfile.TemporaryDirectory() as directory:
+        profile = Path(directory) / "vdsh.profile"
+        subprocess.run(
+            ["bash"],
+            input=script,
+            capture_output=True,
+            text=True,
+            check=True,
+            env=os.environ | {PROFILE_FILE_VARIABLE: str(profile)},
+        )
+
+        return collect_call_profile(read_profile(profile, generator.spans))
+
+
+def build(code: str, profile: CallProfile | None) -> str:
+    ast = PassManager.from_level(OptimizationLevel.O2, profile).transform(parse(code))
+
+    return CodeGenerator().transform(ast) + OUTPUT_LINE
+
+
+def run_script(script: str) -> tuple[float, str]:
+    timings = []
+    output = ""
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = subprocess.run(["bash"], input=script, capture_output=True, text=True, check=True)
+        timings.append(time.perf_counter() - start)
+        output = result.stdout
+
+    return min(timings), output
+
+
+def main() -> None:
+    if shutil.which("bash") is None:
+        print("bash is not installed")
+        return
+
+    code = PROGRAM.format(iterations=ITERATIONS)
+    profile = collect_profile(code)
+    static_time, static_output = run_script(build(code, None))
+    pgo_time, pgo_output = run_script(build(code, profile))
+
+    assert static_output == pgo_output
+
+    print(f"{ITERATIONS} calls of a hot 36-node function, profile: {profile.calls}")
+    print(f"static: {static_time * 1000:8.1f} ms")
+    print(f"pgo:    {pgo_time * 1000:8.1f} ms")
+    print(f"speedup: {static_time / pgo_time:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
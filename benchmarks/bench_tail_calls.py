@@ -0,0 +1,64 @@
+import shutil
+import subprocess
+import time
+
+from benchmarks.programs import parse
+from vdsh.core.pipeline import CodeGenerator
+from vdsh.core.pipeline.passes import TailCallEliminator
+
+DEPTHS = [1_000, 5_000, 20_000]
+REPEATS = 3
+PROGRAM = """
+func sum(n: int, acc: int) {{
+    if n == 0 {{ return acc; }}
+    return sum(n - 1, acc + n);
+}}
+let x = sum({depth}, 0);
+"""
+OUTPUT_LINE = '\necho "$__VDSH__x"'
+
+
+def run_script(script: str, depth: int) -> float | None:
+    timings = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = subprocess.run(["bash"], input=script, capture_output=True, text=True, check=False)
+        timings.append(time.perf_counter() - start)
+
+        if result.returncode != 0 or result.stdout.strip() != str(sum(range(depth + 1))):
+            return None
+
+    return min(timings)
+
+
+def describe(timing: float | None) -> str:
+    return "   failed" if timing is None else f"{timing * 1000:7.1f}ms"
+
+
+def main() -> None:
+    if shutil.which("bash") is None:
+        print("bash is not installed")
+        return
+
+    for depth in DEPTHS:
+        ast = parse(PROGRAM.format(depth=depth))
+        recursive = CodeGenerator().transform(ast) + OUTPUT_LINE
+        transformed = CodeGenerator().transform(TailCallEliminator().transform(ast)) + OUTPUT_LINE
+
+        recursive_time = run_script(recursive, depth)
+        transformed_time = run_script(transformed, depth)
+        speedup = (
+            ""
+            if recursive_time is None or transformed_time is None
+            else (f"  speedup: {recursive_time / transformed_time:5.1f}x")
+        )
+
+        print(
+            f"depth {depth:6}: recursive {describe(recursive_time)}"
+            f"  loop {describe(transformed_time)}{speedup}",
+        )
+
+
+if __name__ == "__main__":
+    main()
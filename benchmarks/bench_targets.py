@@ -0,0 +1,53 @@
+import shutil
+import subprocess
+import time
+
+from benchmarks.programs import parse
+from vdsh.core.pipeline.backends import Target, create_code_generator
+
+INVOCATIONS = 200
+REPEATS = 3
+SHORT_PROGRAM = """
+func add(a: int, b: int) { return a + b; }
+let x = add(1, 2);
+"""
+LOOP_PROGRAM = """
+func add(a: int, b: int) { return a + b; }
+let x = 0;
+for (let i = 0; i < 20000; i = i + 1) { x = add(x, i % 3); }
+"""
+
+
+def time_invocations(target: Target, script: str, invocations: int) -> float:
+    timings = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(invocations):
+            subprocess.run([target.value, "-c", script], check=True)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    targets = [target for target in Target if shutil.which(target.value) is not None]
+    short_scripts = {
+        target: create_code_generator(target).transform(parse(SHORT_PROGRAM)) for target in targets
+    }
+    loop_scripts = {
+        target: create_code_generator(target).transform(parse(LOOP_PROGRAM)) for target in targets
+    }
+
+    print(f"{'target':8} {'short script':>18} {'20k calls loop':>16}")
+    for target in targets:
+        short_time = time_invocations(target, short_scripts[target], INVOCATIONS)
+        loop_time = time_invocations(target, loop_scripts[target], 1)
+        print(
+            f"{target.value:8} {short_time / INVOCATIONS * 1000:12.2f} ms/run"
+            f" {loop_time * 1000:13.1f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
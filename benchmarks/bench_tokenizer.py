@@ -0,0 +1,21 @@
+import timeit
+
+from benchmarks.bench_incremental import FUNCTIONS
+from benchmarks.programs import generate_program
+from vdsh.core.pipeline.parallel_tokenizer import tokenize
+
+REPEATS = 5
+
+
+def main() -> None:
+    code = generate_program(FUNCTIONS)
+    tokens = len(tokenize(code))
+
+    tokenize_time = min(timeit.repeat(lambda: tokenize(code), number=1, repeat=REPEATS))
+    print(f"{code.count(chr(10))} lines, {len(code) // 1024} KiB, {tokens} tokens")
+    rate = tokens / tokenize_time / 1000
+    print(f"tokenize:   {tokenize_time * 1000:8.2f} ms ({rate:.0f}k tokens/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import timeit
+
+from benchmarks.programs import generate_program, parse
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.pipeline import CodeGenerator
+from vdsh.core.pipeline.passes.tree import count_nodes
+
+FUNCTIONS = 500
+REPEATS = 5
+
+
+class DictDispatchCodeGenerator(CodeGenerator):
+    """The previous dispatch, which rebuilt the table of bound methods on every visit"""
+
+    def visit(self, node: BaseASTNode) -> str:
+        generators = {
+            node_type: getattr(self, name) for node_type, name in self._handler_names.items()
+        }
+
+        return generators[type(node)](node)  # type: ignore[no-any-return]
+
+
+def main() -> None:
+    ast = parse(generate_program(FUNCTIONS))
+    nodes = count_nodes(ast)
+
+    assert DictDispatchCodeGenerator().transform(ast) == CodeGenerator().transform(ast)
+
+    dict_time = min(
+        timeit.repeat(
+            lambda: DictDispatchCodeGenerator().transform(ast),
+            number=1,
+            repeat=REPEATS,
+        ),
+    )
+    cached_time = min(
+        timeit.repeat(lambda: CodeGenerator().transform(ast), number=1, repeat=REPEATS),
+    )
+
+    print(f"nodes: {nodes}")
+    print(f"dict dispatch:   {dict_time * 1000:8.2f} ms ({dict_time / nodes * 1e9:6.0f} ns/node)")
+    print(
+        f"cached dispatch: {cached_time * 1000:8.2f} ms ({cached_time / nodes * 1e9:6.0f} ns/node)",
+    )
+    print(f"speedup:         {dict_time / cached_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
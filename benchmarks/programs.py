@@ -0,0 +1,40 @@
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.pipeline import Parser, Tokenizer
+
+FUNCTION_TEMPLATE = """
+func helper{name}(first: int, second: int) {{
+    let total = first * {index} + second;
+    let scaled = (total - first) % 7 + second ** 2;
+    let flag = scaled >= total && first != second || !second;
+}}
+"""
+CALL_TEMPLATE = "helper{name}({index}, {index} + 1);\n"
+
+
+def identifier_suffix(index: int) -> str:
+    """Identifiers may only contain letters, so indices are spelled in base 26"""
+    suffix = ""
+
+    while True:
+        index, remainder = divmod(index, 26)
+        suffix = chr(ord("a") + remainder) + suffix
+        if index == 0:
+            return suffix
+
+
+def generate_program(functions: int) -> str:
+    definitions = "".join(
+        FUNCTION_TEMPLATE.format(name=identifier_suffix(index), index=index)
+        for index in range(functions)
+    )
+    calls = "".join(
+        CALL_TEMPLATE.format(name=identifier_suffix(index), index=index)
+        for index in range(functions)
+    )
+
+    return definitions + calls
+
+
+def parse(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
@@ -0,0 +1,13 @@
+from typer.testing import CliRunner
+
+from vdsh.cli.app import app
+
+FIB = "func fib(n: int) { if n < 2 { return n; } return fib(n - 1) + fib(n - 2); } fib(5);"
+
+
+def test_fork_budget_applies_to_the_chosen_calling_convention() -> None:
+    runner = CliRunner()
+    arguments = ["analyze", "--code", "--max-forks", "1", FIB]
+
+    assert runner.invoke(app, arguments).exit_code == 0
+    assert runner.invoke(app, [*arguments, "--calling-convention", "subshell"]).exit_code == 1
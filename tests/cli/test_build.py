@@ -0,0 +1,13 @@
+from typer.testing import CliRunner
+
+from vdsh.cli.app import app
+
+FIB = "func fib(n: int) { if n < 2 { return n; } return fib(n - 1) + fib(n - 2); } let x = fib(9);"
+
+
+def test_bounds_memo_caches() -> None:
+    arguments = ["build", "--code", "-O", "2", "--memo-max-entries", "3", FIB]
+    result = CliRunner().invoke(app, arguments)
+
+    assert result.exit_code == 0
+    assert "if ((${#__VDSH_MEMO__fib[@]} >= 3)); then" in result.stdout
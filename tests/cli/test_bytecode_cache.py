@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from vdsh.cli import bytecode_cache
+from vdsh.cli.app import app
+from vdsh.core.pipeline import OptimizationLevel
+
+
+def test_digest_depends_on_the_bytecode_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    digest = bytecode_cache.source_digest("let x = 1;", OptimizationLevel.O1)
+    monkeypatch.setattr(bytecode_cache, "BYTECODE_VERSION", bytecode_cache.BYTECODE_VERSION + 1)
+
+    assert bytecode_cache.source_digest("let x = 1;", OptimizationLevel.O1) != digest
+
+
+def test_eval_caches_in_the_cache_directory(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("VDSH_CACHE_DIR", str(cache))
+    source = tmp_path / "script.vdsh"
+    source.write_text("let x = 1 + 2;")
+
+    for _ in range(2):
+        result = CliRunner().invoke(app, ["eval", str(source)])
+        assert result.exit_code == 0
+        assert "'x': 3" in result.stdout
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cache", "script.vdsh"]
+    assert list(cache.iterdir()) == [bytecode_cache.bytecode_cache_path(source)]
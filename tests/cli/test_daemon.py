@@ -0,0 +1,111 @@
+import os
+import socket
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from vdsh.cli.daemon.client import forward, parse_build_arguments, request_compilation
+from vdsh.cli.daemon.protocol import CompileRequest, default_socket_path, is_trusted_socket
+from vdsh.cli.daemon.server import CompileServer
+
+
+def test_parse_build_arguments() -> None:
+    request = parse_build_arguments(["build", "let x = 1;", "--code"])
+
+    assert request is not None
+    assert request.source == "let x = 1;"
+
+
+def test_parse_build_arguments_falls_back_on_unknown_options() -> None:
+    assert parse_build_arguments(["build", "x", "--code", "--verbose"]) is None
+    assert parse_build_arguments(["parse", "x", "--code"]) is None
+    assert parse_build_arguments(["build"]) is None
+
+
+def test_server_compiles_and_shuts_down_when_idle(tmp_path: Path) -> None:
+    server = CompileServer(socket_path=tmp_path / "vdsh.sock", idle_timeout=0.5)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    while not server.is_running():
+        time.sleep(0.01)
+
+    response = request_compilation(CompileRequest(source="let x = 1 + 2;"), server.socket_path)
+    assert response is not None
+    assert response.error is None
+    assert response.output == "__VDSH__x=$((1+2))"
+
+    response = request_compilation(CompileRequest(source="let x = (1;"), server.socket_path)
+    assert response is not None
+    assert response.error is not None
+
+    response = request_compilation(CompileRequest(source="", version="0"), server.socket_path)
+    assert response is None
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not server.socket_path.exists()
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "vdsh.sock"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(path))
+        path.chmod(0o600)
+        yield path
+
+
+def test_default_socket_path_is_private(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("VDSH_DAEMON_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert default_socket_path() == Path("/run/user/1000/vdsh.sock")
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    assert default_socket_path().parent == Path(tempfile.gettempdir()) / f"vdsh-{os.getuid()}"
+
+
+def test_trusts_only_private_sockets_of_the_current_user(
+    socket_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert is_trusted_socket(socket_path)
+
+    socket_path.chmod(0o620)
+    assert not is_trusted_socket(socket_path)
+
+    socket_path.chmod(0o600)
+    monkeypatch.setattr(os, "getuid", lambda: socket_path.lstat().st_uid + 1)
+    assert not is_trusted_socket(socket_path)
+
+
+def test_does_not_trust_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "vdsh.sock"
+    path.write_text("")
+    path.chmod(0o600)
+
+    assert not is_trusted_socket(path)
+    assert not is_trusted_socket(tmp_path / "missing.sock")
+
+
+def test_forward_compiles_locally_with_an_untrusted_socket(tmp_path: Path) -> None:
+    server = CompileServer(socket_path=tmp_path / "vdsh.sock", idle_timeout=0.5)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    while not server.is_running():
+        time.sleep(0.01)
+
+    argv = ["build", "let x = 1;", "--code"]
+    server.socket_path.chmod(0o666)
+    assert forward(argv, server.socket_path) is None
+
+    server.socket_path.chmod(0o600)
+    assert forward(argv, server.socket_path) == 0
+
+    thread.join(timeout=5)
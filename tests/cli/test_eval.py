@@ -0,0 +1,21 @@
+import pytest
+from typer.testing import CliRunner
+
+from vdsh.cli.app import app
+
+INLINED_PROGRAM = """
+func bump(x: int) { let y = x + 1; total = total + y; }
+let total = 0;
+bump(1);
+bump(total);
+"""
+
+
+@pytest.mark.parametrize("engine", ["tree", "bytecode"])
+def test_inlining_does_not_change_the_output(engine: str) -> None:
+    arguments = ["eval", "--code", "--engine", engine, INLINED_PROGRAM]
+    outputs = [CliRunner().invoke(app, [*arguments, "-O", level]) for level in ["0", "2"]]
+
+    assert [output.exit_code for output in outputs] == [0, 0]
+    assert "bump" not in outputs[1].stdout
+    assert outputs[0].stdout == outputs[1].stdout
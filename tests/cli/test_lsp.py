@@ -0,0 +1,179 @@
+import asyncio
+import io
+import json
+from typing import Any
+
+from vdsh.cli.lsp import LanguageServer
+from vdsh.cli.lsp.protocol import encode_message, read_message, to_lsp_diagnostic
+from vdsh.core.diagnostics import Diagnostic
+from vdsh.core.models.position import Position
+
+URI = "file:///script.vdsh"
+
+
+def _decode_all(data: bytes) -> list[dict[str, Any]]:
+    messages = []
+
+    while data:
+        header, _, rest = data.partition(b"\r\n\r\n")
+        length = int(header.split(b":")[1])
+        messages.append(json.loads(rest[:length]))
+        data = rest[length:]
+
+    return messages
+
+
+def _change(version: int, line: int, character: int, end: int, text: str) -> dict[str, Any]:
+    return {
+        "method": "textDocument/didChange",
+        "params": {
+            "textDocument": {"uri": URI, "version": version},
+            "contentChanges": [
+                {
+                    "range": {
+                        "start": {"line": line, "character": character},
+                        "end": {"line": line, "character": end},
+                    },
+                    "text": text,
+                },
+            ],
+        },
+    }
+
+
+class _Session:
+    def __init__(self, debounce: float = 0.0) -> None:
+        self.server = LanguageServer(debounce=debounce)
+        self.reader = asyncio.StreamReader()
+        self.output = io.BytesIO()
+        self.task = asyncio.create_task(self.server.serve(self.reader, self.output))
+
+    def send(self, message: dict[str, Any]) -> None:
+        self.reader.feed_data(encode_message(message))
+
+    def messages(self) -> list[dict[str, Any]]:
+        return _decode_all(self.output.getvalue())
+
+    async def diagnostics(self, version: int) -> list[dict[str, Any]]:
+        for _ in range(500):
+            for message in self.messages():
+                params = message.get("params", {})
+                if params.get("version") == version:
+                    return list(params["diagnostics"])
+            await asyncio.sleep(0.01)
+
+        raise AssertionError(f"No diagnostics were published for version {version}")
+
+    async def close(self) -> int:
+        self.send({"id": 99, "method": "shutdown"})
+        self.send({"method": "exit"})
+
+        return await self.task
+
+
+def test_read_message_round_trips() -> None:
+    async def read() -> dict[str, Any] | None:
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_message({"id": 1, "method": "shutdown"}))
+        reader.feed_eof()
+        return await read_message(reader)
+
+    assert asyncio.run(read()) == {"jsonrpc": "2.0", "id": 1, "method": "shutdown"}
+
+
+def test_publishes_and_clears_parser_errors() -> None:
+    async def session() -> None:
+        client = _Session()
+        client.send({"id": 1, "method": "initialize", "params": {"capabilities": {}}})
+        client.send(
+            {
+                "method": "textDocument/didOpen",
+                "params": {
+                    "textDocument": {
+                        "uri": URI,
+                        "version": 1,
+                        "text": "let a = 1;\nlet b = (a + 2;\n",
+                    },
+                },
+            },
+        )
+
+        diagnostics = await client.diagnostics(1)
+        assert diagnostics == [
+            {
+                "range": {
+                    "start": {"line": 1, "character": 14},
+                    "end": {"line": 1, "character": 15},
+                },
+                "severity": 1,
+                "source": "vdsh",
+                "message": "Unclosed paren (expected ')')",
+            },
+        ]
+
+        client.send(_change(2, 1, 14, 14, ")"))
+        assert await client.diagnostics(2) == []
+
+        client.send(_change(3, 0, 8, 9, "f(1)"))
+        assert [diagnostic["message"] for diagnostic in await client.diagnostics(3)] == [
+            "Undefined function (function name 'f')",
+        ]
+
+        assert await client.close() == 0
+        assert client.messages()[0]["result"]["capabilities"]["textDocumentSync"]["change"] == 2
+        assert client.messages()[-1] == {"jsonrpc": "2.0", "id": 99, "result": None}
+
+    asyncio.run(session())
+
+
+def test_debounces_edits_and_keeps_the_cache_in_sync() -> None:
+    async def session() -> None:
+        client = _Session(debounce=0.05)
+        client.send(
+            {
+                "method": "textDocument/didOpen",
+                "params": {"textDocument": {"uri": URI, "version": 1, "text": "let a = 1;\n"}},
+            },
+        )
+        await client.diagnostics(1)
+
+        for version, column, text in [(2, 0, "let b"), (3, 5, " = "), (4, 8, "a"), (5, 9, ";")]:
+            client.send(_change(version, 1, column, column, text))
+
+        assert await client.diagnostics(5) == []
+        published = [message["params"]["version"] for message in client.messages()]
+        assert published == [1, 5]
+
+        document = client.server.documents[URI]
+        assert document.parsed is not None
+        assert document.parsed.source == document.text == "let a = 1;\nlet b = a;"
+        assert not document.pending
+
+        assert await client.close() == 0
+
+    asyncio.run(session())
+
+
+def test_rejects_unknown_requests_and_exits_without_shutdown() -> None:
+    async def session() -> None:
+        client = _Session()
+        client.send({"id": 1, "method": "textDocument/hover", "params": {}})
+        client.send({"method": "exit"})
+
+        assert await client.task == 1
+        assert client.messages()[0]["error"]["code"] == -32601
+
+    asyncio.run(session())
+
+
+def test_diagnostic_ranges_are_zero_based_and_exclusive() -> None:
+    diagnostic = Diagnostic(
+        message="Unexpected token",
+        start=Position(row=3, column=5),
+        end=Position(row=3, column=7),
+    )
+
+    assert to_lsp_diagnostic(diagnostic)["range"] == {
+        "start": {"line": 2, "character": 4},
+        "end": {"line": 2, "character": 7},
+    }
@@ -0,0 +1,40 @@
+import io
+import json
+from collections.abc import Iterator
+
+import pytest
+
+from vdsh.cli import output
+from vdsh.cli.output import write_json_lines
+from vdsh.core.errors import TokenizerError
+from vdsh.core.models.position import Position
+from vdsh.core.models.token import BaseToken, IdentifierToken
+
+
+def _tokens(count: int) -> list[BaseToken]:
+    return [
+        IdentifierToken(start=Position(1, index), end=Position(1, index), name=f"x{index}")
+        for index in range(count)
+    ]
+
+
+def test_writes_one_object_per_line(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(output, "OUTPUT_BUFFER_SIZE", 100)
+    file = io.StringIO()
+
+    write_json_lines(_tokens(50), file)
+    lines = file.getvalue().splitlines()
+
+    assert [json.loads(line)["name"] for line in lines] == [f"x{index}" for index in range(50)]
+
+
+def test_flushes_values_read_before_an_error() -> None:
+    def failing() -> Iterator[BaseToken]:
+        yield from _tokens(3)
+        raise TokenizerError
+
+    file = io.StringIO()
+    with pytest.raises(TokenizerError):
+        write_json_lines(failing(), file)
+
+    assert len(file.getvalue().splitlines()) == 3
@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from vdsh.cli.app import app
+
+
+@pytest.mark.parametrize("output_format", ["json", "jsonl"])
+def test_reports_tokenizer_errors(output_format: str) -> None:
+    result = CliRunner().invoke(
+        app,
+        ["parse", "--code", "--format", output_format, 'let a = "abc;'],
+    )
+
+    assert result.exit_code == 1
+    assert "Unterminated string" in result.stderr
+    assert result.stdout == ""
+
+
+def test_writes_statements_as_json_lines() -> None:
+    result = CliRunner().invoke(app, ["parse", "--code", "--format", "jsonl", "let a = 1; a;"])
+
+    assert result.exit_code == 0
+    assert len([json.loads(line) for line in result.stdout.splitlines()]) == 2
+
+
+def test_rejects_emit_ast_with_format(tmp_path: Path) -> None:
+    cache = tmp_path / "ast.bin"
+    arguments = ["parse", "--code", "--emit-ast", str(cache), "--format", "json", "let a = 1;"]
+
+    result = CliRunner().invoke(app, arguments)
+
+    assert result.exit_code == 2
+    assert "--emit-ast" in result.stderr
+    assert not cache.exists()
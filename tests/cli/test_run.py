@@ -0,0 +1,41 @@
+import shutil
+
+import pytest
+from typer.testing import CliRunner
+
+from vdsh.cli.app import app
+from vdsh.cli.commands import run
+from vdsh.core.models.bytecode import BytecodeProgram
+from vdsh.core.pipeline.interpreter import Value
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not installed")
+@pytest.mark.parametrize(("arguments", "interpreted"), [([], False), (["--interpret"], True)])
+def test_runs_the_vm_only_when_asked_to(
+    arguments: list[str],
+    interpreted: bool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    programs: list[BytecodeProgram] = []
+
+    def transform(_: object, program: BytecodeProgram) -> dict[str, Value]:
+        programs.append(program)
+        return {}
+
+    monkeypatch.setattr(run.VirtualMachine, "transform", transform)
+    result = CliRunner().invoke(app, ["run", "--code", *arguments, "let x = 1;"])
+
+    assert result.exit_code == 0
+    assert bool(programs) == interpreted
+
+
+@pytest.mark.parametrize("target", ["bash", "sh"])
+def test_annotates_shell_errors(target: str) -> None:
+    if shutil.which(target) is None:
+        pytest.skip(f"{target} is not installed")
+
+    code = "let a = 0;\nlet x = 1 / a;"
+    result = CliRunner().invoke(app, ["run", "--code", "--target", target, code])
+
+    assert result.exit_code == 0
+    assert result.stderr.rstrip().endswith("(at <code>:2:1)")
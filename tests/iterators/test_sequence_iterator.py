@@ -60,3 +60,11 @@ def test_single_character_invariant() -> None:
         ch = it.next()
         assert isinstance(ch, str)
         assert len(ch) == 1
+
+
+def test_starts_at_an_offset() -> None:
+    it = SequenceIterator("abc", start=1)
+
+    assert it.offset == 1
+    assert it.next() == "b"
+    assert it.offset == 2
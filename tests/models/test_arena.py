@@ -0,0 +1,65 @@
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.arena import ASTArena
+from vdsh.core.models.ast import (
+    BaseASTNode,
+    BinaryOperationNode,
+    FuncStatementNode,
+    IdentifierNode,
+    ProgramNode,
+)
+from vdsh.core.models.token import Operator
+from vdsh.core.pipeline import Parser, Tokenizer
+
+CODE = """
+func add(a: int, b: int) {
+    let c = a + b * 2.5;
+    report(c, -a, !b);
+}
+
+let x = (1 + 2) ** 3 % 4;
+add(x, x >= 10 && x != 3 || x < 1);
+"""
+
+
+def test_round_trip() -> None:
+    ast = _parse(CODE)
+
+    assert ASTArena.from_ast(ast).to_ast() == ast
+
+
+def test_children_are_stored_before_parents() -> None:
+    arena = ASTArena.from_ast(_parse(CODE))
+
+    for node_id in range(len(arena)):
+        assert arena.lefts[node_id] < node_id
+        assert arena.rights[node_id] < node_id
+
+    assert arena.kind(arena.root) is ProgramNode
+
+
+def test_operator_column() -> None:
+    arena = ASTArena.from_ast(_parse("let x = a + b * c;"))
+    operators = [arena.operator(node_id) for node_id in arena.ids_of_kind(BinaryOperationNode)]
+
+    assert operators == [Operator.STAR, Operator.PLUS]
+
+
+def test_single_node_conversion() -> None:
+    ast = _parse(CODE)
+    arena = ASTArena.from_ast(ast)
+
+    assert isinstance(ast, ProgramNode)
+    assert [arena.node(node_id) for node_id in arena.ids_of_kind(FuncStatementNode)] == [
+        ast.statements[0],
+    ]
+    assert len(list(arena.ids_of_kind(IdentifierNode))) == 9
+
+
+def test_identifier_values_are_interned() -> None:
+    arena = ASTArena.from_ast(_parse("let x = x + x * x;"))
+
+    assert arena.values.count("x") == 1
+
+
+def _parse(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
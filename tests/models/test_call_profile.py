@@ -0,0 +1,27 @@
+import pytest
+
+from vdsh.core.errors import InvalidProfileError
+from vdsh.core.models.call_profile import CallProfile
+
+
+def test_json_round_trip() -> None:
+    profile = CallProfile({"step": 2000, "report": 1})
+
+    assert CallProfile.from_json(profile.to_json()) == profile
+
+
+def test_hot_functions_take_a_share_of_all_calls() -> None:
+    profile = CallProfile({"step": 2000, "report": 1})
+
+    assert profile.is_hot("step")
+    assert not profile.is_hot("report")
+    assert not profile.is_hot("missing")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [[], {"version": 0, "calls": {}}, {"version": 1, "calls": {"f": "many"}}],
+)
+def test_rejects_malformed_profiles(data: object) -> None:
+    with pytest.raises(InvalidProfileError):
+        CallProfile.from_json(data)
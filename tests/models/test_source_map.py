@@ -0,0 +1,42 @@
+from vdsh.cli.source_map import annotate_errors
+from vdsh.core.models.position import Position
+from vdsh.core.models.source_map import SourceMap, SourceMapping
+
+OUTER = SourceMapping(1, 5, Position(1, 1), Position(3, 1))
+INNER = SourceMapping(2, 3, Position(2, 5), Position(2, 20))
+
+
+def test_lookup_returns_innermost_mapping() -> None:
+    source_map = SourceMap([OUTER, INNER])
+
+    assert source_map.lookup(1) == OUTER
+    assert source_map.lookup(3) == INNER
+    assert source_map.lookup(6) is None
+
+
+def test_json_round_trip() -> None:
+    source_map = SourceMap([OUTER, INNER])
+
+    assert SourceMap.from_json(source_map.to_json()) == source_map
+
+
+def test_shifted_moves_generated_lines_only() -> None:
+    shifted = SourceMap([INNER]).shifted(10)
+
+    assert shifted.mappings == [SourceMapping(12, 13, INNER.start, INNER.end)]
+
+
+def test_annotate_errors() -> None:
+    stderr = "bash: line 3: x: unbound variable\nplain output\n"
+
+    assert annotate_errors(stderr, SourceMap([OUTER, INNER]), "main.vdsh") == (
+        "bash: line 3: x: unbound variable (at main.vdsh:2:5)\nplain output\n"
+    )
+
+
+def test_annotate_errors_of_posix_shells() -> None:
+    stderr = "sh: 3: x: parameter not set\nsh: 9: y: not found\n"
+
+    assert annotate_errors(stderr, SourceMap([OUTER, INNER]), "main.vdsh") == (
+        "sh: 3: x: parameter not set (at main.vdsh:2:5)\nsh: 9: y: not found\n"
+    )
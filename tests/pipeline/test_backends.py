@@ -0,0 +1,58 @@
+import shutil
+import subprocess
+
+import pytest
+
+from vdsh.core.errors import UnsupportedOperatorError
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.pipeline import Optimizer, Parser, Tokenizer
+from vdsh.core.pipeline.backends import Target, create_code_generator
+
+PROGRAM = """
+func sum(n: int, acc: int) {
+    if n == 0 { return acc; }
+    return sum(n - 1, acc + n);
+}
+func fib(n: int) {
+    if n < 2 { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+let x = sum(100, 0);
+for (let i = 0; i < 10; i = i + 1) { x = x + i; }
+while x > 5000 { x = x - 1; }
+x = x + fib(10);
+"""
+BASHISMS = ["function ", "((", "declare", "[[", "printf -v"]
+
+
+@pytest.mark.parametrize("target", list(Target), ids=lambda target: target.value)
+def test_targets_agree(target: Target) -> None:
+    if shutil.which(target.value) is None:
+        pytest.skip(f"{target.value} is not installed")
+
+    result = subprocess.run(
+        [target.value],
+        input=_generate(PROGRAM, target) + '\necho "$__VDSH__x"',
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "5055"
+
+
+def test_sh_target_avoids_bashisms() -> None:
+    script = _generate(PROGRAM, Target.SH).replace("$((", "")
+
+    assert not [bashism for bashism in BASHISMS if bashism in script]
+
+
+def test_sh_target_rejects_power() -> None:
+    with pytest.raises(UnsupportedOperatorError):
+        _generate("let x = 2 ** 3;", Target.SH)
+
+
+def _generate(code: str, target: Target) -> str:
+    ast = Optimizer().transform(Parser(Tokenizer(SequenceIterator(code))).create())
+
+    return create_code_generator(target).transform(ast)
@@ -0,0 +1,131 @@
+import shutil
+import subprocess
+
+import pytest
+
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.pipeline import CodeGenerator, Parser, Tokenizer
+from vdsh.core.pipeline.code_generator import CallingConvention
+from vdsh.core.pipeline.interpreter import Interpreter
+from vdsh.core.pipeline.passes import Inliner
+
+PROGRAM = """
+func add(a: int, b: int) { return a + b; }
+func twice(a: int) { let b = add(a, a); return add(b, 0); }
+let x = twice(add(1, 2)) + add(3, 4);
+"""
+
+requires_bash = pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not installed")
+
+
+def test_register_convention_does_not_fork() -> None:
+    assert "$(" not in _generate(PROGRAM, CallingConvention.REGISTER).replace("$((", "")
+
+
+@requires_bash
+@pytest.mark.parametrize("convention", list(CallingConvention), ids=lambda item: item.value)
+def test_return_values(convention: CallingConvention) -> None:
+    assert _run(_generate(PROGRAM, convention) + '\necho "$__VDSH__x"') == "13"
+
+
+@requires_bash
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        ("let x = 0; for (let i = 0; i < 5; i = i + 1) { x = x + i; }", "10"),
+        ("let x = 1; while x < 100 { x = x * 3; }", "243"),
+        ("let x = 0; for (let i = 0; i < 3; i = i + 1) { }", "0"),
+        ("func f(a: int) { return a + 1; } let x = 0; while x < f(4) { x = f(x); }", "5"),
+        ("func f(a: int) { return a + 2; } let x = 0; for (x = 0; x < 9; x = f(x)) { }", "10"),
+    ],
+)
+def test_loops(code: str, expected: str) -> None:
+    assert _run(_generate(code, CallingConvention.REGISTER) + '\necho "$__VDSH__x"') == expected
+
+
+@requires_bash
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        ("let x = 5; if x > 3 { x = 1; } else { x = 2; }", "1"),
+        ("let x = 2; if x > 3 { x = 1; } else if x == 2 { x = 7; }", "7"),
+    ],
+)
+def test_if_statements(code: str, expected: str) -> None:
+    assert _run(_generate(code, CallingConvention.REGISTER) + '\necho "$__VDSH__x"') == expected
+
+
+@requires_bash
+@pytest.mark.parametrize("convention", list(CallingConvention), ids=lambda item: item.value)
+@pytest.mark.parametrize(
+    "condition",
+    [
+        "a != 0 && inverse(a) > 1",
+        "a == 0 || inverse(a) > 1",
+        "a > 0 || a == 0 && inverse(a + 1) > 1",
+        "a > 1 && a < 5 || a == 0 && inverse(a + 1) > 5",
+    ],
+)
+def test_calls_on_the_right_of_logical_operators_short_circuit(
+    convention: CallingConvention,
+    condition: str,
+) -> None:
+    # `inverse(0)` divides by zero, so bash reports an error if it is ever called
+    code = f"""
+    func inverse(a: int) {{ count = count + 1; return 10 / a; }}
+    let count = 0;
+    let a = 0;
+    let x = {condition};
+    if {condition} {{ x = x + 10; }}
+    while {condition} {{ x = x + 100; a = a - 1; }}
+    """
+    variables = Interpreter().transform(_parse(code))
+    script = _generate(code, convention) + '\necho "$__VDSH__x $__VDSH__count"'
+    result = subprocess.run(["bash"], input=script, capture_output=True, text=True, timeout=10)
+    x, count = result.stdout.split()
+
+    assert result.stderr == ""
+    assert x == str(variables["x"])
+    if convention == CallingConvention.REGISTER:
+        assert count == str(variables["count"])
+
+
+@requires_bash
+def test_unsets_bindings_of_inlined_calls() -> None:
+    code = "func bump(x: int) { let y = x + 1; total = total + y; } let total = 0; bump(1);"
+    script = CodeGenerator().transform(Inliner().transform(_parse(code)))
+
+    assert _run(script + '\necho "$__VDSH__total ${__VDSH__bump_1_y-unset}"') == "2 unset"
+
+
+def test_loop_conditions_use_arithmetic_context() -> None:
+    script = _generate("let x = 0; while x < 3 { x = x + 1; }", CallingConvention.REGISTER)
+
+    assert "while ((__VDSH__x<3)); do" in script
+
+
+def test_source_map_points_at_statements() -> None:
+    generator = CodeGenerator()
+    script = generator.transform(_parse("let a = 1;\nfunc f(b: int) {\n    let c = b;\n}"))
+    lines = script.split("\n")
+    mapping = generator.source_map.lookup(lines.index("local __VDSH__c=$__VDSH__b") + 1)
+
+    assert "\0" not in script
+    assert mapping is not None
+    assert mapping.start.row == 3
+    assert mapping.start.column == 5
+
+
+def _parse(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
+
+
+def _generate(code: str, convention: CallingConvention) -> str:
+    return CodeGenerator(calling_convention=convention).transform(_parse(code))
+
+
+def _run(script: str) -> str:
+    result = subprocess.run(["bash"], input=script, capture_output=True, text=True, check=True)
+
+    return result.stdout.strip()
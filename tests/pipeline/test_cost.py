@@ -0,0 +1,86 @@
+import pytest
+
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.pipeline import CodeGenerator, Parser, Tokenizer
+from vdsh.core.pipeline.backends import PosixCodeGenerator
+from vdsh.core.pipeline.code_generator import CallingConvention
+from vdsh.core.pipeline.cost import CostReport, ShellCost
+from vdsh.core.pipeline.passes import Inliner, Memoizer
+
+PROGRAM = """func add(a: int, b: int) { return a + b; }
+let x = add(1, 2);
+x = x * 2;
+"""
+FIB = "func fib(n: int) { if n < 2 { return n; } return fib(n - 1) + fib(n - 2); }"
+
+
+def test_register_convention_does_not_fork() -> None:
+    report = _analyze(_parse(PROGRAM), CodeGenerator(CallingConvention.REGISTER))
+
+    assert report.total.forks == 0
+    assert report.total.arithmetic_expansions == 2
+
+
+def test_reports_costs_per_function_and_statement() -> None:
+    report = _analyze(_parse(PROGRAM), CodeGenerator(CallingConvention.SUBSHELL))
+    statements = {entry.label: entry for entry in report.statements}
+
+    assert report.total == ShellCost(forks=1, subshells=1, arithmetic_expansions=2)
+    assert [entry.label for entry in report.functions] == ["add"]
+    assert report.functions[0].cost == ShellCost(arithmetic_expansions=1)
+    assert statements["let x"].cost == ShellCost(forks=1, subshells=1)
+    assert statements["let x"].start.row == 2
+    assert statements["x ="].cost == ShellCost(arithmetic_expansions=1)
+
+
+def test_counts_calls_nested_in_arithmetic() -> None:
+    report = _analyze(_parse(FIB), CodeGenerator(CallingConvention.SUBSHELL))
+
+    assert report.functions[0].cost == ShellCost(forks=2, subshells=2, arithmetic_expansions=4)
+
+
+@pytest.mark.parametrize(
+    ("generator", "expected"),
+    [
+        (CodeGenerator(), ShellCost(arithmetic_expansions=1)),
+        (PosixCodeGenerator(), ShellCost(arithmetic_expansions=2)),
+    ],
+)
+def test_counts_the_loops_of_each_target(generator: CodeGenerator, expected: ShellCost) -> None:
+    report = _analyze(_parse("for (let i = 0; i < 3; i = i + 1) { }"), generator)
+
+    assert report.total == expected
+
+
+def test_counts_memo_cache_eviction() -> None:
+    program = Memoizer().transform(_parse(FIB))
+
+    bounded = _analyze(program, CodeGenerator())
+    unbounded = _analyze(program, CodeGenerator(memo_max_entries=None))
+
+    assert bounded.functions[0].cost - unbounded.functions[0].cost == ShellCost(
+        arithmetic_expansions=1,
+    )
+
+
+def test_charges_inlined_copies_to_one_statement() -> None:
+    code = "func show(a: int) { let b = a * 2; }\nshow(1);\nshow(2);"
+    program = Inliner().transform(_parse(code))
+
+    report = _analyze(program, CodeGenerator())
+    body = [entry for entry in report.statements if entry.label == "let b"]
+
+    assert len(body) == 1
+    assert body[0].cost == ShellCost(arithmetic_expansions=3)
+    assert report.total == ShellCost(arithmetic_expansions=3)
+
+
+def _parse(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
+
+
+def _analyze(program: BaseASTNode, generator: CodeGenerator) -> CostReport:
+    generator.transform(program)
+
+    return generator.cost_report
@@ -0,0 +1,167 @@
+import random
+from collections.abc import Callable
+
+import pytest
+
+from vdsh.core.errors import ParserError, TypeCheckerError
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.token import EOFToken
+from vdsh.core.pipeline import Parser, Tokenizer, TypeChecker
+from vdsh.core.pipeline.incremental import (
+    IncrementalTypeChecker,
+    TextEdit,
+    combine_edits,
+    parse_source,
+    reparse,
+)
+
+CODE = """let a = 1;
+x
+(y)
+f(1, 2)
+let b = a + 2; b = b * 3
+  -a
+if a < b { let c = 1; } else { c = 2; }
+while a { a = a - 1; }
+func g(p: int) { return p; }
+q"""
+
+
+def _edit(code: str, old: str, new: str) -> TextEdit:
+    start = code.index(old)
+
+    return TextEdit(start=start, end=start + len(old), text=new)
+
+
+def test_parse_source_matches_parser() -> None:
+    parsed = parse_source(CODE)
+
+    assert parsed.tree == Parser(Tokenizer(SequenceIterator(CODE))).create()
+    assert len(parsed.boundaries) == len(parsed.tree.statements) + 1
+    assert parsed.boundaries[:4] == [0, 5, 9, 15]
+    assert isinstance(parsed.tokens[parsed.boundaries[-1]], EOFToken)
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ("a + 2", "a + 20"),
+        ("a + 2", "a"),
+        ("x\n", "x;\n"),
+        ("x\n", "x\n\n\n"),
+        ("\n(y)", "(y)"),
+        ("\n  -a", "\n  +a"),
+        ("\n  -a", " -a"),
+        ("c = 2;", "c = 2; let d = 3;"),
+        ("{ return p; }", "{\n    return p;\n}"),
+        ("q", "q + 1"),
+        ("let a = 1;\n", ""),
+        (CODE, "let z = 0;"),
+    ],
+)
+def test_reparse_matches_parsing_from_scratch(old: str, new: str) -> None:
+    edit = _edit(CODE, old, new)
+    source = CODE[: edit.start] + new + CODE[edit.end :]
+
+    assert reparse(parse_source(CODE), edit) == parse_source(source)
+
+
+def test_reparse_matches_parsing_from_scratch_after_random_edits() -> None:
+    generator = random.Random(0)
+    fragments = ["", "1", "x", ";", "\n", " ", "+", "-", "(", ")", "ab", "=", "let z = 0;\n"]
+    parsed = parse_source(CODE)
+    edits = 0
+
+    while edits < 300:
+        start = generator.randrange(len(parsed.source) + 1)
+        end = min(len(parsed.source), start + generator.choice([0, 1, 2, 4]))
+        text = generator.choice(fragments)
+        source = parsed.source[:start] + text + parsed.source[end:]
+
+        try:
+            expected = parse_source(source)
+        except ParserError:
+            parsed = parse_source(CODE)
+            continue
+
+        parsed = reparse(parsed, TextEdit(start=start, end=end, text=text))
+        assert parsed == expected
+        edits += 1
+
+
+def test_reparse_reuses_untouched_statements() -> None:
+    previous = parse_source(CODE)
+    parsed = reparse(previous, _edit(CODE, "a + 2", "a + 3"))
+    old_statements = previous.tree.statements
+    statements = parsed.tree.statements
+
+    # `x (y)` is a call and `b = b * 3 - a` spans two lines, so the edit is in statement 3
+    assert all(new is old for new, old in zip(statements[:3], old_statements[:3], strict=True))
+    assert statements[3] != old_statements[3]
+    assert statements[4] == old_statements[4]
+    assert all(new is old for new, old in zip(statements[5:], old_statements[5:], strict=True))
+
+
+def test_reparse_moves_statements_after_added_lines() -> None:
+    previous = parse_source(CODE)
+    parsed = reparse(previous, _edit(CODE, "x\n", "x\n\n"))
+    last = parsed.tree.statements[-1]
+
+    assert last == parse_source(parsed.source).tree.statements[-1]
+    assert last.identifier.start.row == 11  # type: ignore[attr-defined]
+
+
+def test_reparse_raises_parser_errors() -> None:
+    with pytest.raises(ParserError):
+        reparse(parse_source(CODE), _edit(CODE, "let b", "let"))
+
+
+def test_combine_edits() -> None:
+    generator = random.Random(1)
+
+    for _ in range(200):
+        source = text = "".join(generator.choice("ab\n") for _ in range(20))
+        edits = []
+        for _ in range(generator.randrange(1, 5)):
+            start = generator.randrange(len(text) + 1)
+            end = min(len(text), start + generator.randrange(4))
+            edits.append(TextEdit(start=start, end=end, text=generator.choice(["", "x", "yz"])))
+            text = text[:start] + edits[-1].text + text[end:]
+
+        edit = combine_edits(source, edits, text)
+
+        assert source[: edit.start] + edit.text + source[edit.end :] == text
+        assert edit.start >= min(item.start for item in edits)
+
+
+def _type_error(check: Callable[[], None]) -> str | None:
+    try:
+        check()
+    except TypeCheckerError as error:
+        return repr(error)
+
+    return None
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ("g(2)", "g(2, 3)"),
+        ("g(1)", "k(1)"),
+        ("func g(p: int)", "func g(p: int, r: int)"),
+        ("func g(p: int)", "func k(p: int)"),
+        ("\nh()", "\nreturn 1;"),
+        ("\nh()", "\nfunc g() { } h()"),
+        ("let a = g(1);", ""),
+    ],
+)
+def test_incremental_type_checker_matches_type_checker(old: str, new: str) -> None:
+    code = "func g(p: int) { return p; }\nlet a = g(1);\nfunc h() { let b = g(2); }\nh()"
+    checker = IncrementalTypeChecker()
+    previous = parse_source(code)
+    checker.validate(previous.tree)
+
+    parsed = reparse(previous, _edit(code, old, new))
+    expected = _type_error(lambda: TypeChecker().validate(parsed.tree))
+
+    assert _type_error(lambda: checker.validate(parsed.tree)) == expected
@@ -0,0 +1,125 @@
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import (
+    BaseASTNode,
+    CallNode,
+    FuncStatementNode,
+    IdentifierNode,
+    LetStatementNode,
+    ProgramNode,
+    UnsetStatementNode,
+)
+from vdsh.core.models.call_profile import CallProfile
+from vdsh.core.models.position import Position
+from vdsh.core.pipeline import Parser, Tokenizer
+from vdsh.core.pipeline.passes import Inliner
+from vdsh.core.pipeline.passes.tree import node_span, walk
+
+
+def test_inlines_small_function() -> None:
+    program = _inline("func f(a: int) { let b = a + 1; } let a = 2; f(a);")
+
+    assert isinstance(program, ProgramNode)
+    assert isinstance(program.statements[0], FuncStatementNode)
+    assert not any(isinstance(statement, CallNode) for statement in program.statements)
+    assert [_assigned_name(statement) for statement in program.statements[1:-1]] == [
+        "a",
+        "f_1_a",
+        "f_1_b",
+    ]
+
+
+def test_bindings_span_the_call_arguments() -> None:
+    program = _inline("func f(a: int, b: int) { let c = a + b; }\nf(1, 2 + 3);")
+
+    assert isinstance(program, ProgramNode)
+    assert [node_span(statement) for statement in program.statements[1:3]] == [
+        (Position(row=2, column=3), Position(row=2, column=3)),
+        (Position(row=2, column=6), Position(row=2, column=10)),
+    ]
+
+
+def test_unsets_renamed_bindings_after_top_level_calls() -> None:
+    program = _inline("func f(a: int) { let b = a + 1; } f(1);")
+
+    assert isinstance(program, ProgramNode)
+    unset = program.statements[-1]
+    assert isinstance(unset, UnsetStatementNode)
+    assert [identifier.name for identifier in unset.identifiers] == ["f_1_a", "f_1_b"]
+
+
+def test_does_not_unset_bindings_inlined_into_functions() -> None:
+    program = _inline("func f(a: int) { let b = a; } func g(a: int) { f(a); } g(1);")
+
+    assert isinstance(program, ProgramNode)
+    function = program.statements[1]
+    assert isinstance(function, FuncStatementNode)
+    assert not any(isinstance(node, UnsetStatementNode) for node in walk(function))
+    assert [
+        [identifier.name for identifier in statement.identifiers]
+        for statement in program.statements
+        if isinstance(statement, UnsetStatementNode)
+    ] == [["f_3_a", "f_3_b"], ["g_2_a"]]
+
+
+def test_renamed_locals_do_not_capture_call_site_variables() -> None:
+    program = _inline("func f(a: int) { let b = a; } let a = 2; f(a);")
+
+    assert isinstance(program, ProgramNode)
+    binding = program.statements[2]
+    assert isinstance(binding, LetStatementNode)
+    assert isinstance(binding.assignment.value, IdentifierNode)
+    assert binding.assignment.value.identifier.name == "a"
+
+
+def test_does_not_inline_recursive_functions() -> None:
+    program = _inline("func f(a: int) { g(a); } func g(a: int) { f(a); } f(1);")
+
+    assert isinstance(program, ProgramNode)
+    assert isinstance(program.statements[-1], CallNode)
+
+
+def test_respects_size_threshold() -> None:
+    program = _inline("func f(a: int) { let b = a + 1; } f(1);", max_size=2)
+
+    assert isinstance(program, ProgramNode)
+    assert isinstance(program.statements[-1], CallNode)
+
+
+def test_inlines_nested_calls_inside_functions() -> None:
+    program = _inline("func f(a: int) { let b = a; } func g(a: int) { f(a); } g(1);")
+
+    assert not any(isinstance(node, CallNode) for node in walk(program))
+
+
+def test_profile_inlines_hot_functions_only() -> None:
+    code = "func hot(a: int) { let b = a + 1; } func cold(a: int) { let c = a; } hot(1); cold(2);"
+    program = _inline(code, max_size=2, profile=CallProfile({"hot": 500, "cold": 1}))
+
+    assert isinstance(program, ProgramNode)
+    assert [_describe(statement) for statement in program.statements[2:]] == [
+        "hot_1_a",
+        "hot_1_b",
+        "unset hot_1_a hot_1_b",
+        "cold()",
+    ]
+
+
+def _describe(node: BaseASTNode) -> str:
+    if isinstance(node, CallNode):
+        return f"{node.identifier.name}()"
+
+    if isinstance(node, UnsetStatementNode):
+        return "unset " + " ".join(identifier.name for identifier in node.identifiers)
+
+    return _assigned_name(node)
+
+
+def _assigned_name(node: BaseASTNode) -> str:
+    assert isinstance(node, LetStatementNode)
+    return node.assignment.identifier.name
+
+
+def _inline(code: str, max_size: int = 32, profile: CallProfile | None = None) -> BaseASTNode:
+    parser = Parser(Tokenizer(SequenceIterator(code)))
+
+    return Inliner(max_size=max_size, profile=profile).transform(parser.create())
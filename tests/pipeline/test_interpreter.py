@@ -0,0 +1,81 @@
+import shutil
+import subprocess
+
+import pytest
+
+from vdsh.core.errors import ArithmeticEvaluationError, RecursionLimitError
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.pipeline import CodeGenerator, Parser, Tokenizer
+from vdsh.core.pipeline.interpreter import Interpreter
+from vdsh.core.pipeline.passes import Memoizer
+
+PROGRAM = """
+func fib(n: int) {
+    if n < 2 { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+func add(a: int, b: int) { return a + b; }
+let x = 0;
+for (let i = 0; i < 10; i = i + 1) { x = add(x, fib(i)); }
+let y = x / 7 - x % 7 * 3;
+"""
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        ("let x = -7 / 2;", -3),
+        ("let x = -7 % 2;", -1),
+        ("let x = 4611686018427387904 * 2;", -9223372036854775808),
+        ("let x = 2 ** 10;", 1024),
+        ("let x = 1 < 2 && 3 > 4;", 0),
+        ("let x = 1; while x < 100 { x = x * 3; }", 243),
+        ("let x = 2; if x > 3 { x = 1; } else if x == 2 { x = 7; }", 7),
+    ],
+)
+def test_arithmetic_and_control_flow(code: str, expected: int) -> None:
+    assert Interpreter().transform(_parse(code))["x"] == expected
+
+
+def test_functions_share_the_return_register() -> None:
+    variables = Interpreter().transform(_parse(PROGRAM))
+
+    assert variables["x"] == 88
+    assert "n" not in variables
+
+
+def test_locals_are_dynamically_scoped() -> None:
+    code = "let y = 0; func g(a: int) { y = a; } func f(y: int) { g(y + 1); } f(1); g(5);"
+
+    assert Interpreter().transform(_parse(code))["y"] == 5
+
+
+def test_memoized_functions() -> None:
+    program = Memoizer().transform(_parse(PROGRAM))
+
+    assert Interpreter().transform(program)["x"] == 88
+
+
+def test_division_by_zero() -> None:
+    with pytest.raises(ArithmeticEvaluationError):
+        Interpreter().transform(_parse("let a = 0; let x = 1 / a;"))
+
+
+def test_runaway_recursion() -> None:
+    with pytest.raises(RecursionLimitError):
+        Interpreter().transform(_parse("func f(n: int) { return f(n + 1); } let x = f(0);"))
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not installed")
+def test_matches_bash() -> None:
+    program = _parse(PROGRAM)
+    script = CodeGenerator().transform(program) + '\necho "$__VDSH__x $__VDSH__y"'
+    result = subprocess.run(["bash"], input=script, capture_output=True, text=True, check=True)
+    variables = Interpreter().transform(program)
+
+    assert result.stdout.strip() == f"{variables['x']} {variables['y']}"
+
+
+def _parse(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
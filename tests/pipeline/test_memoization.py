@@ -0,0 +1,79 @@
+import shutil
+import subprocess
+
+import pytest
+
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import MemoizedFuncStatementNode, ProgramNode
+from vdsh.core.pipeline import CodeGenerator, Parser, Tokenizer
+from vdsh.core.pipeline.passes import Memoizer, find_pure_functions
+
+FIB = """
+func fib(n: int) {
+    if n < 2 { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+"""
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        ("func f(a: int) { let b = a * 2; return b; }", {"f"}),
+        ("let g = 1; func f(a: int) { return a + g; }", set()),
+        ("let g = 1; func f(a: int) { g = a; }", set()),
+        ("func f(a: int) { func h() { } }", set()),
+        ("let g = 1; func h() { return g; } func f(a: int) { return h(); }", set()),
+        (FIB, {"fib"}),
+    ],
+)
+def test_find_pure_functions(code: str, expected: set[str]) -> None:
+    assert find_pure_functions(_parse(code)) == expected
+
+
+def test_memoizes_only_expensive_pure_functions() -> None:
+    program = Memoizer().transform(_parse(FIB + "func double(a: int) { return a * 2; }"))
+
+    assert isinstance(program, ProgramNode)
+    assert isinstance(program.statements[0], MemoizedFuncStatementNode)
+    assert not isinstance(program.statements[1], MemoizedFuncStatementNode)
+
+
+@pytest.mark.parametrize(
+    ("code", "memoized"),
+    [
+        ("func f(n: int) { if n > 1 { return f(n - 1); } }", False),
+        ("func f(n: int) { if n > 1 { return; } return f(n - 1); }", False),
+        ("func f(n: int) { while n > 1 { return f(n - 1); } }", False),
+        ("func f(n: int) { if n > 1 { return f(n - 1); } else { return n; } }", True),
+    ],
+)
+def test_memoizes_only_functions_that_always_return_a_value(code: str, memoized: bool) -> None:
+    program = Memoizer().transform(_parse(code))
+
+    assert isinstance(program, ProgramNode)
+    assert isinstance(program.statements[0], MemoizedFuncStatementNode) == memoized
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not installed")
+@pytest.mark.parametrize("max_entries", [None, 4])
+def test_memoized_functions_return_cached_results(max_entries: int | None) -> None:
+    program = Memoizer().transform(_parse(FIB + "let x = fib(40);"))
+    script = CodeGenerator(memo_max_entries=max_entries).transform(program)
+    result = subprocess.run(
+        ["bash"],
+        input=script + '\necho "$__VDSH__x"',
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=30,
+    )
+
+    assert result.stdout.strip() == "102334155"
+
+
+def _parse(code: str) -> ProgramNode:
+    program = Parser(Tokenizer(SequenceIterator(code))).create()
+    assert isinstance(program, ProgramNode)
+
+    return program
@@ -0,0 +1,30 @@
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import BaseASTNode, FuncStatementNode, ProgramNode
+from vdsh.core.models.call_profile import CallProfile
+from vdsh.core.pipeline import Parser, Tokenizer
+from vdsh.core.pipeline.passes import FunctionOrderer
+
+PROGRAM = "let x = 1; func cold(a: int) { } func hot(a: int) { } hot(x); cold(x);"
+
+
+def test_hoists_functions_hottest_first() -> None:
+    program = FunctionOrderer(CallProfile({"hot": 10, "cold": 1})).transform(_parse(PROGRAM))
+
+    assert isinstance(program, ProgramNode)
+    assert [_name(statement) for statement in program.statements[:2]] == ["hot", "cold"]
+    assert not isinstance(program.statements[2], FuncStatementNode)
+
+
+def test_keeps_programs_that_redefine_functions() -> None:
+    program = _parse("func f(a: int) { } f(1); func f(a: int) { } f(2);")
+
+    assert FunctionOrderer(CallProfile({"f": 2})).transform(program) is program
+
+
+def _name(node: BaseASTNode) -> str:
+    assert isinstance(node, FuncStatementNode)
+    return node.decelration.identifier.name
+
+
+def _parse(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
@@ -0,0 +1,80 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.programs import generate_program
+from vdsh.core.errors import TokenizerError, UnexpectedCharacterError, UnterminatedStringError
+from vdsh.core.pipeline.parallel_tokenizer import split_source, tokenize, tokenize_parallel
+from vdsh.core.pipeline.tokenizer import STRING_TERMINATOR
+
+STRINGS = 'let a = "one\ntwo";\nlet b = "\n\n";\nprint(a + b);\n'
+
+
+def _parallel(source: str, chunk_size: int) -> list[object]:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return list(tokenize_parallel(source, jobs=4, executor=executor, min_chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 17, 100])
+def test_matches_the_serial_tokenizer(chunk_size: int) -> None:
+    source = generate_program(20) + STRINGS * 10
+
+    assert _parallel(source, chunk_size) == tokenize(source)
+
+
+def test_splits_only_outside_of_strings() -> None:
+    source = STRINGS * 20
+
+    starts = split_source(source, chunks=100, min_chunk_size=1)
+
+    assert len(starts) > 1
+    for start in starts:
+        assert source[start - 1] == "\n" or start == 0
+        assert source.count(STRING_TERMINATOR, 0, start) % 2 == 0
+
+
+def test_random_sources_match() -> None:
+    rng = random.Random(7)
+    pieces = ["let", "x", " ", "\n", "1", "2.5", '"', "+", ";", "(", ")", "\t"]
+
+    for _ in range(200):
+        source = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 60)))
+        try:
+            expected: object = tokenize(source)
+        except TokenizerError as error:
+            expected = error
+
+        try:
+            actual: object = _parallel(source, rng.randint(1, 10))
+        except TokenizerError as error:
+            actual = error
+
+        assert actual == expected, source
+
+
+@pytest.mark.parametrize(
+    ("source", "error"),
+    [
+        ("let a = 1;\nlet b = 2;\nlet c = @;\n", UnexpectedCharacterError),
+        ('let a = 1;\nlet b = 2;\nlet c = "x;\nlet d = 3;\n', UnterminatedStringError),
+        ('let a = $;\nlet b = 2;\nlet c = "x;\n', UnexpectedCharacterError),
+    ],
+)
+def test_raises_the_first_error_like_the_serial_tokenizer(
+    source: str,
+    error: type[TokenizerError],
+) -> None:
+    with pytest.raises(error) as serial:
+        tokenize(source)
+
+    with pytest.raises(error) as parallel:
+        _parallel(source, 1)
+
+    assert parallel.value == serial.value
+
+
+def test_runs_on_a_process_pool() -> None:
+    source = STRINGS * 50
+
+    assert tokenize_parallel(source, jobs=2, min_chunk_size=len(source) // 3) == tokenize(source)
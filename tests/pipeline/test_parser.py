@@ -3,25 +3,46 @@ from dataclasses import dataclass
 
 import pytest
 
-from vdsh.core.errors import UnclosedParenError, UnexpectedTokenError
+from vdsh.core.errors import (
+    BlockMissingClosingBraceError,
+    MissingLeftParenInForError,
+    MissingRightParenInCallError,
+    UnclosedParenError,
+    UnexpectedTokenError,
+)
 from vdsh.core.iterator.sequence_iterator import SequenceIterator
 from vdsh.core.models.ast import (
+    ArgumentNode,
+    ArgumentsNode,
+    AssignmentNode,
     BaseASTNode,
     BinaryOperationNode,
+    BlockNode,
+    CallNode,
+    ForStatementNode,
+    FuncDeclerationNode,
+    FuncStatementNode,
     IdentifierNode,
+    IfStatementNode,
+    LetStatementNode,
     NumberLiteralNode,
+    ProgramNode,
+    ReturnStatementNode,
     UnaryOperationNode,
+    WhileStatementNode,
 )
 from vdsh.core.models.position import Position
 from vdsh.core.models.token import (
     BaseToken,
     EOFToken,
     IdentifierToken,
+    Keyword,
+    KeywordToken,
     NumberToken,
     Operator,
     OperatorToken,
 )
-from vdsh.core.pipeline import Parser
+from vdsh.core.pipeline import Parser, Tokenizer
 
 
 @dataclass
@@ -40,145 +61,180 @@ class BadCandidate(Candidate):
     error: Exception
 
 
+def _number(column: int, value: float) -> NumberToken:
+    return NumberToken(Position(1, column), Position(1, column), value=value)
+
+
+def _operator(start: int, end: int, kind: Operator) -> OperatorToken:
+    return OperatorToken(Position(1, start), Position(1, end), kind=kind)
+
+
+def _identifier(start: int, end: int, name: str) -> IdentifierToken:
+    return IdentifierToken(Position(1, start), Position(1, end), name=name)
+
+
+def _eof(column: int) -> EOFToken:
+    return EOFToken(Position(1, column), Position(1, column))
+
+
 HAPPY_CANDIDATES = [
     HappyCandidate(
         name="1-plus-2",
         tokens=[
-            NumberToken(Position(1, 1), Position(1, 1), value=1.0),
-            OperatorToken(Position(1, 3), Position(1, 3), kind=Operator.PLUS),
-            NumberToken(Position(1, 5), Position(1, 5), value=2.0),
-            EOFToken(Position(1, 6), Position(1, 6)),
+            _number(1, 1.0),
+            _operator(3, 3, Operator.PLUS),
+            _number(5, 2.0),
+            _eof(6),
         ],
         ast=BinaryOperationNode(
-            left=NumberLiteralNode(number=1.0),
-            right=NumberLiteralNode(number=2.0),
-            operator=Operator.PLUS,
+            left=NumberLiteralNode(number=_number(1, 1.0)),
+            right=NumberLiteralNode(number=_number(5, 2.0)),
+            operator=_operator(3, 3, Operator.PLUS),
         ),
     ),
     HappyCandidate(
         name="neg-5-times-3",
         tokens=[
-            OperatorToken(Position(1, 1), Position(1, 1), kind=Operator.MINUS),
-            NumberToken(Position(1, 2), Position(1, 2), value=5.0),
-            OperatorToken(Position(1, 4), Position(1, 4), kind=Operator.STAR),
-            NumberToken(Position(1, 6), Position(1, 6), value=3.0),
-            EOFToken(Position(1, 7), Position(1, 7)),
+            _operator(1, 1, Operator.MINUS),
+            _number(2, 5.0),
+            _operator(4, 4, Operator.STAR),
+            _number(6, 3.0),
+            _eof(7),
         ],
         ast=BinaryOperationNode(
             left=UnaryOperationNode(
-                operator=Operator.MINUS,
-                value=NumberLiteralNode(number=5.0),
+                operator=_operator(1, 1, Operator.MINUS),
+                value=NumberLiteralNode(number=_number(2, 5.0)),
             ),
-            right=NumberLiteralNode(number=3.0),
-            operator=Operator.STAR,
+            right=NumberLiteralNode(number=_number(6, 3.0)),
+            operator=_operator(4, 4, Operator.STAR),
         ),
     ),
     HappyCandidate(
         name="x-leq-10",
         tokens=[
-            IdentifierToken(Position(1, 1), Position(1, 1), name="x"),
-            OperatorToken(Position(1, 3), Position(1, 4), kind=Operator.LESS_EQUAL),
-            NumberToken(Position(1, 6), Position(1, 6), value=10.0),
-            EOFToken(Position(1, 7), Position(1, 7)),
+            _identifier(1, 1, "x"),
+            _operator(3, 4, Operator.LESS_EQUAL),
+            _number(6, 10.0),
+            _eof(7),
         ],
         ast=BinaryOperationNode(
-            left=IdentifierNode(name="x"),
-            right=NumberLiteralNode(number=10.0),
-            operator=Operator.LESS_EQUAL,
+            left=IdentifierNode(identifier=_identifier(1, 1, "x")),
+            right=NumberLiteralNode(number=_number(6, 10.0)),
+            operator=_operator(3, 4, Operator.LESS_EQUAL),
         ),
     ),
     HappyCandidate(
         name="1-neq-2-and-flag",
         tokens=[
-            NumberToken(Position(1, 1), Position(1, 1), value=1.0),
-            OperatorToken(Position(1, 3), Position(1, 4), kind=Operator.NOT_EQUALS),
-            NumberToken(Position(1, 6), Position(1, 6), value=2.0),
-            OperatorToken(Position(1, 8), Position(1, 10), kind=Operator.AND),
-            IdentifierToken(Position(1, 12), Position(1, 12), name="flag"),
-            EOFToken(Position(1, 13), Position(1, 13)),
+            _number(1, 1.0),
+            _operator(3, 4, Operator.NOT_EQUALS),
+            _number(6, 2.0),
+            _operator(8, 10, Operator.AND),
+            _identifier(12, 12, "flag"),
+            _eof(13),
         ],
         ast=BinaryOperationNode(
             left=BinaryOperationNode(
-                left=NumberLiteralNode(number=1.0),
-                right=NumberLiteralNode(number=2.0),
-                operator=Operator.NOT_EQUALS,
+                left=NumberLiteralNode(number=_number(1, 1.0)),
+                right=NumberLiteralNode(number=_number(6, 2.0)),
+                operator=_operator(3, 4, Operator.NOT_EQUALS),
             ),
-            right=IdentifierNode(name="flag"),
-            operator=Operator.AND,
+            right=IdentifierNode(identifier=_identifier(12, 12, "flag")),
+            operator=_operator(8, 10, Operator.AND),
         ),
     ),
     HappyCandidate(
         name="complex-bool-logic",
         tokens=[
-            NumberToken(Position(1, 1), Position(1, 1), value=1.0),
-            OperatorToken(Position(1, 3), Position(1, 3), kind=Operator.LESS),
-            NumberToken(Position(1, 5), Position(1, 5), value=2.0),
-            OperatorToken(Position(1, 7), Position(1, 9), kind=Operator.AND),
-            NumberToken(Position(1, 11), Position(1, 11), value=3.0),
-            OperatorToken(Position(1, 13), Position(1, 14), kind=Operator.EQUALS),
-            NumberToken(Position(1, 16), Position(1, 16), value=3.0),
-            OperatorToken(Position(1, 18), Position(1, 20), kind=Operator.OR),
-            OperatorToken(Position(1, 22), Position(1, 24), kind=Operator.NOT),
-            IdentifierToken(Position(1, 26), Position(1, 26), name="x"),
-            EOFToken(Position(1, 27), Position(1, 27)),
+            _number(1, 1.0),
+            _operator(3, 3, Operator.LESS),
+            _number(5, 2.0),
+            _operator(7, 9, Operator.AND),
+            _number(11, 3.0),
+            _operator(13, 14, Operator.EQUALS),
+            _number(16, 3.0),
+            _operator(18, 20, Operator.OR),
+            _operator(22, 24, Operator.NOT),
+            _identifier(26, 26, "x"),
+            _eof(27),
         ],
         ast=BinaryOperationNode(
             left=BinaryOperationNode(
                 left=BinaryOperationNode(
-                    left=NumberLiteralNode(1.0),
-                    right=NumberLiteralNode(2.0),
-                    operator=Operator.LESS,
+                    left=NumberLiteralNode(_number(1, 1.0)),
+                    right=NumberLiteralNode(_number(5, 2.0)),
+                    operator=_operator(3, 3, Operator.LESS),
                 ),
                 right=BinaryOperationNode(
-                    left=NumberLiteralNode(3.0),
-                    right=NumberLiteralNode(3.0),
-                    operator=Operator.EQUALS,
+                    left=NumberLiteralNode(_number(11, 3.0)),
+                    right=NumberLiteralNode(_number(16, 3.0)),
+                    operator=_operator(13, 14, Operator.EQUALS),
                 ),
-                operator=Operator.AND,
+                operator=_operator(7, 9, Operator.AND),
             ),
             right=UnaryOperationNode(
-                operator=Operator.NOT,
-                value=IdentifierNode(name="x"),
+                operator=_operator(22, 24, Operator.NOT),
+                value=IdentifierNode(identifier=_identifier(26, 26, "x")),
             ),
-            operator=Operator.OR,
+            operator=_operator(18, 20, Operator.OR),
         ),
     ),
     HappyCandidate(
         name="paren-arithmetic-nested",
         tokens=[
-            OperatorToken(Position(1, 1), Position(1, 1), kind=Operator.LEFT_PAREN),
-            NumberToken(Position(1, 2), Position(1, 2), value=1.0),
-            OperatorToken(Position(1, 4), Position(1, 4), kind=Operator.PLUS),
-            NumberToken(Position(1, 6), Position(1, 6), value=2.0),
-            OperatorToken(Position(1, 7), Position(1, 7), kind=Operator.RIGHT_PAREN),
-            OperatorToken(Position(1, 9), Position(1, 9), kind=Operator.STAR),
-            OperatorToken(Position(1, 11), Position(1, 11), kind=Operator.LEFT_PAREN),
-            NumberToken(Position(1, 12), Position(1, 12), value=3.0),
-            OperatorToken(Position(1, 14), Position(1, 14), kind=Operator.MINUS),
-            OperatorToken(Position(1, 16), Position(1, 16), kind=Operator.LEFT_PAREN),
-            NumberToken(Position(1, 17), Position(1, 17), value=4.0),
-            OperatorToken(Position(1, 19), Position(1, 19), kind=Operator.SLASH),
-            NumberToken(Position(1, 21), Position(1, 21), value=2.0),
-            OperatorToken(Position(1, 22), Position(1, 22), kind=Operator.RIGHT_PAREN),
-            OperatorToken(Position(1, 23), Position(1, 23), kind=Operator.RIGHT_PAREN),
-            EOFToken(Position(1, 24), Position(1, 24)),
+            _operator(1, 1, Operator.LEFT_PAREN),
+            _number(2, 1.0),
+            _operator(4, 4, Operator.PLUS),
+            _number(6, 2.0),
+            _operator(7, 7, Operator.RIGHT_PAREN),
+            _operator(9, 9, Operator.STAR),
+            _operator(11, 11, Operator.LEFT_PAREN),
+            _number(12, 3.0),
+            _operator(14, 14, Operator.MINUS),
+            _operator(16, 16, Operator.LEFT_PAREN),
+            _number(17, 4.0),
+            _operator(19, 19, Operator.SLASH),
+            _number(21, 2.0),
+            _operator(22, 22, Operator.RIGHT_PAREN),
+            _operator(23, 23, Operator.RIGHT_PAREN),
+            _eof(24),
         ],
         ast=BinaryOperationNode(
             left=BinaryOperationNode(
-                left=NumberLiteralNode(1.0),
-                right=NumberLiteralNode(2.0),
-                operator=Operator.PLUS,
+                left=NumberLiteralNode(_number(2, 1.0)),
+                right=NumberLiteralNode(_number(6, 2.0)),
+                operator=_operator(4, 4, Operator.PLUS),
             ),
             right=BinaryOperationNode(
-                left=NumberLiteralNode(3.0),
+                left=NumberLiteralNode(_number(12, 3.0)),
                 right=BinaryOperationNode(
-                    left=NumberLiteralNode(4.0),
-                    right=NumberLiteralNode(2.0),
-                    operator=Operator.SLASH,
+                    left=NumberLiteralNode(_number(17, 4.0)),
+                    right=NumberLiteralNode(_number(21, 2.0)),
+                    operator=_operator(19, 19, Operator.SLASH),
                 ),
-                operator=Operator.MINUS,
+                operator=_operator(14, 14, Operator.MINUS),
             ),
-            operator=Operator.STAR,
+            operator=_operator(9, 9, Operator.STAR),
+        ),
+    ),
+    HappyCandidate(
+        name="call-with-arguments",
+        tokens=[
+            _identifier(1, 3, "add"),
+            _operator(4, 4, Operator.LEFT_PAREN),
+            _number(5, 1.0),
+            _operator(6, 6, Operator.COMMA),
+            _identifier(8, 8, "x"),
+            _operator(9, 9, Operator.RIGHT_PAREN),
+            _eof(10),
+        ],
+        ast=CallNode(
+            identifier=_identifier(1, 3, "add"),
+            arguments=[
+                NumberLiteralNode(_number(5, 1.0)),
+                IdentifierNode(identifier=_identifier(8, 8, "x")),
+            ],
         ),
     ),
 ]
@@ -188,33 +244,54 @@ BAD_CANDIDATES = [
     BadCandidate(
         name="unexpected-token",
         tokens=[
-            OperatorToken(Position(1, 1), Position(1, 1), kind=Operator.PLUS),
-            OperatorToken(Position(1, 2), Position(1, 2), kind=Operator.PLUS),
-            EOFToken(Position(1, 3), Position(1, 3)),
+            _operator(1, 1, Operator.PLUS),
+            _operator(2, 2, Operator.PLUS),
+            _eof(3),
         ],
-        error=UnexpectedTokenError(token=EOFToken(Position(1, 3), Position(1, 3))),
+        error=UnexpectedTokenError(token=_eof(3)),
     ),
     BadCandidate(
         name="missing-right-paren",
         tokens=[
-            OperatorToken(Position(1, 1), Position(1, 1), kind=Operator.LEFT_PAREN),
-            NumberToken(Position(1, 2), Position(1, 2), value=1.0),
-            EOFToken(Position(1, 3), Position(1, 3)),
+            _operator(1, 1, Operator.LEFT_PAREN),
+            _number(2, 1.0),
+            _eof(3),
         ],
         error=UnclosedParenError(
-            opening_token=OperatorToken(Position(1, 1), Position(1, 1), kind=Operator.LEFT_PAREN),
-            parsed_value=NumberLiteralNode(1.0),
+            opening_token=_operator(1, 1, Operator.LEFT_PAREN),
             expected=Operator.RIGHT_PAREN,
-            actual=EOFToken(Position(1, 3), Position(1, 3)),
+            actual=_eof(3),
         ),
     ),
+    BadCandidate(
+        name="unclosed-call",
+        tokens=[
+            _identifier(1, 1, "f"),
+            _operator(2, 2, Operator.LEFT_PAREN),
+            _number(3, 1.0),
+            _eof(4),
+        ],
+        error=MissingRightParenInCallError(function_name="f", actual=_eof(4)),
+    ),
+    BadCandidate(
+        name="unclosed-block",
+        tokens=[
+            KeywordToken(Position(1, 1), Position(1, 4), kind=Keyword.FUNC),
+            _identifier(6, 6, "f"),
+            _operator(7, 7, Operator.LEFT_PAREN),
+            _operator(8, 8, Operator.RIGHT_PAREN),
+            _operator(10, 10, Operator.LEFT_BRACE),
+            _eof(11),
+        ],
+        error=BlockMissingClosingBraceError(actual=_eof(11)),
+    ),
 ]
 
 
 @pytest.mark.parametrize("candidate", HAPPY_CANDIDATES, ids=operator.attrgetter("name"))
 def test_parser_happy_flow(candidate: HappyCandidate) -> None:
     ast = _parse(candidate.tokens)
-    assert ast == candidate.ast
+    assert ast == ProgramNode(statements=[candidate.ast])
 
 
 @pytest.mark.parametrize("candidate", BAD_CANDIDATES, ids=operator.attrgetter("name"))
@@ -223,6 +300,120 @@ def test_parser_bad_flow(candidate: BadCandidate) -> None:
         _parse(candidate.tokens)
 
 
+def test_parser_multiple_statements() -> None:
+    func = KeywordToken(Position(1, 1), Position(1, 4), kind=Keyword.FUNC)
+    let = KeywordToken(Position(1, 12), Position(1, 14), kind=Keyword.LET)
+    tokens = [
+        func,
+        _identifier(6, 6, "f"),
+        _operator(7, 7, Operator.LEFT_PAREN),
+        _identifier(8, 8, "a"),
+        _operator(9, 9, Operator.COLON),
+        _identifier(10, 10, "int"),
+        _operator(11, 11, Operator.RIGHT_PAREN),
+        _operator(12, 12, Operator.LEFT_BRACE),
+        let,
+        _identifier(16, 16, "b"),
+        _operator(18, 18, Operator.ASSIGN),
+        _identifier(20, 20, "a"),
+        _operator(21, 21, Operator.SEMICOLON),
+        _operator(23, 23, Operator.RIGHT_BRACE),
+        _identifier(25, 25, "f"),
+        _operator(26, 26, Operator.LEFT_PAREN),
+        _number(27, 1.0),
+        _operator(28, 28, Operator.RIGHT_PAREN),
+        _operator(29, 29, Operator.SEMICOLON),
+        _eof(30),
+    ]
+
+    assert _parse(tokens) == ProgramNode(
+        statements=[
+            FuncStatementNode(
+                func=func,
+                decelration=FuncDeclerationNode(
+                    identifier=_identifier(6, 6, "f"),
+                    arguments=ArgumentsNode(
+                        arguments=[
+                            ArgumentNode(
+                                identifier=_identifier(8, 8, "a"),
+                                type_identifier=_identifier(10, 10, "int"),
+                            ),
+                        ],
+                    ),
+                    block=BlockNode(
+                        statements=[
+                            LetStatementNode(
+                                let=let,
+                                assignment=AssignmentNode(
+                                    identifier=_identifier(16, 16, "b"),
+                                    value=IdentifierNode(identifier=_identifier(20, 20, "a")),
+                                ),
+                            ),
+                        ],
+                    ),
+                ),
+            ),
+            CallNode(
+                identifier=_identifier(25, 25, "f"),
+                arguments=[NumberLiteralNode(_number(27, 1.0))],
+            ),
+        ],
+    )
+
+
+def test_parser_return_statement() -> None:
+    return_ = KeywordToken(Position(1, 1), Position(1, 6), kind=Keyword.RETURN)
+    tokens = [
+        return_,
+        _identifier(8, 8, "x"),
+        _operator(9, 9, Operator.SEMICOLON),
+        return_,
+        _operator(10, 10, Operator.SEMICOLON),
+        _eof(11),
+    ]
+
+    assert _parse(tokens) == ProgramNode(
+        statements=[
+            ReturnStatementNode(return_=return_, value=IdentifierNode(_identifier(8, 8, "x"))),
+            ReturnStatementNode(return_=return_),
+        ],
+    )
+
+
+def test_parser_loops() -> None:
+    ast = _parse_code("for (let i = 0; i < 3; i = i + 1) { while i { i = i - 1; } }")
+
+    assert isinstance(ast, ProgramNode)
+    loop = ast.statements[0]
+    assert isinstance(loop, ForStatementNode)
+    assert isinstance(loop.initializer, LetStatementNode)
+    assert isinstance(loop.condition, BinaryOperationNode)
+    assert isinstance(loop.update, AssignmentNode)
+    assert isinstance(loop.block.statements[0], WhileStatementNode)
+
+
+def test_parser_if_else_chain() -> None:
+    ast = _parse_code("if x { y = 1; } else if z { y = 2; } else { y = 3; }")
+
+    assert isinstance(ast, ProgramNode)
+    statement = ast.statements[0]
+    assert isinstance(statement, IfStatementNode)
+    assert statement.else_block is not None
+    nested = statement.else_block.statements[0]
+    assert isinstance(nested, IfStatementNode)
+    assert nested.else_block is not None
+    assert isinstance(nested.else_block.statements[0], AssignmentNode)
+
+
+def test_parser_for_requires_parens() -> None:
+    with pytest.raises(MissingLeftParenInForError):
+        _parse_code("for let i = 0; i < 3; i = i + 1 { }")
+
+
+def _parse_code(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
+
+
 def _parse(tokens: list[BaseToken]) -> BaseASTNode:
     token_iterator = SequenceIterator(tokens)
     parser = Parser(token_iterator)
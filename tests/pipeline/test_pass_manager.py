@@ -0,0 +1,80 @@
+from dataclasses import replace
+
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import BaseASTNode, MemoizedFuncStatementNode, ProgramNode
+from vdsh.core.pipeline import OptimizationLevel, Optimizer, Parser, PassManager, Tokenizer
+from vdsh.core.pipeline.passes.tree import walk
+
+PROGRAM = """func fib(n: int) {
+    if n < 2 { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+func g(a: int) { let b = a; }
+g(1);
+let x = fib(10);
+"""
+
+
+class _DropFirstStatement:
+    def transform(self, data: BaseASTNode) -> BaseASTNode:
+        assert isinstance(data, ProgramNode)
+        return replace(data, statements=data.statements[1:])
+
+
+def test_runs_passes_to_a_fixed_point() -> None:
+    pass_manager = PassManager([_DropFirstStatement()], max_iterations=10)
+    program = pass_manager.transform(_parse("let a = 1; let b = 2; let c = 3;"))
+
+    assert program == ProgramNode(statements=[])
+    assert pass_manager.iterations == 4
+    assert pass_manager.statistics[0].runs == 4
+    assert pass_manager.statistics[0].node_delta < 0
+
+
+def test_stops_after_max_iterations() -> None:
+    pass_manager = PassManager([_DropFirstStatement()], max_iterations=2)
+    program = pass_manager.transform(_parse("let a = 1; let b = 2; let c = 3;"))
+
+    assert isinstance(program, ProgramNode)
+    assert len(program.statements) == 1
+    assert pass_manager.iterations == 2
+
+
+def test_o0_leaves_the_tree_untouched() -> None:
+    program = _parse(PROGRAM)
+    pass_manager = PassManager.from_level(OptimizationLevel.O0)
+
+    assert pass_manager.transform(program) is program
+    assert pass_manager.statistics == []
+
+
+def test_only_o2_memoizes() -> None:
+    def memoizes(level: OptimizationLevel) -> bool:
+        program = PassManager.from_level(level).transform(_parse(PROGRAM))
+        return any(isinstance(node, MemoizedFuncStatementNode) for node in walk(program))
+
+    assert not memoizes(OptimizationLevel.O1)
+    assert memoizes(OptimizationLevel.O2)
+
+
+def test_default_optimizer_does_not_memoize() -> None:
+    program = Optimizer().transform(_parse(PROGRAM))
+
+    assert not any(isinstance(node, MemoizedFuncStatementNode) for node in walk(program))
+
+
+def test_records_statistics_per_pass() -> None:
+    pass_manager = PassManager.from_level(OptimizationLevel.O2)
+    pass_manager.transform(_parse(PROGRAM))
+
+    assert [statistics.name for statistics in pass_manager.statistics] == [
+        "TailCallEliminator",
+        "Memoizer",
+        "Inliner",
+    ]
+    assert all(statistics.runs == pass_manager.iterations for statistics in pass_manager.statistics)
+    assert pass_manager.statistics[1].node_delta == 1
+
+
+def _parse(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
@@ -0,0 +1,55 @@
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from vdsh.core.errors import InvalidProfileError
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.position import Position
+from vdsh.core.pipeline import Parser, Tokenizer
+from vdsh.core.pipeline.backends import ProfilingCodeGenerator
+from vdsh.core.pipeline.backends.profiling import (
+    PROFILE_FILE_VARIABLE,
+    ProfileSpan,
+    collect_call_profile,
+    read_profile,
+)
+
+PROGRAM = """func add(a: int, b: int) { return a + b; }
+let x = add(1, 2);
+x = add(x, add(x, 3));
+"""
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not installed")
+def test_profiles_functions_and_statements(tmp_path: Path) -> None:
+    profile = tmp_path / "vdsh.profile"
+    generator = ProfilingCodeGenerator()
+    script = generator.transform(Parser(Tokenizer(SequenceIterator(PROGRAM))).create())
+
+    result = subprocess.run(
+        ["bash"],
+        input=script + '\necho "$__VDSH__x"',
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ | {PROFILE_FILE_VARIABLE: str(profile)},
+    )
+    entries = {entry.span.label: entry for entry in read_profile(profile, generator.spans)}
+
+    assert result.stdout.strip() == "9"
+    assert set(entries) == {"func add", "let x", "x ="}
+    assert entries["func add"].calls == 3
+    assert entries["func add"].span.start.row == 1
+    assert entries["x ="].span.start.row == 3
+    assert collect_call_profile(list(entries.values())).calls == {"add": 3}
+
+
+def test_rejects_malformed_profiles(tmp_path: Path) -> None:
+    profile = tmp_path / "vdsh.profile"
+    profile.write_text("0 1 2\n7 1 2\n")
+
+    with pytest.raises(InvalidProfileError):
+        read_profile(profile, [ProfileSpan("let x", Position(1, 1), Position(1, 9))])
@@ -0,0 +1,58 @@
+import shutil
+import subprocess
+
+import pytest
+
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import BaseASTNode, CallNode, ProgramNode, WhileStatementNode
+from vdsh.core.pipeline import CodeGenerator, Parser, Tokenizer
+from vdsh.core.pipeline.passes import TailCallEliminator
+from vdsh.core.pipeline.passes.tree import walk
+
+SUM = """
+func sum(n: int, acc: int) {
+    if n == 0 { return acc; }
+    return sum(n - 1, acc + n);
+}
+"""
+
+
+def test_rewrites_self_tail_calls_into_a_loop() -> None:
+    program = _eliminate(SUM)
+
+    assert not any(isinstance(node, CallNode) for node in walk(program))
+    assert any(isinstance(node, WhileStatementNode) for node in walk(program))
+
+
+def test_keeps_calls_that_are_not_in_tail_position() -> None:
+    program = _eliminate("func f(n: int) { if n == 0 { return 1; } return n * f(n - 1); }")
+
+    assert any(isinstance(node, CallNode) for node in walk(program))
+    assert not any(isinstance(node, WhileStatementNode) for node in walk(program))
+
+
+def test_keeps_tail_calls_to_other_functions() -> None:
+    program = _eliminate("func g(n: int) { return n; } func f(n: int) { return g(n); }")
+
+    assert any(isinstance(node, CallNode) for node in walk(program))
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not installed")
+def test_runs_deep_inputs() -> None:
+    script = CodeGenerator().transform(_eliminate(SUM + "let x = sum(20000, 0);"))
+    result = subprocess.run(
+        ["bash"],
+        input=script + '\necho "$__VDSH__x"',
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == str(sum(range(20001)))
+
+
+def _eliminate(code: str) -> BaseASTNode:
+    program = TailCallEliminator().transform(Parser(Tokenizer(SequenceIterator(code))).create())
+    assert isinstance(program, ProgramNode)
+
+    return program
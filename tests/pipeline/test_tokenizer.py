@@ -195,6 +195,49 @@ def test_bad_flow(candidate: BadCandidate) -> None:
     assert candidate.error == exc_info.value
 
 
+def test_strings_spanning_lines_keep_positions() -> None:
+    tokens = _tokenize('"a\nbc" x')
+
+    assert tokens[0] == StringToken(start=Position(1, 1), end=Position(2, 3), value="a\nbc")
+    assert tokens[1] == IdentifierToken(start=Position(2, 5), end=Position(2, 5), name="x")
+
+
+def test_reads_chars_of_any_iterator() -> None:
+    class Chars:
+        def __init__(self, code: str) -> None:
+            self.chars = list(reversed(code))
+
+        def next(self) -> str:
+            return self.chars.pop()
+
+        def is_over(self) -> bool:
+            return not self.chars
+
+    tokenizer = Tokenizer(Chars("let a = 1"))
+    tokens = []
+    while not tokenizer.is_over():
+        tokens.append(tokenizer.next())
+
+    assert tokens == _tokenize("let a = 1")
+
+
+def test_starts_at_the_offset_of_the_iterator() -> None:
+    tokenizer = Tokenizer(SequenceIterator("xyz let", start=4), start=Position(1, 5))
+
+    assert tokenizer.next() == KeywordToken(
+        start=Position(1, 5),
+        end=Position(1, 7),
+        kind=Keyword.LET,
+    )
+
+
+def test_columns_restart_at_one_after_a_newline() -> None:
+    tokens = _tokenize("let a = 1;\nlet b = 2;")
+
+    starts = [token.start for token in tokens if isinstance(token, KeywordToken)]
+    assert starts == [Position(row=1, column=1), Position(row=2, column=1)]
+
+
 def _tokenize(code: str) -> list[BaseToken]:
     char_iterator = SequenceIterator(code)
     tokenizer = Tokenizer(char_iterator)
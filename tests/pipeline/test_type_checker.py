@@ -0,0 +1,38 @@
+import pytest
+
+from vdsh.core.errors import (
+    ArgumentCountMismatchError,
+    ReturnOutsideFunctionError,
+    UndefinedFunctionError,
+)
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.pipeline import Parser, Tokenizer, TypeChecker
+
+
+def test_accepts_calls_to_declared_functions() -> None:
+    _check("func f(a: int) { let b = a; } f(1);")
+
+
+def test_rejects_undefined_functions() -> None:
+    with pytest.raises(UndefinedFunctionError):
+        _check("func f(a: int) { g(a); }")
+
+
+def test_rejects_calls_to_shell_commands() -> None:
+    # Undefined calls used to reach bash as `__VDSH__`-prefixed commands, which never exist
+    with pytest.raises(UndefinedFunctionError):
+        _check("sleep(1);")
+
+
+def test_rejects_wrong_argument_count() -> None:
+    with pytest.raises(ArgumentCountMismatchError):
+        _check("func f(a: int) { let b = a; } f(1, 2);")
+
+
+def test_rejects_return_outside_function() -> None:
+    with pytest.raises(ReturnOutsideFunctionError):
+        _check("return 1;")
+
+
+def _check(code: str) -> None:
+    TypeChecker().validate(Parser(Tokenizer(SequenceIterator(code))).create())
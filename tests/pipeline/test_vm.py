@@ -0,0 +1,82 @@
+import pytest
+
+from vdsh.core.errors import RecursionLimitError, UnknownFunctionError
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.models.bytecode import Opcode
+from vdsh.core.pipeline import OptimizationLevel, Parser, PassManager, Tokenizer
+from vdsh.core.pipeline.bytecode_compiler import BytecodeCompiler
+from vdsh.core.pipeline.interpreter import Interpreter
+from vdsh.core.pipeline.vm import VirtualMachine
+
+SUM = """
+func sum(n: int, acc: int) {
+    if n == 0 { return acc; }
+    return sum(n - 1, acc + n);
+}
+let x = sum(50, 0);
+"""
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "let x = -7 / 2; let y = -7 % 2; let z = 2 ** 10 - +3;",
+        "let x = 4611686018427387904 * 2; let y = x - 1; let z = !x;",
+        "let a = 0; let x = a && 1 / a; let y = 2 || 1 / a; let z = 0 || 3;",
+        "let x = 1; while x < 100 { x = x * 3; }",
+        "let x = 2; if x > 3 { x = 1; } else if x == 2 { x = 7; } else { x = 9; }",
+        "let x = 0; for (let i = 0; i < 10; i = i + 1) { if i % 2 == 0 { continue; } x = x + i; }",
+        "let y = 0; func g(a: int) { y = a; } func f(y: int) { g(y + 1); } f(1); g(5);",
+        "func f(a: int) { let b = a; return; } let x = f(1); func g() { return 4; } g(); x = f(2);",
+        "func f() { func h() { return 3; } } f(); let x = h();",
+        SUM,
+    ],
+)
+def test_matches_the_interpreter(code: str) -> None:
+    for level in OptimizationLevel:
+        program = PassManager.from_level(level).transform(_parse(code))
+
+        assert _run(program) == Interpreter().transform(program)
+
+
+def test_memoized_functions_are_called_once() -> None:
+    code = "func fib(n: int) { if n < 2 { return n; } return fib(n - 1) + fib(n - 2); } "
+    program = _parse(code + "let x = fib(80);")
+    program = PassManager.from_level(OptimizationLevel.O2).transform(program)
+
+    assert _run(program)["x"] == 23416728348467685
+
+
+def test_recursion_does_not_use_the_python_stack() -> None:
+    code = "func f(n: int) { if n == 0 { return 0; } return 1 + f(n - 1); } let x = f(5000);"
+
+    assert _run(_parse(code))["x"] == 5000
+
+
+def test_runaway_recursion() -> None:
+    program = BytecodeCompiler().transform(_parse("func f(n: int) { return f(n + 1); } f(0);"))
+
+    with pytest.raises(RecursionLimitError):
+        VirtualMachine(max_call_depth=100).transform(program)
+
+
+def test_unknown_function() -> None:
+    with pytest.raises(UnknownFunctionError):
+        _run(_parse("f(1); func f(a: int) { }"))
+
+
+def test_functions_compile_into_their_own_code_objects() -> None:
+    program = BytecodeCompiler().transform(_parse(SUM))
+
+    assert [function.name for function in program.functions] == ["sum"]
+    assert Opcode.DEFINE_FUNCTION in program.main.opcodes
+    assert program.functions[0].opcodes[-1] == Opcode.RETURN
+
+
+def _run(program: BaseASTNode) -> dict[str, int | str]:
+    return VirtualMachine().transform(BytecodeCompiler().transform(program))
+
+
+def _parse(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
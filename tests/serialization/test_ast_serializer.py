@@ -0,0 +1,82 @@
+import io
+import sys
+
+import pytest
+
+from vdsh.core.errors import InvalidASTCacheError
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models import Position
+from vdsh.core.models.ast import BaseASTNode, NumberLiteralNode, UnaryOperationNode
+from vdsh.core.models.token import NumberToken, Operator, OperatorToken
+from vdsh.core.pipeline import Parser, Tokenizer
+from vdsh.core.serialization import dump, dumps, load, loads
+
+CODE = """
+func add(a: int, b: int) {
+    let c = a + b * 2.5;
+    report(c, -a, !b);
+}
+
+let x = (1 + 2) ** 3 % 4;
+add(x, x >= 10 && x != 3 || x < 1);
+"""
+
+
+def test_round_trip() -> None:
+    ast = _parse(CODE)
+
+    assert loads(dumps(ast)) == ast
+
+
+def test_file_round_trip() -> None:
+    ast = _parse(CODE)
+    buffer = io.BytesIO()
+
+    dump(ast, buffer)
+    buffer.seek(0)
+
+    assert load(buffer) == ast
+
+
+def test_identifiers_are_interned() -> None:
+    single = dumps(_parse("let abcdefghij = 1;"))
+    repeated = dumps(_parse("let abcdefghij = abcdefghij + abcdefghij;"))
+
+    assert repeated.count(b"abcdefghij") == single.count(b"abcdefghij") == 1
+
+
+def test_cache_is_compact() -> None:
+    code = CODE * 50
+
+    assert len(dumps(_parse(code))) < 4 * len(code)
+
+
+def test_deep_trees_round_trip() -> None:
+    depth = 2 * sys.getrecursionlimit()
+    position = Position(1, 1)
+    operator = OperatorToken(position, position, Operator.MINUS)
+    node: BaseASTNode = NumberLiteralNode(NumberToken(position, position, 1.0))
+    for _ in range(depth):
+        node = UnaryOperationNode(node, operator)
+
+    loaded = loads(dumps(node))
+    for _ in range(depth):
+        assert isinstance(loaded, UnaryOperationNode)
+        loaded = loaded.value
+
+    assert loaded == NumberLiteralNode(NumberToken(position, position, 1.0))
+
+
+@pytest.mark.parametrize("data", [b"", b"not an ast cache at all, just bytes"])
+def test_invalid_cache_raises(data: bytes) -> None:
+    with pytest.raises(InvalidASTCacheError):
+        loads(data)
+
+
+def test_truncated_cache_raises() -> None:
+    with pytest.raises(InvalidASTCacheError):
+        loads(dumps(_parse("let x = 1;"))[:-8])
+
+
+def _parse(code: str) -> BaseASTNode:
+    return Parser(Tokenizer(SequenceIterator(code))).create()
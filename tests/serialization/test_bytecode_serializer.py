@@ -0,0 +1,50 @@
+import hashlib
+
+import pytest
+
+from vdsh.core.errors import InvalidBytecodeCacheError
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.bytecode import BytecodeProgram
+from vdsh.core.pipeline import Parser, Tokenizer
+from vdsh.core.pipeline.bytecode_compiler import BytecodeCompiler
+from vdsh.core.pipeline.vm import VirtualMachine
+from vdsh.core.serialization import dumps_bytecode, loads_bytecode
+
+CODE = """
+func add(a: int, b: int) { return a + b; }
+func fib(n: int) { if n < 2 { return n; } return add(fib(n - 1), fib(n - 2)); }
+let x = fib(10) * 123456789012;
+"""
+DIGEST = hashlib.sha256(CODE.encode()).digest()
+
+
+def test_round_trip() -> None:
+    program = _compile(CODE)
+    loaded = loads_bytecode(dumps_bytecode(program, DIGEST), DIGEST)
+
+    assert loaded == program
+    assert VirtualMachine().transform(loaded)["x"] == 55 * 123456789012
+
+
+def test_stale_cache_raises() -> None:
+    data = dumps_bytecode(_compile(CODE), DIGEST)
+
+    with pytest.raises(InvalidBytecodeCacheError):
+        loads_bytecode(data, hashlib.sha256(b"edited").digest())
+
+
+@pytest.mark.parametrize("data", [b"", b"not a bytecode cache at all, just some bytes" * 2])
+def test_invalid_cache_raises(data: bytes) -> None:
+    with pytest.raises(InvalidBytecodeCacheError):
+        loads_bytecode(data, DIGEST)
+
+
+def test_truncated_cache_raises() -> None:
+    data = dumps_bytecode(_compile(CODE), DIGEST)
+
+    with pytest.raises(InvalidBytecodeCacheError):
+        loads_bytecode(data[:-1], DIGEST)
+
+
+def _compile(code: str) -> BytecodeProgram:
+    return BytecodeCompiler().transform(Parser(Tokenizer(SequenceIterator(code))).create())
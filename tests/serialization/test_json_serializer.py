@@ -0,0 +1,24 @@
+import json
+
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.position import Position
+from vdsh.core.models.token import Operator, OperatorToken
+from vdsh.core.pipeline import Parser, Tokenizer
+from vdsh.core.serialization import to_json
+
+
+def test_token() -> None:
+    token = OperatorToken(start=Position(1, 2), end=Position(1, 3), kind=Operator.POWER)
+
+    assert to_json(token) == {"type": "OperatorToken", "start": [1, 2], "end": [1, 3], "kind": "**"}
+
+
+def test_tree() -> None:
+    ast = Parser(Tokenizer(SequenceIterator("func f(a: int) { return; } f(2.5);"))).create()
+    data = json.loads(json.dumps(to_json(ast)))
+    function, call = data["statements"]
+
+    assert data["type"] == "ProgramNode"
+    assert function["decelration"]["arguments"]["arguments"][0]["identifier"]["name"] == "a"
+    assert function["decelration"]["block"]["statements"][0]["value"] is None
+    assert call["arguments"][0]["number"]["value"] == 2.5
@@ -0,0 +1,71 @@
+import asyncio
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import vdsh
+from vdsh.core.errors import ParserError
+from vdsh.core.pipeline import OptimizationLevel
+from vdsh.core.pipeline.backends import Target
+
+SOURCES = [
+    f"func f(a: int) {{ return a * {index}; }} let x = f(3) + {index};" for index in range(16)
+]
+
+
+def test_compile() -> None:
+    result = vdsh.compile("let a = 1;\nlet b = a + 2;")
+
+    assert "__VDSH__b=" in result.script
+    assert result.source_map.mappings
+
+
+def test_options() -> None:
+    options = vdsh.CompileOptions(target=Target.SH, optimization_level=OptimizationLevel.O0)
+
+    assert "[[" not in vdsh.compile("let a = 1; if a < 2 { a = 3; }", options=options).script
+
+
+def test_bounds_memo_caches() -> None:
+    source = "func f(n: int) { if n < 2 { return n; } return f(n - 1) + f(n - 2); } let x = f(9);"
+    options = vdsh.CompileOptions(optimization_level=OptimizationLevel.O2, memo_max_entries=8)
+
+    assert ">= 8" in vdsh.compile(source, options=options).script
+
+
+def test_compile_errors_propagate() -> None:
+    with pytest.raises(ParserError):
+        vdsh.compile("let = 1;")
+
+
+def test_compiler_is_thread_safe() -> None:
+    compiler = vdsh.Compiler()
+    expected = [compiler.compile(source).script for source in SOURCES]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        scripts = [result.script for result in executor.map(compiler.compile, SOURCES * 4)]
+
+    assert scripts == expected * 4
+
+
+def test_compile_async() -> None:
+    compiler = vdsh.Compiler()
+
+    async def compile_all() -> list[vdsh.CompileResult]:
+        return await asyncio.gather(*(compiler.compile_async(source) for source in SOURCES))
+
+    results = asyncio.run(compile_all())
+
+    assert [result.script for result in results] == [
+        compiler.compile(source).script for source in SOURCES
+    ]
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not installed")
+def test_compiled_script_runs() -> None:
+    script = vdsh.compile(SOURCES[5]).script + '\necho "$__VDSH__x"'
+    result = subprocess.run(["bash"], input=script, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "20"
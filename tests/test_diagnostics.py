@@ -0,0 +1,98 @@
+import pytest
+
+from vdsh.core.diagnostics import Diagnostic, LineIndex, diagnose, render_diagnostic
+from vdsh.core.errors import (
+    ArgumentCountMismatchError,
+    MissingSemicolonError,
+    ParserError,
+    RecursionLimitError,
+    UnclosedParenError,
+    UnexpectedCharacterError,
+    VDSHError,
+)
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.position import Position
+from vdsh.core.models.token import Operator, OperatorToken
+from vdsh.core.pipeline import Parser, Tokenizer
+
+
+def _parse_error(code: str) -> VDSHError:
+    parser = Parser(token_iterator=Tokenizer(char_iterator=SequenceIterator(code)))
+
+    with pytest.raises(ParserError) as error:
+        parser.create()
+
+    return error.value
+
+
+def test_line_index_finds_lines() -> None:
+    lines = LineIndex("first\nsecond\n\nlast")
+
+    assert lines.line(1) == "first"
+    assert lines.line(2) == "second"
+    assert lines.line(3) == ""
+    assert lines.line(4) == "last"
+    assert lines.line(5) is None
+    assert lines.line(0) is None
+
+
+def test_line_index_only_scans_requested_rows() -> None:
+    lines = LineIndex("a\nb\n" + "c\n" * 10_000)
+
+    assert lines.line(2) == "b"
+    assert len(lines._starts) == 3
+
+
+def test_diagnose_uses_error_fields() -> None:
+    error = _parse_error("let x = (1 + 2;")
+    assert isinstance(error, UnclosedParenError)
+
+    diagnostic = diagnose(error)
+
+    assert diagnostic.message == "Unclosed paren (expected ')')"
+    assert diagnostic.start == Position(row=1, column=15)
+    assert diagnostic.end == Position(row=1, column=15)
+
+
+def test_diagnose_without_span() -> None:
+    assert diagnose(RecursionLimitError()) == Diagnostic(message="Recursion limit")
+    assert diagnose(
+        ArgumentCountMismatchError(function_name="f", expected=1, actual=2),
+    ) == Diagnostic(message="Argument count mismatch (function name 'f', expected 1, actual 2)")
+
+
+def test_render_diagnostic_points_at_span() -> None:
+    source = "let a = 1;\nlet b = 2\nlet c = 3;\n"
+    error = _parse_error(source)
+    assert isinstance(error, MissingSemicolonError)
+
+    rendered = render_diagnostic(diagnose(error), LineIndex(source), "script.vdsh")
+
+    assert rendered == "\n".join(
+        [
+            "Missing semicolon",
+            "  --> script.vdsh:3:1",
+            "  |",
+            "3 | let c = 3;",
+            "  | ^^^",
+        ],
+    )
+
+
+def test_render_diagnostic_keeps_tabs_aligned() -> None:
+    source = "\tlet x = $;"
+    error = UnexpectedCharacterError(char="$", position=Position(row=1, column=10))
+
+    rendered = render_diagnostic(diagnose(error), LineIndex(source), "<code>")
+
+    assert rendered.splitlines()[-1] == "  | \t        ^"
+
+
+def test_unclosed_paren_error_does_not_hold_the_expression() -> None:
+    expression = " + ".join(["1"] * 300)
+    error = _parse_error(f"let x = ({expression};")
+
+    assert isinstance(error, UnclosedParenError)
+    assert isinstance(error.opening_token, OperatorToken)
+    assert error.opening_token.kind == Operator.LEFT_PAREN
+    assert len(repr(error)) < 1_000
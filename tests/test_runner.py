@@ -0,0 +1,50 @@
+import asyncio
+import shutil
+import time
+
+import pytest
+
+from vdsh.core.errors import ParserError
+from vdsh.core.runner import OutputStream, run_many
+
+pytestmark = pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not installed")
+
+FOREVER = "let a = 0; while 1 { a = a + 1; }"
+
+
+def test_aggregates_exit_statuses() -> None:
+    sources = {
+        "ok": "func f(n: int) { return n * 2; } let x = f(21);",
+        "failing": "let a = 1; let z = 0; let b = a / z;",
+        "broken": "let = ;",
+        "slow": FOREVER,
+    }
+    runs = asyncio.run(run_many(sources, timeout=0.5))
+
+    assert [run.name for run in runs] == list(sources)
+    assert runs[0].succeeded
+    assert runs[1].exit_code == 1
+    assert isinstance(runs[2].error, ParserError)
+    assert runs[3].timed_out
+    assert runs[3].exit_code is None
+    assert runs[3].seconds >= 0.5
+
+
+def test_forwards_output_lines_with_script_names() -> None:
+    lines: list[tuple[str, OutputStream, str]] = []
+    sources = {"first": "let z = 0; let a = 1 / z;", "second": "let a = 1;"}
+
+    asyncio.run(run_many(sources, on_output=lambda *line: lines.append(line)))
+
+    assert len(lines) == 1
+    assert lines[0][:2] == ("first", OutputStream.STDERR)
+    assert "division by 0" in lines[0][2]
+
+
+def test_bounds_concurrency() -> None:
+    sources = {str(index): FOREVER for index in range(3)}
+    start = time.perf_counter()
+    runs = asyncio.run(run_many(sources, max_concurrency=1, timeout=0.2))
+
+    assert all(run.timed_out for run in runs)
+    assert time.perf_counter() - start >= 0.6
@@ -0,0 +1,56 @@
+import pytest
+
+from vdsh.core.diagnostics import diagnose
+from vdsh.core.errors import UnhandledNodeError
+from vdsh.core.types import BaseVisitor, visits
+
+
+class Shape:
+    pass
+
+
+class Square(Shape):
+    pass
+
+
+class Circle(Shape):
+    pass
+
+
+class Triangle:
+    pass
+
+
+class ShapeNamer(BaseVisitor[object, str]):
+    @visits(Shape)
+    def _visit_shape(self, _: Shape) -> str:
+        return "shape"
+
+    @visits(Circle)
+    def _visit_circle(self, _: Circle) -> str:
+        return "circle"
+
+
+class LoudShapeNamer(ShapeNamer):
+    def _visit_shape(self, _: Shape) -> str:
+        return "SHAPE"
+
+
+def test_dispatches_on_exact_class() -> None:
+    assert ShapeNamer().visit(Circle()) == "circle"
+
+
+def test_falls_back_to_base_class_handler() -> None:
+    assert ShapeNamer().visit(Square()) == "shape"
+
+
+def test_subclass_overrides_handler_by_name() -> None:
+    assert LoudShapeNamer().visit(Square()) == "SHAPE"
+    assert ShapeNamer().visit(Square()) == "shape"
+
+
+def test_unhandled_class_uses_default_visit() -> None:
+    with pytest.raises(UnhandledNodeError) as error:
+        ShapeNamer().visit(Triangle())
+
+    assert diagnose(error.value).message == "Unhandled node (visitor 'ShapeNamer', node 'Triangle')"
@@ -0,0 +1,34 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from vdsh.core.compiler import CompileOptions, Compiler, CompileResult, compile  # noqa: A004
+    from vdsh.core.runner import ScriptRun, ScriptRunner, run_many
+
+_EXPORTS = {
+    "CompileOptions": "vdsh.core.compiler",
+    "CompileResult": "vdsh.core.compiler",
+    "Compiler": "vdsh.core.compiler",
+    "ScriptRun": "vdsh.core.runner",
+    "ScriptRunner": "vdsh.core.runner",
+    "compile": "vdsh.core.compiler",
+    "run_many": "vdsh.core.runner",
+}
+
+__all__ = [
+    "CompileOptions",
+    "CompileResult",
+    "Compiler",
+    "ScriptRun",
+    "ScriptRunner",
+    "compile",
+    "run_many",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # The library API is imported on first use, so the CLI's daemon client keeps starting quickly
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,17 @@
-import typer
+import sys
 
-from vdsh.cli.commands import build_app, misc_app, parse_app, run_app, tokenize_app
+from vdsh.cli.daemon import forward
 
-app = typer.Typer()
 
-for sub_app in [build_app, parse_app, tokenize_app, run_app, misc_app]:
-    app.add_typer(sub_app)
+def main() -> None:
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from vdsh.cli.app import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
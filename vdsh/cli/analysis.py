@@ -0,0 +1,41 @@
+from rich.console import Group
+from rich.table import Table
+
+from vdsh.core.pipeline.cost import CostEntry, CostReport, ShellCost
+
+
+def _cost_table(title: str, entries: list[CostEntry], source_lines: list[str]) -> Table:
+    table = Table(title=title)
+
+    table.add_column("Location")
+    table.add_column("Name")
+    table.add_column("Source")
+    table.add_column("Forks", justify="right")
+    table.add_column("Subshells", justify="right")
+    table.add_column("Arithmetic", justify="right")
+
+    for entry in entries:
+        start, end = entry.start, entry.end
+        table.add_row(
+            f"{start.row}:{start.column}-{end.row}:{end.column}",
+            entry.label,
+            source_lines[start.row - 1].strip() if start.row <= len(source_lines) else "",
+            str(entry.cost.forks),
+            str(entry.cost.subshells),
+            str(entry.cost.arithmetic_expansions),
+        )
+
+    return table
+
+
+def render_cost_report(report: CostReport, source: str) -> Group:
+    lines = source.splitlines()
+    statements = [entry for entry in report.statements if entry.cost != ShellCost()]
+    total = report.total
+
+    return Group(
+        _cost_table("Functions", report.functions, lines),
+        _cost_table("Statements", statements, lines),
+        f"Total: {total.forks} forks, {total.subshells} subshells, "
+        f"{total.arithmetic_expansions} arithmetic expansions",
+    )
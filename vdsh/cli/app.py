@@ -0,0 +1,30 @@
+import typer
+
+from vdsh.cli.commands import (
+    analyze_app,
+    build_app,
+    daemon_app,
+    eval_app,
+    lsp_app,
+    misc_app,
+    parse_app,
+    run_app,
+    run_many_app,
+    tokenize_app,
+)
+
+app = typer.Typer()
+
+for sub_app in [
+    build_app,
+    parse_app,
+    tokenize_app,
+    run_app,
+    run_many_app,
+    eval_app,
+    analyze_app,
+    daemon_app,
+    lsp_app,
+    misc_app,
+]:
+    app.add_typer(sub_app)
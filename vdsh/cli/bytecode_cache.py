@@ -0,0 +1,54 @@
+import contextlib
+import hashlib
+import os
+from pathlib import Path
+
+from vdsh.__version__ import __VERSION__
+from vdsh.core.errors import InvalidBytecodeCacheError
+from vdsh.core.models.bytecode import BYTECODE_VERSION, BytecodeProgram
+from vdsh.core.pipeline import OptimizationLevel
+from vdsh.core.serialization import dumps_bytecode, loads_bytecode
+
+BYTECODE_CACHE_SUFFIX = ".vdshc"
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = "VDSH_CACHE_DIR"
+XDG_CACHE_ENVIRONMENT_VARIABLE = "XDG_CACHE_HOME"
+CACHE_DIRECTORY_NAME = "vdsh"
+
+
+def cache_directory() -> Path:
+    """`$VDSH_CACHE_DIR`, or a `vdsh` directory in the user's cache directory"""
+    if path := os.environ.get(CACHE_DIRECTORY_ENVIRONMENT_VARIABLE):
+        return Path(path)
+
+    user_cache = os.environ.get(XDG_CACHE_ENVIRONMENT_VARIABLE) or Path.home() / ".cache"
+
+    return Path(user_cache) / CACHE_DIRECTORY_NAME
+
+
+def bytecode_cache_path(source_path: Path) -> Path:
+    """The cache of a source in `cache_directory()`, named after the source's absolute path"""
+    key = hashlib.sha256(str(source_path.resolve()).encode()).hexdigest()
+
+    return cache_directory() / f"{key}{BYTECODE_CACHE_SUFFIX}"
+
+
+def source_digest(source: str, optimization_level: OptimizationLevel) -> bytes:
+    """Everything the compiled bytecode depends on: the source, the passes and the compiler"""
+    key = f"{__VERSION__}\0{BYTECODE_VERSION}\0{optimization_level.value}\0{source}"
+
+    return hashlib.sha256(key.encode()).digest()
+
+
+def load_cached_bytecode(path: Path, digest: bytes) -> BytecodeProgram | None:
+    """The cached program, or None if there is no cache or it is stale or corrupted"""
+    try:
+        return loads_bytecode(path.read_bytes(), digest)
+    except (OSError, InvalidBytecodeCacheError):
+        return None
+
+
+def store_bytecode(path: Path, program: BytecodeProgram, digest: bytes) -> None:
+    """Writes a cache, skipping it silently where the cache directory is not writable"""
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(dumps_bytecode(program, digest))
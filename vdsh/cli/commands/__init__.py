@@ -1,7 +1,23 @@
+from vdsh.cli.commands.analyze import analyze_app
 from vdsh.cli.commands.build import build_app
+from vdsh.cli.commands.daemon import daemon_app
+from vdsh.cli.commands.eval import eval_app
+from vdsh.cli.commands.lsp import lsp_app
 from vdsh.cli.commands.misc import misc_app
 from vdsh.cli.commands.parse import parse_app
 from vdsh.cli.commands.run import run_app
+from vdsh.cli.commands.run_many import run_many_app
 from vdsh.cli.commands.tokenize import tokenize_app
 
-__all__ = ["build_app", "misc_app", "parse_app", "run_app", "tokenize_app"]
+__all__ = [
+    "analyze_app",
+    "build_app",
+    "daemon_app",
+    "eval_app",
+    "lsp_app",
+    "misc_app",
+    "parse_app",
+    "run_app",
+    "run_many_app",
+    "tokenize_app",
+]
@@ -0,0 +1,37 @@
+from typing import Annotated
+
+import typer
+
+from vdsh.cli.analysis import render_cost_report
+from vdsh.cli.context import create_context
+from vdsh.core.errors import ForkBudgetExceededError, VDSHError
+from vdsh.core.pipeline.backends import Target, create_code_generator
+from vdsh.core.pipeline.code_generator import CallingConvention
+
+analyze_app = typer.Typer()
+
+
+@analyze_app.command("analyze")
+def analyze(
+    src: Annotated[str, typer.Argument()],
+    verbose: Annotated[bool, typer.Option()] = False,
+    code: Annotated[bool, typer.Option()] = False,
+    target: Annotated[Target, typer.Option()] = Target.BASH,
+    max_forks: Annotated[int | None, typer.Option()] = None,
+    calling_convention: Annotated[CallingConvention, typer.Option()] = CallingConvention.REGISTER,
+) -> None:
+    context = create_context(verbose=verbose, code=code, src=src, target=target)
+    code_generator = create_code_generator(target, calling_convention)
+    pipeline = context.create_pipeline(code_generator=code_generator)
+    logger = context.create_logger()
+
+    try:
+        pipeline.run()
+        report = code_generator.cost_report
+        logger.print(render_cost_report(report, context.data))
+
+        if max_forks is not None and report.total.forks > max_forks:
+            raise ForkBudgetExceededError(forks=report.total.forks, max_forks=max_forks)
+    except VDSHError as e:
+        logger.error(e)
+        raise typer.Exit(code=1) from e
@@ -1,9 +1,17 @@
+import json
+from pathlib import Path
 from typing import Annotated
 
 import typer
 
 from vdsh.cli.context import create_context
-from vdsh.core.errors import VDSHError
+from vdsh.cli.statistics import render_pass_statistics
+from vdsh.core.errors import InvalidProfileError, VDSHError
+from vdsh.core.models.call_profile import CallProfile
+from vdsh.core.pipeline import OptimizationLevel, PassManager
+from vdsh.core.pipeline.backends import Target, create_code_generator
+from vdsh.core.pipeline.code_generator import DEFAULT_MEMO_MAX_ENTRIES
+from vdsh.core.pipeline.pass_manager import DEFAULT_OPTIMIZATION_LEVEL
 
 build_app = typer.Typer()
 
@@ -13,12 +21,38 @@ def build(
     src: Annotated[str, typer.Argument()],
     verbose: Annotated[bool, typer.Option()] = False,
     code: Annotated[bool, typer.Option()] = False,
+    target: Annotated[Target, typer.Option()] = Target.BASH,
+    optimization_level: Annotated[
+        OptimizationLevel,
+        typer.Option("-O", "--optimization-level"),
+    ] = DEFAULT_OPTIMIZATION_LEVEL,
+    memo_max_entries: Annotated[int, typer.Option(min=1)] = DEFAULT_MEMO_MAX_ENTRIES,
+    pass_statistics: Annotated[bool, typer.Option()] = False,
+    source_map: Annotated[Path | None, typer.Option()] = None,
+    use_profile: Annotated[Path | None, typer.Option()] = None,
 ) -> None:
-    context = create_context(verbose=verbose, code=code, src=src)
-    pipeline = context.create_pipeline()
+    context = create_context(verbose=verbose, code=code, src=src, target=target)
+    code_generator = create_code_generator(target, memo_max_entries=memo_max_entries)
     logger = context.create_logger()
 
     try:
-        logger.print(pipeline.run())
+        call_profile = None
+        if use_profile is not None:
+            try:
+                profile_data = json.loads(use_profile.read_text())
+            except ValueError as error:
+                raise InvalidProfileError(reason="call profile is not valid JSON") from error
+
+            call_profile = CallProfile.from_json(profile_data)
+
+        pass_manager = PassManager.from_level(optimization_level, call_profile)
+        pipeline = context.create_pipeline(code_generator=code_generator, optimizer=pass_manager)
+        logger.print_script(pipeline.run())
+
+        if pass_statistics:
+            logger.print(render_pass_statistics(pass_manager), stderr=True)
+
+        if source_map is not None:
+            source_map.write_text(json.dumps(code_generator.source_map.to_json()))
     except VDSHError as e:
         logger.error(e)
@@ -0,0 +1,32 @@
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from vdsh.cli.daemon import DEFAULT_IDLE_TIMEOUT, default_socket_path
+from vdsh.cli.daemon.server import CompileServer
+from vdsh.cli.logger import Logger
+
+daemon_app = typer.Typer()
+
+
+@daemon_app.command("daemon")
+def daemon(
+    socket_path: Annotated[Path | None, typer.Option("--socket")] = None,
+    idle_timeout: Annotated[float, typer.Option()] = DEFAULT_IDLE_TIMEOUT,
+    workers: Annotated[int | None, typer.Option()] = None,
+) -> None:
+    logger = Logger()
+    server = CompileServer(
+        socket_path=socket_path or default_socket_path(),
+        idle_timeout=idle_timeout,
+        workers=workers,
+    )
+
+    if server.is_running():
+        logger.warning(f"A daemon is already listening on {server.socket_path}")
+        return
+
+    logger.info(f"Listening on {server.socket_path}")
+    server.serve_forever()
+    logger.info(f"No requests for {idle_timeout} seconds, shutting down")
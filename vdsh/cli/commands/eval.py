@@ -0,0 +1,79 @@
+from enum import Enum
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from vdsh.cli.bytecode_cache import (
+    bytecode_cache_path,
+    load_cached_bytecode,
+    source_digest,
+    store_bytecode,
+)
+from vdsh.cli.context import Context, create_context
+from vdsh.core.errors import VDSHError
+from vdsh.core.models.bytecode import BytecodeProgram
+from vdsh.core.pipeline import OptimizationLevel, PassManager
+from vdsh.core.pipeline.bytecode_compiler import BytecodeCompiler
+from vdsh.core.pipeline.interpreter import Interpreter, Value
+from vdsh.core.pipeline.pass_manager import DEFAULT_OPTIMIZATION_LEVEL
+from vdsh.core.pipeline.vm import VirtualMachine
+
+eval_app = typer.Typer()
+
+
+class Engine(Enum):
+    TREE = "tree"
+    BYTECODE = "bytecode"
+
+
+def _compile(
+    context: Context,
+    optimization_level: OptimizationLevel,
+    cache_path: Path | None,
+) -> BytecodeProgram:
+    digest = source_digest(context.data, optimization_level)
+
+    if cache_path is not None:
+        program = load_cached_bytecode(cache_path, digest)
+        if program is not None:
+            return program
+
+    pipeline = context.create_pipeline(optimizer=PassManager.from_level(optimization_level))
+    program = BytecodeCompiler().transform(pipeline.lower())
+
+    if cache_path is not None:
+        store_bytecode(cache_path, program, digest)
+
+    return program
+
+
+@eval_app.command("eval")
+def eval_(
+    src: Annotated[str, typer.Argument()],
+    verbose: Annotated[bool, typer.Option()] = False,
+    code: Annotated[bool, typer.Option()] = False,
+    optimization_level: Annotated[
+        OptimizationLevel,
+        typer.Option("-O", "--optimization-level"),
+    ] = DEFAULT_OPTIMIZATION_LEVEL,
+    engine: Annotated[Engine, typer.Option()] = Engine.BYTECODE,
+    bytecode_cache: Annotated[bool, typer.Option()] = True,
+) -> None:
+    context = create_context(verbose=verbose, code=code, src=src)
+    logger = context.create_logger()
+    cache_path = bytecode_cache_path(Path(src)) if bytecode_cache and not code else None
+
+    try:
+        variables: dict[str, Value]
+
+        if engine == Engine.BYTECODE:
+            program = _compile(context, optimization_level, cache_path)
+            variables = VirtualMachine().transform(program)
+        else:
+            pipeline = context.create_pipeline(optimizer=PassManager.from_level(optimization_level))
+            variables = Interpreter().transform(pipeline.lower())
+
+        logger.pretty_print(variables)
+    except VDSHError as e:
+        logger.error(e)
@@ -0,0 +1,18 @@
+import asyncio
+from typing import Annotated
+
+import typer
+
+from vdsh.cli.lsp import DEFAULT_DEBOUNCE, LanguageServer, serve_stdio
+
+lsp_app = typer.Typer()
+
+
+@lsp_app.command("lsp")
+def lsp(
+    debounce: Annotated[float, typer.Option(min=0)] = DEFAULT_DEBOUNCE,
+) -> None:
+    """Runs a language server over stdio, stdout only carries protocol messages"""
+    exit_code = asyncio.run(serve_stdio(LanguageServer(debounce=debounce)))
+
+    raise typer.Exit(code=exit_code)
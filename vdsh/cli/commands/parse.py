@@ -1,9 +1,14 @@
+import sys
+from pathlib import Path
 from typing import Annotated
 
 import typer
 
 from vdsh.cli.context import create_context
-from vdsh.core.errors import ParserError
+from vdsh.cli.output import OutputFormat, write_json, write_json_lines
+from vdsh.core.errors import ParserError, TokenizerError
+from vdsh.core.models.ast import ProgramNode
+from vdsh.core.serialization import dump, to_json
 
 parse_app = typer.Typer()
 
@@ -14,12 +19,35 @@ def parse(
     verbose: Annotated[bool, typer.Option()] = False,
     code: Annotated[bool, typer.Option()] = False,
     oneline: Annotated[bool, typer.Option()] = False,
+    emit_ast: Annotated[Path | None, typer.Option()] = None,
+    output_format: Annotated[OutputFormat, typer.Option("--format")] = OutputFormat.RICH,
 ) -> None:
+    if emit_ast is not None and output_format != OutputFormat.RICH:
+        raise typer.BadParameter("cannot be combined with --emit-ast", param_hint="--format")
+
     context = create_context(verbose=verbose, code=code, src=src)
     parser = context.create_parser()
     logger = context.create_logger()
 
     try:
-        logger.pretty_print(parser.create(), oneline=oneline)
-    except ParserError as e:
-        logger.error(e)
+        ast = parser.create()
+    except (ParserError, TokenizerError) as e:
+        if output_format == OutputFormat.RICH:
+            logger.error(e)
+            return
+
+        logger.error(e, stderr=True)
+        raise typer.Exit(code=1) from e
+
+    if emit_ast is not None:
+        with emit_ast.open("wb") as file:
+            dump(ast, file)
+
+        logger.info(f"AST written to {emit_ast}")
+    elif output_format == OutputFormat.JSONL:
+        # One top-level statement per line, so consumers can stream large programs
+        write_json_lines(ast.statements if isinstance(ast, ProgramNode) else [ast], sys.stdout)
+    elif output_format == OutputFormat.JSON:
+        write_json(to_json(ast), sys.stdout)
+    else:
+        logger.pretty_print(ast, oneline=oneline)
@@ -1,26 +1,117 @@
-from typing import Annotated
+import json
+import os
 import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Annotated
 
 import typer
 
 from vdsh.cli.context import create_context
-from vdsh.core.errors import VDSHError
+from vdsh.cli.profile import render_profile
+from vdsh.cli.source_map import annotate_error
+from vdsh.cli.statistics import render_pass_statistics
+from vdsh.core.errors import InterpreterError, VDSHError
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.pipeline import OptimizationLevel, PassManager
+from vdsh.core.pipeline.backends import ProfilingCodeGenerator, Target, create_code_generator
+from vdsh.core.pipeline.backends.profiling import (
+    PROFILE_FILE_VARIABLE,
+    collect_call_profile,
+    read_profile,
+)
+from vdsh.core.pipeline.bytecode_compiler import BytecodeCompiler
+from vdsh.core.pipeline.code_generator import DEFAULT_MEMO_MAX_ENTRIES
+from vdsh.core.pipeline.pass_manager import DEFAULT_OPTIMIZATION_LEVEL
+from vdsh.core.pipeline.vm import VirtualMachine
 
 run_app = typer.Typer()
 
 
+def _try_interpreter(ast: BaseASTNode) -> bool:
+    """
+    Runs `ast` in-process, only with `--interpret` since the VM's semantics are not the target
+    shell's. The type checker only lets through calls to functions the program defines, so it has
+    no side effects and on an interpreter error the caller can still run the script with the shell
+    and get its diagnostics.
+    """
+    try:
+        VirtualMachine().transform(BytecodeCompiler().transform(ast))
+    except InterpreterError:
+        return False
+
+    return True
+
+
 @run_app.command("run")
 def run(
     src: Annotated[str, typer.Argument()],
     verbose: Annotated[bool, typer.Option()] = False,
     code: Annotated[bool, typer.Option()] = False,
+    target: Annotated[Target, typer.Option()] = Target.BASH,
+    optimization_level: Annotated[
+        OptimizationLevel,
+        typer.Option("-O", "--optimization-level"),
+    ] = DEFAULT_OPTIMIZATION_LEVEL,
+    memo_max_entries: Annotated[int, typer.Option(min=1)] = DEFAULT_MEMO_MAX_ENTRIES,
+    pass_statistics: Annotated[bool, typer.Option()] = False,
+    profile: Annotated[Path | None, typer.Option()] = None,
+    collect_profile: Annotated[Path | None, typer.Option()] = None,
+    interpret: Annotated[bool, typer.Option()] = False,
 ) -> None:
-    context = create_context(verbose=verbose, code=code, src=src)
-    pipeline = context.create_pipeline()
+    context = create_context(verbose=verbose, code=code, src=src, target=target)
     logger = context.create_logger()
 
+    instrumented = profile is not None or collect_profile is not None
+    if instrumented and target != Target.BASH:
+        logger.warning("Profiling relies on EPOCHREALTIME and needs the bash target")
+        return
+
+    if collect_profile is not None:
+        # Inlined and memoized calls never reach the instrumentation, so count calls unoptimized
+        optimization_level = OptimizationLevel.O0
+
+    profiler = ProfilingCodeGenerator(memo_max_entries) if instrumented else None
+    code_generator = profiler or create_code_generator(target, memo_max_entries=memo_max_entries)
+    pass_manager = PassManager.from_level(optimization_level)
+    pipeline = context.create_pipeline(code_generator=code_generator, optimizer=pass_manager)
+
     try:
-        bash = pipeline.run()
-        subprocess.run(["bash", "-c", bash])
+        ast = pipeline.lower()
+        if pass_statistics:
+            logger.print(render_pass_statistics(pass_manager), stderr=True)
+
+        if interpret and not instrumented and _try_interpreter(ast):
+            return
+
+        script = code_generator.transform(ast)
+
+        with tempfile.TemporaryDirectory() as directory:
+            profile_path = profile or Path(directory) / "vdsh.profile"
+            environment = os.environ | {PROFILE_FILE_VARIABLE: str(profile_path)}
+            with subprocess.Popen(
+                [target.value, "-c", script],
+                env=environment if profiler is not None else None,
+                stderr=subprocess.PIPE,
+                text=True,
+            ) as process:
+                assert process.stderr is not None
+                # Annotated as they come, so errors show up while the script is still running
+                for line in process.stderr:
+                    sys.stderr.write(
+                        annotate_error(line, code_generator.source_map, "<code>" if code else src),
+                    )
+                    sys.stderr.flush()
+
+            if profiler is not None:
+                entries = read_profile(profile_path, profiler.spans)
+
+                if profile is not None:
+                    logger.print(render_profile(entries, context.data))
+
+                if collect_profile is not None:
+                    call_profile = collect_call_profile(entries)
+                    collect_profile.write_text(json.dumps(call_profile.to_json()))
     except VDSHError as e:
         logger.error(e)
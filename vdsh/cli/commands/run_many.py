@@ -0,0 +1,65 @@
+import asyncio
+import sys
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from vdsh.cli.logger import Logger
+from vdsh.cli.statistics import render_script_runs
+from vdsh.core.compiler import CompileOptions, Compiler
+from vdsh.core.pipeline import OptimizationLevel
+from vdsh.core.pipeline.backends import Target
+from vdsh.core.pipeline.code_generator import DEFAULT_MEMO_MAX_ENTRIES
+from vdsh.core.pipeline.pass_manager import DEFAULT_OPTIMIZATION_LEVEL
+from vdsh.core.runner import DEFAULT_MAX_CONCURRENCY, OutputStream, run_many
+
+run_many_app = typer.Typer()
+
+
+def _print_output(name: str, stream: OutputStream, line: str) -> None:
+    file = sys.stdout if stream == OutputStream.STDOUT else sys.stderr
+    print(f"[{name}] {line}", file=file, flush=True)
+
+
+@run_many_app.command("run-many")
+def run_many_(
+    srcs: Annotated[list[Path], typer.Argument()],
+    verbose: Annotated[bool, typer.Option()] = False,
+    target: Annotated[Target, typer.Option()] = Target.BASH,
+    optimization_level: Annotated[
+        OptimizationLevel,
+        typer.Option("-O", "--optimization-level"),
+    ] = DEFAULT_OPTIMIZATION_LEVEL,
+    memo_max_entries: Annotated[int, typer.Option(min=1)] = DEFAULT_MEMO_MAX_ENTRIES,
+    jobs: Annotated[int, typer.Option("-j", "--jobs", min=1)] = DEFAULT_MAX_CONCURRENCY,
+    timeout: Annotated[float | None, typer.Option(min=0)] = None,
+) -> None:
+    logger = Logger(verbose=verbose)
+    options = CompileOptions(
+        target=target,
+        optimization_level=optimization_level,
+        memo_max_entries=memo_max_entries,
+    )
+    compiler = Compiler(options)
+    sources = {str(src): src.read_text() for src in srcs}
+
+    runs = asyncio.run(
+        run_many(
+            sources,
+            compiler=compiler,
+            max_concurrency=jobs,
+            timeout=timeout,
+            on_output=_print_output,
+        ),
+    )
+
+    for run in runs:
+        if run.error is not None:
+            logger.warning(f"{run.name} did not compile")
+            Logger(verbose=verbose, source=sources[run.name], source_name=run.name).error(run.error)
+
+    logger.print(render_script_runs(runs), stderr=True)
+
+    if not all(run.succeeded for run in runs):
+        raise typer.Exit(code=1)
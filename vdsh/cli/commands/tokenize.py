@@ -1,26 +1,55 @@
+import sys
+from collections.abc import Iterator
 from typing import Annotated
 
 import typer
 
-from vdsh.cli.context import create_context
+from vdsh.cli.context import Context, create_context
+from vdsh.cli.output import OutputFormat, write_json, write_json_lines
 from vdsh.core.errors import TokenizerError
+from vdsh.core.models.token import BaseToken
+from vdsh.core.pipeline.parallel_tokenizer import tokenize_parallel
+from vdsh.core.serialization import to_json
 
 tokenize_app = typer.Typer()
 
 
+def _read_tokens(context: Context, jobs: int) -> Iterator[BaseToken]:
+    if jobs > 1:
+        yield from tokenize_parallel(context.data, jobs=jobs)
+        return
+
+    tokenizer = context.create_token_iterator()
+    while not tokenizer.is_over():
+        yield tokenizer.next()
+
+
 @tokenize_app.command("tokenize")
 def tokenize(
     src: Annotated[str, typer.Argument()],
     verbose: Annotated[bool, typer.Option()] = False,
     code: Annotated[bool, typer.Option()] = False,
     oneline: Annotated[bool, typer.Option()] = False,
+    output_format: Annotated[OutputFormat, typer.Option("--format")] = OutputFormat.RICH,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=1)] = 1,
 ) -> None:
     context = create_context(verbose=verbose, code=code, src=src)
-    tokenizer = context.create_token_iterator()
     logger = context.create_logger()
 
+    if output_format == OutputFormat.RICH:
+        try:
+            for token in _read_tokens(context, jobs):
+                logger.pretty_print(token, oneline=oneline)
+        except TokenizerError as e:
+            logger.error(e)
+
+        return
+
     try:
-        while not tokenizer.is_over():
-            logger.pretty_print(tokenizer.next(), oneline=oneline)
+        if output_format == OutputFormat.JSONL:
+            write_json_lines(_read_tokens(context, jobs), sys.stdout)
+        else:
+            write_json([to_json(token) for token in _read_tokens(context, jobs)], sys.stdout)
     except TokenizerError as e:
-        logger.error(e)
+        logger.error(e, stderr=True)
+        raise typer.Exit(code=1) from e
@@ -1,16 +1,21 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-from vdsh.cli.logger import Logger
+from vdsh.cli.logger import DEFAULT_SOURCE_NAME, Logger
 from vdsh.core.iterator import BaseIterator, SequenceIterator
+from vdsh.core.models.ast import BaseASTNode
 from vdsh.core.models.token import BaseToken
-from vdsh.core.pipeline import CodeGenerator, Optimizer, Parser, Pipeline, Tokenizer, TypeChecker
+from vdsh.core.pipeline import Optimizer, Parser, Pipeline, Tokenizer, TypeChecker
+from vdsh.core.pipeline.backends import Target, create_code_generator
+from vdsh.core.types import BaseTransformer
 
 
 @dataclass
 class Context:
     verbose: bool
     data: str
+    target: Target = Target.BASH
+    name: str = DEFAULT_SOURCE_NAME
 
     def create_token_iterator(self) -> BaseIterator[BaseToken]:
         return Tokenizer(char_iterator=SequenceIterator(self.data))
@@ -18,20 +23,26 @@ class Context:
     def create_parser(self) -> Parser:
         return Parser(token_iterator=self.create_token_iterator())
 
-    def create_pipeline(self) -> Pipeline:
+    def create_pipeline(
+        self,
+        code_generator: BaseTransformer[BaseASTNode, str] | None = None,
+        optimizer: BaseTransformer[BaseASTNode, BaseASTNode] | None = None,
+    ) -> Pipeline:
         return Pipeline(
             parser=self.create_parser(),
-            optimizer=Optimizer(),
+            optimizer=optimizer or Optimizer(),
             type_checker=TypeChecker(),
-            code_generator=CodeGenerator(),
+            code_generator=code_generator or create_code_generator(self.target),
         )
 
     def create_logger(self) -> Logger:
-        return Logger(verbose=self.verbose)
+        return Logger(verbose=self.verbose, source=self.data, source_name=self.name)
 
 
-def create_context(verbose: bool, code: bool, src: str) -> Context:
+def create_context(verbose: bool, code: bool, src: str, target: Target = Target.BASH) -> Context:
     return Context(
         verbose=verbose,
         data=src if code else Path(src).read_text(),
+        target=target,
+        name=DEFAULT_SOURCE_NAME if code else src,
     )
@@ -0,0 +1,4 @@
+from vdsh.cli.daemon.client import forward
+from vdsh.cli.daemon.protocol import DEFAULT_IDLE_TIMEOUT, default_socket_path
+
+__all__ = ["DEFAULT_IDLE_TIMEOUT", "default_socket_path", "forward"]
@@ -0,0 +1,83 @@
+import socket
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from vdsh.cli.daemon.protocol import (
+    CompileRequest,
+    CompileResponse,
+    decode_response,
+    default_socket_path,
+    encode,
+    is_trusted_socket,
+    receive_all,
+)
+
+FORWARDED_COMMAND = "build"
+RESPONSE_TIMEOUT = 60.0
+
+
+def parse_build_arguments(argv: Sequence[str]) -> CompileRequest | None:
+    if not argv or argv[0] != FORWARDED_COMMAND:
+        return None
+
+    src: str | None = None
+    code = False
+
+    for argument in argv[1:]:
+        if argument in ("--code", "--no-code"):
+            code = argument == "--code"
+        elif argument.startswith("-") or src is not None:
+            return None
+        else:
+            src = argument
+
+    if src is None:
+        return None
+
+    try:
+        source = src if code else Path(src).read_text()
+    except OSError:
+        return None
+
+    return CompileRequest(source=source)
+
+
+def request_compilation(request: CompileRequest, socket_path: Path) -> CompileResponse | None:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(RESPONSE_TIMEOUT)
+            connection.connect(str(socket_path))
+            connection.sendall(encode(request))
+            connection.shutdown(socket.SHUT_WR)
+
+            response = decode_response(receive_all(connection))
+    except (OSError, ValueError, TypeError):
+        return None
+
+    return response if response.accepted else None
+
+
+def forward(argv: Sequence[str], socket_path: Path | None = None) -> int | None:
+    """
+    Compiles through a running daemon, returns `None` when the full CLI should handle `argv`. A
+    socket that another user could have created or replaced is never connected to.
+    """
+    socket_path = socket_path or default_socket_path()
+    if not is_trusted_socket(socket_path):
+        return None
+
+    request = parse_build_arguments(argv)
+    if request is None:
+        return None
+
+    response = request_compilation(request, socket_path)
+    if response is None:
+        return None
+
+    if response.error is not None:
+        sys.stdout.write(f"[!] {response.error}\n")
+    else:
+        sys.stdout.write(f"{response.output}\n")
+
+    return 0
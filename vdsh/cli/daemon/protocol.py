@@ -0,0 +1,81 @@
+import json
+import os
+import socket
+import stat
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from vdsh.__version__ import __VERSION__
+
+SOCKET_ENVIRONMENT_VARIABLE = "VDSH_DAEMON_SOCKET"
+RUNTIME_DIRECTORY_ENVIRONMENT_VARIABLE = "XDG_RUNTIME_DIR"
+SOCKET_NAME = "vdsh.sock"
+SOCKET_DIRECTORY_PERMISSIONS = 0o700
+DEFAULT_IDLE_TIMEOUT = 300.0
+MESSAGE_ENCODING = "utf-8"
+
+
+def default_socket_path() -> Path:
+    """
+    The socket in the user's runtime directory, or in a `vdsh-<uid>` directory under the temporary
+    directory that the daemon creates with `SOCKET_DIRECTORY_PERMISSIONS`
+    """
+    if path := os.environ.get(SOCKET_ENVIRONMENT_VARIABLE):
+        return Path(path)
+
+    if runtime_directory := os.environ.get(RUNTIME_DIRECTORY_ENVIRONMENT_VARIABLE):
+        return Path(runtime_directory) / SOCKET_NAME
+
+    return Path(tempfile.gettempdir()) / f"vdsh-{os.getuid()}" / SOCKET_NAME
+
+
+def is_trusted_socket(path: Path) -> bool:
+    """
+    Whether `path` is a socket of the current user that no one else can write to. Anyone can create
+    a socket in a shared directory first, and its server would then decide what the client outputs.
+    """
+    try:
+        status = path.lstat()
+    except OSError:
+        return False
+
+    return (
+        stat.S_ISSOCK(status.st_mode)
+        and status.st_uid == os.getuid()
+        and not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+@dataclass
+class CompileRequest:
+    source: str
+    version: str = __VERSION__
+
+
+@dataclass
+class CompileResponse:
+    output: str = ""
+    error: str | None = None
+    accepted: bool = True
+
+
+def encode(message: CompileRequest | CompileResponse) -> bytes:
+    return json.dumps(asdict(message)).encode(MESSAGE_ENCODING)
+
+
+def decode_request(data: bytes) -> CompileRequest:
+    return CompileRequest(**json.loads(data.decode(MESSAGE_ENCODING)))
+
+
+def decode_response(data: bytes) -> CompileResponse:
+    return CompileResponse(**json.loads(data.decode(MESSAGE_ENCODING)))
+
+
+def receive_all(connection: socket.socket) -> bytes:
+    chunks = []
+
+    while chunk := connection.recv(1 << 16):
+        chunks.append(chunk)
+
+    return b"".join(chunks)
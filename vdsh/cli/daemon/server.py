@@ -0,0 +1,116 @@
+import contextlib
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from vdsh.__version__ import __VERSION__
+from vdsh.cli.context import Context
+from vdsh.cli.daemon.protocol import (
+    DEFAULT_IDLE_TIMEOUT,
+    SOCKET_DIRECTORY_PERMISSIONS,
+    CompileRequest,
+    CompileResponse,
+    decode_request,
+    encode,
+    receive_all,
+)
+from vdsh.cli.logger import DEFAULT_SOURCE_NAME
+from vdsh.core.diagnostics import LineIndex, diagnose, render_diagnostic
+from vdsh.core.errors import VDSHError
+
+ACCEPT_POLL_INTERVAL = 0.5
+CONNECTION_TIMEOUT = 30.0
+SOCKET_PERMISSIONS = 0o600
+
+
+class CompileServer:
+    def __init__(
+        self,
+        socket_path: Path,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        workers: int | None = None,
+    ) -> None:
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._active_requests = 0
+        self._last_activity = time.monotonic()
+
+    def is_running(self) -> bool:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.connect(str(self.socket_path))
+        except OSError:
+            return False
+
+        return True
+
+    def serve_forever(self) -> None:
+        directory = self.socket_path.parent
+        directory.mkdir(mode=SOCKET_DIRECTORY_PERMISSIONS, parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+
+        with (
+            socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener,
+            ThreadPoolExecutor(max_workers=self.workers) as executor,
+        ):
+            listener.bind(str(self.socket_path))
+            self.socket_path.chmod(SOCKET_PERMISSIONS)
+            listener.listen()
+            listener.settimeout(ACCEPT_POLL_INTERVAL)
+            self._last_activity = time.monotonic()
+
+            try:
+                while not self._is_idle():
+                    try:
+                        connection, _ = listener.accept()
+                    except TimeoutError:
+                        continue
+
+                    self._begin_request()
+                    executor.submit(self._handle, connection)
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+
+    def _is_idle(self) -> bool:
+        with self._lock:
+            return (
+                self._active_requests == 0
+                and time.monotonic() - self._last_activity > self.idle_timeout
+            )
+
+    def _begin_request(self) -> None:
+        with self._lock:
+            self._active_requests += 1
+            self._last_activity = time.monotonic()
+
+    def _end_request(self) -> None:
+        with self._lock:
+            self._active_requests -= 1
+            self._last_activity = time.monotonic()
+
+    def _handle(self, connection: socket.socket) -> None:
+        try:
+            with connection, contextlib.suppress(OSError, ValueError, TypeError):
+                connection.settimeout(CONNECTION_TIMEOUT)
+                request = decode_request(receive_all(connection))
+                connection.sendall(encode(self._compile(request)))
+        finally:
+            self._end_request()
+
+    def _compile(self, request: CompileRequest) -> CompileResponse:
+        if request.version != __VERSION__:
+            return CompileResponse(accepted=False)
+
+        pipeline = Context(verbose=False, data=request.source).create_pipeline()
+
+        try:
+            return CompileResponse(output=pipeline.run())
+        except VDSHError as error:
+            lines = LineIndex(request.source)
+            return CompileResponse(
+                error=render_diagnostic(diagnose(error), lines, DEFAULT_SOURCE_NAME),
+            )
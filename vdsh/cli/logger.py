@@ -1,17 +1,34 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
-from rich.console import Console
+from rich.console import Console, RenderableType
 from rich.pretty import pprint
 
+from vdsh.core.diagnostics import LineIndex, diagnose, render_diagnostic
 from vdsh.core.errors import VDSHError
 
 console = Console()
+error_console = Console(stderr=True)
+
+
+DEFAULT_SOURCE_NAME = "<code>"
 
 
 @dataclass
 class Logger:
+    """
+    Reports errors against `source` when it is given. The source is only indexed once an error is
+    actually reported, so a successful run never pays for it.
+    """
+
     verbose: bool = False
+    source: str | None = None
+    source_name: str = DEFAULT_SOURCE_NAME
+
+    @cached_property
+    def _line_index(self) -> LineIndex:
+        return LineIndex(self.source or "")
 
     def info(self, message: str) -> None:
         console.print(f"[bold green]\\[+][/bold green] {message}")
@@ -19,9 +36,14 @@ class Logger:
     def warning(self, message: str) -> None:
         console.print(f"[bold yellow]\\[!][/bold yellow] {message}")
 
-    def error(self, value: VDSHError) -> None:
-        console.print("[bold red]\\[!][/bold red] ", end="")
-        pprint(value)
+    def error(self, value: VDSHError, stderr: bool = False) -> None:
+        output = error_console if stderr else console
+        output.print("[bold red]\\[!][/bold red] ", end="")
+        if self.source is None:
+            pprint(value, console=output)
+        else:
+            rendered = render_diagnostic(diagnose(value), self._line_index, self.source_name)
+            output.print(rendered, markup=False, highlight=False)
 
         if self.verbose:
             raise value
@@ -29,5 +51,9 @@ class Logger:
     def pretty_print(self, value: Any, oneline: bool = False) -> None:
         pprint(value, expand_all=not oneline)
 
-    def print(self, value: str) -> None:
-        console.print(value)
+    def print(self, value: RenderableType, stderr: bool = False) -> None:
+        (error_console if stderr else console).print(value)
+
+    def print_script(self, script: str) -> None:
+        """Prints generated code as is: rich would read `[@]` as markup and wrap long lines"""
+        console.print(script, markup=False, highlight=False, soft_wrap=True)
@@ -0,0 +1,3 @@
+from vdsh.cli.lsp.server import DEFAULT_DEBOUNCE, LanguageServer, serve_stdio
+
+__all__ = ["DEFAULT_DEBOUNCE", "LanguageServer", "serve_stdio"]
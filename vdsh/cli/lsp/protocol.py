@@ -0,0 +1,84 @@
+import asyncio
+import json
+from typing import Any, BinaryIO
+
+from vdsh.core.diagnostics import Diagnostic
+from vdsh.core.models.position import Position
+
+MESSAGE_ENCODING = "utf-8"
+CONTENT_LENGTH_HEADER = b"content-length"
+HEADER_SEPARATOR = b":"
+
+JSONRPC_VERSION = "2.0"
+METHOD_NOT_FOUND = -32601
+INVALID_REQUEST = -32600
+
+# `TextDocumentSyncKind.Incremental`, clients send the changed range instead of the whole text
+INCREMENTAL_SYNC = 2
+ERROR_SEVERITY = 1
+DIAGNOSTIC_SOURCE = "vdsh"
+
+type Message = dict[str, Any]
+
+
+async def read_message(reader: asyncio.StreamReader) -> Message | None:
+    """Reads one `Content-Length` framed message, None once the client closed the stream"""
+    length = None
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            return None
+
+        line = line.strip()
+        if not line:
+            break
+
+        name, _, value = line.partition(HEADER_SEPARATOR)
+        if name.strip().lower() == CONTENT_LENGTH_HEADER:
+            length = int(value)
+
+    if length is None:
+        raise ValueError("Message has no Content-Length header")
+
+    try:
+        body = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+
+    message: Message = json.loads(body.decode(MESSAGE_ENCODING))
+    return message
+
+
+def encode_message(message: Message) -> bytes:
+    body = json.dumps({"jsonrpc": JSONRPC_VERSION, **message}).encode(MESSAGE_ENCODING)
+
+    return b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+
+
+def write_message(output: BinaryIO, message: Message) -> None:
+    output.write(encode_message(message))
+    output.flush()
+
+
+def to_lsp_position(position: Position) -> dict[str, int]:
+    return {"line": position.row - 1, "character": position.column - 1}
+
+
+def to_lsp_diagnostic(diagnostic: Diagnostic) -> dict[str, Any]:
+    """
+    LSP positions are 0-based with an exclusive end, spans are 1-based and inclusive. Errors
+    without a span are reported on the first character of the document.
+    """
+    start = diagnostic.start or Position(row=1, column=1)
+    end = diagnostic.end or start
+
+    return {
+        "range": {
+            "start": to_lsp_position(start),
+            "end": {"line": end.row - 1, "character": end.column},
+        },
+        "severity": ERROR_SEVERITY,
+        "source": DIAGNOSTIC_SOURCE,
+        "message": diagnostic.message,
+    }
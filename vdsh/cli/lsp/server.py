@@ -0,0 +1,281 @@
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from vdsh.__version__ import __VERSION__
+from vdsh.cli.lsp.protocol import (
+    INCREMENTAL_SYNC,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    Message,
+    read_message,
+    to_lsp_diagnostic,
+    write_message,
+)
+from vdsh.core.diagnostics import Diagnostic, diagnose
+from vdsh.core.errors import TypeCheckerError, VDSHError
+from vdsh.core.pipeline.incremental import (
+    IncrementalTypeChecker,
+    ParsedSource,
+    TextEdit,
+    combine_edits,
+    parse_source,
+    reparse,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_DEBOUNCE = 0.15
+SERVER_NAME = "vdsh"
+UTF32_ENCODING = "utf-32"
+
+
+@dataclass
+class Document:
+    """
+    An open document. `parsed` is the last successful parse and `pending` the edits made since,
+    in order, so the next analysis only re-parses what they touched, even after failed ones.
+    """
+
+    uri: str
+    text: str
+    version: int
+    parsed: ParsedSource | None = None
+    pending: list[TextEdit] = field(default_factory=list)
+    type_checker: IncrementalTypeChecker = field(default_factory=IncrementalTypeChecker)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass(frozen=True)
+class Analysis:
+    """`parsed` is None if `text` did not parse, the previous parse is then kept as the cache"""
+
+    parsed: ParsedSource | None
+    diagnostics: list[Diagnostic]
+
+
+def analyze(
+    text: str,
+    parsed: ParsedSource | None,
+    edits: list[TextEdit],
+    type_checker: IncrementalTypeChecker,
+) -> Analysis:
+    """
+    Parses `text` by re-parsing `parsed` where `edits` changed it. The edits are combined into one
+    first, since the text in between them, halfway through typing something, rarely parses.
+    """
+    try:
+        if parsed is None:
+            parsed = parse_source(text)
+        else:
+            parsed = reparse(parsed, combine_edits(parsed.source, edits, text))
+    except VDSHError as error:
+        return Analysis(parsed=None, diagnostics=[diagnose(error)])
+
+    try:
+        type_checker.validate(parsed.tree)
+    except TypeCheckerError as error:
+        return Analysis(parsed=parsed, diagnostics=[diagnose(error)])
+
+    return Analysis(parsed=parsed, diagnostics=[])
+
+
+def _offset(text: str, position: dict[str, int]) -> int:
+    start = 0
+    for _ in range(position["line"]):
+        newline = text.find("\n", start)
+        if newline == -1:
+            return len(text)
+        start = newline + 1
+
+    line_end = text.find("\n", start)
+    return min(start + position["character"], len(text) if line_end == -1 else line_end)
+
+
+class LanguageServer:
+    """
+    A language server for `.vdsh` documents. Messages are handled on the event loop, while parsing
+    and type checking run on a worker thread once a document has not changed for `debounce`
+    seconds, so requests are answered right away however large the documents are.
+    """
+
+    def __init__(self, debounce: float = DEFAULT_DEBOUNCE) -> None:
+        self.debounce = debounce
+        self.documents: dict[str, Document] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._output: BinaryIO = sys.stdout.buffer
+        self._shutting_down = False
+        self._exited = False
+
+        self._requests: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "initialize": self._initialize,
+            "shutdown": self._shutdown,
+        }
+        self._notifications: dict[str, Callable[[dict[str, Any]], None]] = {
+            "exit": self._exit,
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didClose": self._did_close,
+        }
+
+    async def serve(self, reader: asyncio.StreamReader, output: BinaryIO) -> int:
+        """Serves until the client exits, returns the exit code the protocol asks for"""
+        self._output = output
+
+        try:
+            while not self._exited:
+                message = await read_message(reader)
+                if message is None:
+                    break
+
+                self._dispatch(message)
+        finally:
+            for document in self.documents.values():
+                if document.timer is not None:
+                    document.timer.cancel()
+            for task in list(self._tasks):
+                task.cancel()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+        return 0 if self._shutting_down else 1
+
+    def _dispatch(self, message: Message) -> None:
+        method = message.get("method")
+        params = message.get("params") or {}
+
+        if "id" not in message:
+            handler = self._notifications.get(method or "")
+            if handler is not None:
+                handler(params)
+            return
+
+        request = self._requests.get(method or "")
+        if request is None:
+            self._send_error(message["id"], METHOD_NOT_FOUND, f"Unknown method {method}")
+        elif self._shutting_down:
+            self._send_error(message["id"], INVALID_REQUEST, "The server is shutting down")
+        else:
+            self._send({"id": message["id"], "result": request(params)})
+
+    def _send(self, message: Message) -> None:
+        write_message(self._output, message)
+
+    def _send_error(self, request_id: Any, code: int, message: str) -> None:
+        self._send({"id": request_id, "error": {"code": code, "message": message}})
+
+    def _initialize(self, params: dict[str, Any]) -> dict[str, Any]:
+        capabilities: dict[str, Any] = {
+            "textDocumentSync": {"openClose": True, "change": INCREMENTAL_SYNC},
+        }
+
+        # Columns count code points, which only differ from the UTF-16 default outside of the BMP
+        encodings = params.get("capabilities", {}).get("general", {}).get("positionEncodings", [])
+        if UTF32_ENCODING in encodings:
+            capabilities["positionEncoding"] = UTF32_ENCODING
+
+        return {
+            "capabilities": capabilities,
+            "serverInfo": {"name": SERVER_NAME, "version": __VERSION__},
+        }
+
+    def _shutdown(self, _: dict[str, Any]) -> None:
+        self._shutting_down = True
+
+    def _exit(self, _: dict[str, Any]) -> None:
+        self._exited = True
+
+    def _did_open(self, params: dict[str, Any]) -> None:
+        item = params["textDocument"]
+        document = Document(uri=item["uri"], text=item["text"], version=item.get("version", 0))
+        self.documents[document.uri] = document
+        self._schedule_analysis(document)
+
+    def _did_change(self, params: dict[str, Any]) -> None:
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return
+
+        for change in params["contentChanges"]:
+            if "range" in change:
+                start = _offset(document.text, change["range"]["start"])
+                end = _offset(document.text, change["range"]["end"])
+            else:
+                start, end = 0, len(document.text)
+
+            document.pending.append(TextEdit(start=start, end=end, text=change["text"]))
+            document.text = document.text[:start] + change["text"] + document.text[end:]
+
+        document.version = params["textDocument"].get("version", document.version)
+        self._schedule_analysis(document)
+
+    def _did_close(self, params: dict[str, Any]) -> None:
+        document = self.documents.pop(params["textDocument"]["uri"], None)
+        if document is None:
+            return
+
+        if document.timer is not None:
+            document.timer.cancel()
+        self._publish(document.uri, None, [])
+
+    def _schedule_analysis(self, document: Document) -> None:
+        """Analyzes `document` once it stopped changing for `debounce` seconds"""
+        if document.timer is not None:
+            document.timer.cancel()
+
+        loop = asyncio.get_running_loop()
+        document.timer = loop.call_later(self.debounce, self._start_analysis, document)
+
+    def _start_analysis(self, document: Document) -> None:
+        document.timer = None
+        task = asyncio.create_task(self._analyze(document))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _analyze(self, document: Document) -> None:
+        # One analysis per document at a time, each one starting from what the previous one parsed
+        async with document.lock:
+            text = document.text
+            version = document.version
+            edits = list(document.pending)
+
+            loop = asyncio.get_running_loop()
+            analysis = await loop.run_in_executor(
+                self._executor,
+                analyze,
+                text,
+                document.parsed,
+                edits,
+                document.type_checker,
+            )
+
+            # Edits are only dropped once a parse includes them, or if there was nothing to apply them to
+            if analysis.parsed is not None or document.parsed is None:
+                del document.pending[: len(edits)]
+            if analysis.parsed is not None:
+                document.parsed = analysis.parsed
+
+        if self.documents.get(document.uri) is document:
+            self._publish(document.uri, version, analysis.diagnostics)
+
+    def _publish(self, uri: str, version: int | None, diagnostics: list[Diagnostic]) -> None:
+        params: dict[str, Any] = {
+            "uri": uri,
+            "diagnostics": [to_lsp_diagnostic(diagnostic) for diagnostic in diagnostics],
+        }
+        if version is not None:
+            params["version"] = version
+
+        self._send({"method": "textDocument/publishDiagnostics", "params": params})
+
+
+async def serve_stdio(server: LanguageServer) -> int:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    return await server.serve(reader, sys.stdout.buffer)
@@ -0,0 +1,46 @@
+import json
+from collections.abc import Iterable
+from enum import Enum
+from typing import Any, TextIO
+
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.models.token import BaseToken
+from vdsh.core.serialization import to_json
+
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+_encode = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+
+class OutputFormat(Enum):
+    RICH = "rich"
+    JSON = "json"
+    JSONL = "jsonl"
+
+
+def write_json_lines(values: Iterable[BaseASTNode | BaseToken], file: TextIO) -> None:
+    """Writes one compact JSON object per line, in chunks of about `OUTPUT_BUFFER_SIZE` characters"""
+    lines: list[str] = []
+    size = 0
+
+    try:
+        for value in values:
+            line = _encode(to_json(value))
+            lines.append(line)
+            size += len(line) + 1
+
+            if size >= OUTPUT_BUFFER_SIZE:
+                file.write("\n".join(lines) + "\n")
+                lines.clear()
+                size = 0
+    finally:
+        # Values read before an error are still written, so consumers see where it happened
+        if lines:
+            file.write("\n".join(lines) + "\n")
+
+        file.flush()
+
+
+def write_json(value: Any, file: TextIO) -> None:
+    file.write(_encode(value) + "\n")
+    file.flush()
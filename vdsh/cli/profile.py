@@ -0,0 +1,31 @@
+from rich.table import Table
+
+from vdsh.core.pipeline.backends.profiling import ProfileEntry
+
+MICROSECONDS_PER_MILLISECOND = 1000
+
+
+def render_profile(entries: list[ProfileEntry], source: str) -> Table:
+    lines = source.splitlines()
+    table = Table(title="VDSH profile")
+
+    table.add_column("Location")
+    table.add_column("Span")
+    table.add_column("Source")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total (ms)", justify="right")
+    table.add_column("Per call (ms)", justify="right")
+
+    for entry in entries:
+        start, end = entry.span.start, entry.span.end
+        total = entry.total_microseconds / MICROSECONDS_PER_MILLISECOND
+        table.add_row(
+            f"{start.row}:{start.column}-{end.row}:{end.column}",
+            entry.span.label,
+            lines[start.row - 1].strip() if start.row <= len(lines) else "",
+            str(entry.calls),
+            f"{total:.3f}",
+            f"{total / entry.calls:.3f}" if entry.calls else "-",
+        )
+
+    return table
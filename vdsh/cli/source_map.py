@@ -0,0 +1,26 @@
+import re
+
+from vdsh.core.models.source_map import SourceMap
+
+# bash reports `bash: line 3: ...`, dash and other POSIX shells `sh: 3: ...`
+SHELL_ERROR_LINE_PATTERN = re.compile(r"\bline ([0-9]+):|^[^:\s]+: ([0-9]+): ")
+
+
+def annotate_error(line: str, source_map: SourceMap, source_name: str) -> str:
+    """Appends the VDSH source position to `line` if it is a shell error that names a script line"""
+    match = SHELL_ERROR_LINE_PATTERN.search(line)
+    mapping = source_map.lookup(int(match.group(1) or match.group(2))) if match else None
+    if mapping is None:
+        return line
+
+    message = line.rstrip("\n")
+    location = f"(at {source_name}:{mapping.start.row}:{mapping.start.column})"
+
+    return f"{message} {location}{line[len(message) :]}"
+
+
+def annotate_errors(stderr: str, source_map: SourceMap, source_name: str) -> str:
+    """Appends the VDSH source position to every shell error that names a script line"""
+    return "".join(
+        annotate_error(line, source_map, source_name) for line in stderr.splitlines(keepends=True)
+    )
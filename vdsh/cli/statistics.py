@@ -0,0 +1,50 @@
+from rich.table import Table
+
+from vdsh.core.pipeline import PassManager
+from vdsh.core.runner import ScriptRun
+
+MILLISECONDS_PER_SECOND = 1000
+
+
+def render_pass_statistics(pass_manager: PassManager) -> Table:
+    table = Table(title=f"Optimization passes ({pass_manager.iterations} iterations)")
+
+    table.add_column("Pass")
+    table.add_column("Runs", justify="right")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Node delta", justify="right")
+
+    for statistics in pass_manager.statistics:
+        table.add_row(
+            statistics.name,
+            str(statistics.runs),
+            f"{statistics.seconds * MILLISECONDS_PER_SECOND:.3f}",
+            f"{statistics.node_delta:+d}",
+        )
+
+    return table
+
+
+def _describe_run(run: ScriptRun) -> str:
+    if run.error is not None:
+        return f"[red]{type(run.error).__name__}[/red]"
+    if run.timed_out:
+        return "[red]timed out[/red]"
+    if run.succeeded:
+        return "[green]ok[/green]"
+
+    return f"[red]exit {run.exit_code}[/red]"
+
+
+def render_script_runs(runs: list[ScriptRun]) -> Table:
+    failed = sum(not run.succeeded for run in runs)
+    table = Table(title=f"Scripts ({len(runs)} run, {failed} failed)")
+
+    table.add_column("Script")
+    table.add_column("Status")
+    table.add_column("Time (ms)", justify="right")
+
+    for run in runs:
+        table.add_row(run.name, _describe_run(run), f"{run.seconds * MILLISECONDS_PER_SECOND:.1f}")
+
+    return table
@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.call_profile import CallProfile
+from vdsh.core.models.source_map import SourceMap
+from vdsh.core.pipeline import OptimizationLevel, Parser, PassManager, Pipeline, Tokenizer
+from vdsh.core.pipeline.backends import Target, create_code_generator
+from vdsh.core.pipeline.code_generator import DEFAULT_MEMO_MAX_ENTRIES, CallingConvention
+from vdsh.core.pipeline.pass_manager import DEFAULT_OPTIMIZATION_LEVEL
+from vdsh.core.pipeline.type_checker import TypeChecker
+
+
+@dataclass(frozen=True)
+class CompileOptions:
+    target: Target = Target.BASH
+    optimization_level: OptimizationLevel = DEFAULT_OPTIMIZATION_LEVEL
+    calling_convention: CallingConvention = CallingConvention.REGISTER
+    memo_max_entries: int | None = DEFAULT_MEMO_MAX_ENTRIES
+    profile: CallProfile | None = None
+
+
+@dataclass(frozen=True)
+class CompileResult:
+    script: str
+    source_map: SourceMap = field(default_factory=SourceMap)
+
+
+class Compiler:
+    """
+    Compiles VDSH sources to shell scripts with fixed `options`. Every compilation builds its own
+    pipeline and the only state stages share are idempotent dispatch and schema caches, so one
+    compiler can be reused and called from many threads at once.
+    """
+
+    def __init__(self, options: CompileOptions | None = None) -> None:
+        self.options = options or CompileOptions()
+
+    def compile(self, source: str) -> CompileResult:
+        code_generator = create_code_generator(
+            self.options.target,
+            self.options.calling_convention,
+            self.options.memo_max_entries,
+        )
+        pipeline = Pipeline(
+            parser=Parser(token_iterator=Tokenizer(char_iterator=SequenceIterator(source))),
+            optimizer=PassManager.from_level(self.options.optimization_level, self.options.profile),
+            type_checker=TypeChecker(),
+            code_generator=code_generator,
+        )
+        script = pipeline.run()
+
+        return CompileResult(script=script, source_map=code_generator.source_map)
+
+    async def compile_async(self, source: str, executor: Executor | None = None) -> CompileResult:
+        """
+        Compiles on `executor`, the event loop's default thread pool if None. Compiling is CPU
+        bound, so a `ProcessPoolExecutor` is what lets many compilations actually run in parallel.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(executor, self.compile, source)
+
+
+def compile(source: str, *, options: CompileOptions | None = None) -> CompileResult:  # noqa: A001
+    """Compiles one VDSH source. Use a `Compiler` to compile many with the same options."""
+    return Compiler(options).compile(source)
@@ -0,0 +1,122 @@
+import re
+from dataclasses import dataclass, fields, is_dataclass
+from enum import Enum
+
+from vdsh.core.errors import VDSHError
+from vdsh.core.models.position import Position
+from vdsh.core.models.token import BaseToken
+
+WORD_BOUNDARY_PATTERN = re.compile(r"(?<=[a-z])(?=[A-Z])")
+ERROR_SUFFIX = "Error"
+SPAN_TOKEN_FIELDS = ("actual", "token", "identifier", "opening_token")
+
+
+@dataclass(frozen=True)
+class Diagnostic:
+    message: str
+    start: Position | None = None
+    end: Position | None = None
+
+
+class LineIndex:
+    """
+    Finds source lines by row. Line starts are only scanned as far as the furthest row asked for,
+    so locating an error near the top of a huge file does not index the rest of it.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self._starts = [0]
+        self._complete = False
+
+    def _scan_to(self, row: int) -> None:
+        while len(self._starts) <= row and not self._complete:
+            newline = self.source.find("\n", self._starts[-1])
+            if newline == -1:
+                self._complete = True
+            else:
+                self._starts.append(newline + 1)
+
+    def line(self, row: int) -> str | None:
+        """The 1-based line `row` without its newline, None past the end of the source"""
+        self._scan_to(row)
+        if row < 1 or row > len(self._starts):
+            return None
+
+        start = self._starts[row - 1]
+        end = self._starts[row] - 1 if row < len(self._starts) else len(self.source)
+
+        return self.source[start:end]
+
+
+def _describe(error: VDSHError) -> str:
+    name = type(error).__name__.removesuffix(ERROR_SUFFIX)
+    message = " ".join(WORD_BOUNDARY_PATTERN.split(name)).capitalize()
+    if not is_dataclass(error):
+        return message
+
+    details = []
+    for item in fields(error):
+        value = getattr(error, item.name)
+        if isinstance(value, BaseToken | Position):
+            continue
+
+        value = value.value if isinstance(value, Enum) else value
+        details.append(f"{item.name.replace('_', ' ')} {value!r}")
+
+    return f"{message} ({', '.join(details)})" if details else message
+
+
+def _span(error: VDSHError) -> tuple[Position, Position] | None:
+    start = getattr(error, "start", None) or getattr(error, "position", None)
+    if isinstance(start, Position):
+        end = getattr(error, "end", None)
+        return start, end if isinstance(end, Position) else start
+
+    for name in SPAN_TOKEN_FIELDS:
+        token = getattr(error, name, None)
+        if isinstance(token, BaseToken):
+            return token.start, token.end
+
+    return None
+
+
+def diagnose(error: VDSHError) -> Diagnostic:
+    """
+    A message and source span for `error`, read from its own fields only: errors keep tokens and
+    positions rather than subtrees, so this costs the same however large the program is
+    """
+    span = _span(error)
+    if span is None:
+        return Diagnostic(message=_describe(error))
+
+    return Diagnostic(message=_describe(error), start=span[0], end=span[1])
+
+
+def render_diagnostic(diagnostic: Diagnostic, lines: LineIndex, source_name: str) -> str:
+    """Renders the message, then the offending source line with carets under the span"""
+    if diagnostic.start is None:
+        return diagnostic.message
+
+    start = diagnostic.start
+    end = diagnostic.end if diagnostic.end is not None else start
+    rendered = [diagnostic.message, f"  --> {source_name}:{start.row}:{start.column}"]
+
+    line = lines.line(start.row)
+    if line is None:
+        return "\n".join(rendered)
+
+    gutter = " " * len(str(start.row))
+    last_column = end.column if end.row == start.row else len(line)
+    padding = "".join(char if char == "\t" else " " for char in line[: start.column - 1])
+    carets = "^" * max(last_column - start.column + 1, 1)
+
+    rendered.extend(
+        [
+            f"{gutter} |",
+            f"{start.row} | {line}",
+            f"{gutter} | {padding}{carets}",
+        ],
+    )
+
+    return "\n".join(rendered)
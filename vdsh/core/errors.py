@@ -1,8 +1,7 @@
 from dataclasses import dataclass
 
 from vdsh.core.models import Position
-from vdsh.core.models.ast import BaseASTNode
-from vdsh.core.models.token import BaseToken, KeywordToken, Operator
+from vdsh.core.models.token import BaseToken, Operator, OperatorToken
 
 
 class VDSHError(Exception):
@@ -21,6 +20,22 @@ class ParserError(VDSHError):
     pass
 
 
+class SerializationError(VDSHError):
+    pass
+
+
+class TypeCheckerError(VDSHError):
+    pass
+
+
+class CodeGeneratorError(VDSHError):
+    pass
+
+
+class InterpreterError(VDSHError):
+    pass
+
+
 @dataclass
 class UnexpectedCharacterError(TokenizerError):
     char: str
@@ -49,7 +64,6 @@ class InvalidNumberError(TokenizerError):
 @dataclass
 class UnclosedParenError(ParserError):
     opening_token: BaseToken
-    parsed_value: BaseASTNode
     expected: Operator
     actual: BaseToken
 
@@ -92,6 +106,11 @@ class BlockMissingInitialBraceError(ParserError):
     actual: BaseToken
 
 
+@dataclass
+class BlockMissingClosingBraceError(ParserError):
+    actual: BaseToken
+
+
 @dataclass
 class MissingAssignmentStatementError(ParserError):
     identifier: BaseToken
@@ -110,3 +129,82 @@ class MissingRightParenInFuncDeclerationError(ParserError):
 @dataclass
 class MissingLeftParenInFuncDeclerationError(ParserError):
     actual: BaseToken
+
+
+@dataclass
+class MissingLeftParenInForError(ParserError):
+    actual: BaseToken
+
+
+@dataclass
+class MissingRightParenInForError(ParserError):
+    actual: BaseToken
+
+
+@dataclass
+class MissingRightParenInCallError(ParserError):
+    function_name: str
+    actual: BaseToken
+
+
+@dataclass
+class InvalidASTCacheError(SerializationError):
+    reason: str
+
+
+@dataclass
+class InvalidBytecodeCacheError(SerializationError):
+    reason: str
+
+
+@dataclass
+class UndefinedFunctionError(TypeCheckerError):
+    function_name: str
+
+
+class ReturnOutsideFunctionError(TypeCheckerError):
+    pass
+
+
+@dataclass
+class ArgumentCountMismatchError(TypeCheckerError):
+    function_name: str
+    expected: int
+    actual: int
+
+
+@dataclass
+class UnsupportedOperatorError(CodeGeneratorError):
+    operator: OperatorToken
+    target: str
+
+
+@dataclass
+class UnhandledNodeError(VDSHError):
+    visitor: str
+    node: str
+
+
+@dataclass
+class InvalidProfileError(VDSHError):
+    reason: str
+
+
+@dataclass
+class ForkBudgetExceededError(VDSHError):
+    forks: int
+    max_forks: int
+
+
+@dataclass
+class ArithmeticEvaluationError(InterpreterError):
+    reason: str
+
+
+class RecursionLimitError(InterpreterError):
+    pass
+
+
+@dataclass
+class UnknownFunctionError(InterpreterError):
+    function_name: str
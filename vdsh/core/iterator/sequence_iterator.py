@@ -5,9 +5,14 @@ from vdsh.core.iterator.base_iterator import BaseIterator
 
 
 class SequenceIterator[T](BaseIterator[T]):
-    def __init__(self, sequence: Sequence[T]) -> None:
+    def __init__(self, sequence: Sequence[T], start: int = 0) -> None:
         self.sequence = sequence
-        self._position = 0
+        self._position = start
+
+    @property
+    def offset(self) -> int:
+        """The index of the next item in `sequence`"""
+        return self._position
 
     def next(self) -> T:
         if self.is_over():
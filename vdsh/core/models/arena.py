@@ -0,0 +1,241 @@
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import cache
+from typing import Any
+
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.models.position import Position
+from vdsh.core.models.schema import FieldKind, ast_schema
+from vdsh.core.models.token import BaseToken, Operator, OperatorToken
+
+NO_ID = -1
+OPERATORS = list(Operator)
+OPERATOR_IDS = {operator: index for index, operator in enumerate(OPERATORS)}
+
+
+class Slot(IntEnum):
+    LEFT = 0
+    RIGHT = 1
+    TOKEN = 2
+    EXTRA = 3
+    EXTRA_LIST = 4
+
+
+@dataclass(frozen=True)
+class NodeLayout:
+    """Maps the fields of a node class onto the arena columns"""
+
+    cls: type[BaseASTNode]
+    slots: list[tuple[str, Slot, bool]]
+
+
+@cache
+def _node_kind_ids() -> dict[type[BaseASTNode], int]:
+    return {cls: index for index, cls in enumerate(ast_schema().node_kinds)}
+
+
+@cache
+def _token_kind_ids() -> dict[type[BaseToken], int]:
+    return {cls: index for index, cls in enumerate(ast_schema().token_kinds)}
+
+
+@cache
+def _layouts() -> list[NodeLayout]:
+    schema = ast_schema()
+    layouts = []
+
+    for cls in schema.node_kinds:
+        slots = []
+        free_node_slots = [Slot.LEFT, Slot.RIGHT]
+        free_token_slots = [Slot.TOKEN]
+
+        for plan in schema.plans[cls]:
+            if plan.kind == FieldKind.REFERENCE_LIST:
+                slots.append((plan.name, Slot.EXTRA_LIST, plan.is_token))
+            elif plan.kind in (FieldKind.REFERENCE, FieldKind.OPTIONAL_REFERENCE):
+                free = free_token_slots if plan.is_token else free_node_slots
+                slots.append((plan.name, free.pop(0) if free else Slot.EXTRA, plan.is_token))
+            else:
+                raise TypeError(f"Field {cls.__qualname__}.{plan.name} does not fit the arena")
+
+        layouts.append(NodeLayout(cls=cls, slots=slots))
+
+    return layouts
+
+
+@dataclass
+class ASTArena:
+    """
+    A flat, array-backed AST. Nodes and tokens are integer ids into parallel columns and a node
+    is always stored after its children, so `range(len(arena))` visits the tree bottom-up.
+    """
+
+    kinds: array[int] = field(default_factory=lambda: array("i"))
+    operators: array[int] = field(default_factory=lambda: array("i"))
+    lefts: array[int] = field(default_factory=lambda: array("i"))
+    rights: array[int] = field(default_factory=lambda: array("i"))
+    tokens: array[int] = field(default_factory=lambda: array("i"))
+    extras: array[int] = field(default_factory=lambda: array("i"))
+    extra_data: array[int] = field(default_factory=lambda: array("i"))
+
+    token_kinds: array[int] = field(default_factory=lambda: array("i"))
+    token_start_rows: array[int] = field(default_factory=lambda: array("i"))
+    token_start_columns: array[int] = field(default_factory=lambda: array("i"))
+    token_end_rows: array[int] = field(default_factory=lambda: array("i"))
+    token_end_columns: array[int] = field(default_factory=lambda: array("i"))
+    token_values: array[int] = field(default_factory=lambda: array("i"))
+    values: list[Any] = field(default_factory=list)
+
+    _value_ids: dict[tuple[type, Any], int] = field(default_factory=dict, init=False, repr=False)
+    _token_ids: dict[int, int] = field(default_factory=dict, init=False, repr=False)
+
+    @classmethod
+    def from_ast(cls, root: BaseASTNode) -> "ASTArena":
+        arena = cls()
+        arena.add(root)
+
+        return arena
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def root(self) -> int:
+        return len(self.kinds) - 1
+
+    def to_ast(self) -> BaseASTNode:
+        return self.node(self.root)
+
+    def kind(self, node_id: int) -> type[BaseASTNode]:
+        return _layouts()[self.kinds[node_id]].cls
+
+    def operator(self, node_id: int) -> Operator | None:
+        operator = self.operators[node_id]
+        return None if operator == NO_ID else OPERATORS[operator]
+
+    def ids_of_kind(self, kind: type[BaseASTNode]) -> Iterator[int]:
+        kind_id = _node_kind_ids()[kind]
+
+        return (node_id for node_id, current in enumerate(self.kinds) if current == kind_id)
+
+    def add(self, node: BaseASTNode) -> int:
+        try:
+            return self._add_node(node)
+        finally:
+            self._token_ids.clear()
+
+    def _add_node(self, node: BaseASTNode) -> int:
+        kind_id = _node_kind_ids()[type(node)]
+        layout = _layouts()[kind_id]
+        columns = {Slot.LEFT: NO_ID, Slot.RIGHT: NO_ID, Slot.TOKEN: NO_ID}
+        extra: list[int] = []
+        operator = NO_ID
+
+        for name, slot, is_token in layout.slots:
+            value = getattr(node, name)
+
+            if slot == Slot.EXTRA_LIST:
+                extra.append(len(value))
+                extra.extend(self._add_reference(item, is_token) for item in value)
+            elif slot == Slot.EXTRA:
+                extra.append(self._add_reference(value, is_token))
+            else:
+                columns[slot] = self._add_reference(value, is_token)
+
+            if slot == Slot.TOKEN and isinstance(value, OperatorToken):
+                operator = OPERATOR_IDS[value.kind]
+
+        self.kinds.append(kind_id)
+        self.operators.append(operator)
+        self.lefts.append(columns[Slot.LEFT])
+        self.rights.append(columns[Slot.RIGHT])
+        self.tokens.append(columns[Slot.TOKEN])
+        self.extras.append(len(self.extra_data) if extra else NO_ID)
+        self.extra_data.extend(extra)
+
+        return len(self.kinds) - 1
+
+    def node(self, node_id: int) -> BaseASTNode:
+        layout = _layouts()[self.kinds[node_id]]
+        columns = {
+            Slot.LEFT: self.lefts[node_id],
+            Slot.RIGHT: self.rights[node_id],
+            Slot.TOKEN: self.tokens[node_id],
+        }
+        extra_position = self.extras[node_id]
+        arguments = []
+
+        for _, slot, is_token in layout.slots:
+            if slot == Slot.EXTRA_LIST:
+                count = self.extra_data[extra_position]
+                items = self.extra_data[extra_position + 1 : extra_position + 1 + count]
+                arguments.append([self._reference(item, is_token) for item in items])
+                extra_position += count + 1
+            elif slot == Slot.EXTRA:
+                arguments.append(self._reference(self.extra_data[extra_position], is_token))
+                extra_position += 1
+            else:
+                arguments.append(self._reference(columns[slot], is_token))
+
+        return layout.cls(*arguments)
+
+    def token(self, token_id: int) -> BaseToken:
+        schema = ast_schema()
+        cls = schema.token_kinds[self.token_kinds[token_id]]
+        start = Position(self.token_start_rows[token_id], self.token_start_columns[token_id])
+        end = Position(self.token_end_rows[token_id], self.token_end_columns[token_id])
+        value = self.token_values[token_id]
+
+        if value == NO_ID:
+            return cls(start, end)
+
+        return cls(start, end, self.values[value])  # type: ignore[call-arg]
+
+    def _reference(self, reference: int, is_token: bool) -> Any:
+        if reference == NO_ID:
+            return None
+
+        return self.token(reference) if is_token else self.node(reference)
+
+    def _add_reference(self, value: BaseASTNode | BaseToken | None, is_token: bool) -> int:
+        if value is None:
+            return NO_ID
+
+        if is_token and isinstance(value, BaseToken):
+            return self._add_token(value)
+
+        if isinstance(value, BaseASTNode):
+            return self._add_node(value)
+
+        raise TypeError(f"Unexpected value in AST: {value!r}")
+
+    def _add_token(self, token: BaseToken) -> int:
+        known = self._token_ids.get(id(token))
+        if known is not None:
+            return known
+
+        schema = ast_schema()
+        payload = schema.plans[type(token)][2:]
+        value = NO_ID
+
+        if payload:
+            raw = getattr(token, payload[0].name)
+            key = (type(raw), raw)
+            value = self._value_ids.get(key, NO_ID)
+
+            if value == NO_ID:
+                value = self._value_ids[key] = len(self.values)
+                self.values.append(raw)
+
+        self.token_kinds.append(_token_kind_ids()[type(token)])
+        self.token_start_rows.append(token.start.row)
+        self.token_start_columns.append(token.start.column)
+        self.token_end_rows.append(token.end.row)
+        self.token_end_columns.append(token.end.column)
+        self.token_values.append(value)
+
+        self._token_ids[id(token)] = len(self.token_kinds) - 1
+
+        return self._token_ids[id(token)]
@@ -8,8 +8,6 @@ from vdsh.core.models.token import (
     StringToken,
 )
 
-type StatementNode = LetStatementNode
-
 
 @dataclass(frozen=True)
 class BaseASTNode:
@@ -44,6 +42,12 @@ class BinaryOperationNode(BaseASTNode):
     operator: OperatorToken
 
 
+@dataclass(frozen=True)
+class CallNode(BaseASTNode):
+    identifier: IdentifierToken
+    arguments: list[BaseASTNode] = field(default_factory=list)
+
+
 @dataclass(frozen=True)
 class ArgumentNode(BaseASTNode):
     identifier: IdentifierToken
@@ -57,7 +61,7 @@ class ArgumentsNode(BaseASTNode):
 
 @dataclass(frozen=True)
 class BlockNode(BaseASTNode):
-    statements: list[StatementNode]
+    statements: list[BaseASTNode]
 
 
 @dataclass(frozen=True)
@@ -83,3 +87,53 @@ class FuncDeclerationNode(BaseASTNode):
 class FuncStatementNode(BaseASTNode):
     func: KeywordToken
     decelration: FuncDeclerationNode
+
+
+@dataclass(frozen=True)
+class MemoizedFuncStatementNode(BaseASTNode):
+    function: FuncStatementNode
+
+
+@dataclass(frozen=True)
+class IfStatementNode(BaseASTNode):
+    if_: KeywordToken
+    condition: BaseASTNode
+    block: BlockNode
+    else_block: BlockNode | None = None
+
+
+@dataclass(frozen=True)
+class WhileStatementNode(BaseASTNode):
+    while_: KeywordToken
+    condition: BaseASTNode
+    block: BlockNode
+
+
+@dataclass(frozen=True)
+class ForStatementNode(BaseASTNode):
+    for_: KeywordToken
+    initializer: BaseASTNode
+    condition: BaseASTNode
+    update: BaseASTNode
+    block: BlockNode
+
+
+@dataclass(frozen=True)
+class ContinueStatementNode(BaseASTNode):
+    pass
+
+
+@dataclass(frozen=True)
+class UnsetStatementNode(BaseASTNode):
+    identifiers: list[IdentifierToken]
+
+
+@dataclass(frozen=True)
+class ReturnStatementNode(BaseASTNode):
+    return_: KeywordToken
+    value: BaseASTNode | None = None
+
+
+@dataclass(frozen=True)
+class ProgramNode(BaseASTNode):
+    statements: list[BaseASTNode] = field(default_factory=list)
@@ -0,0 +1,79 @@
+from array import array
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+type Constant = int | str
+
+NO_OPERAND = 0
+# Bump whenever an opcode is added, removed or changes meaning, cached programs depend on it
+BYTECODE_VERSION = 2
+
+
+class Opcode(IntEnum):
+    LOAD_CONST = 0
+    LOAD_NAME = 1
+    STORE_NAME = 2
+    STORE_LOCAL = 3
+    POP = 4
+    JUMP = 5
+    JUMP_IF_FALSE = 6
+    CALL = 7
+    RETURN_VALUE = 8
+    RETURN = 9
+    DEFINE_FUNCTION = 10
+    DEFINE_MEMOIZED_FUNCTION = 11
+    HALT = 12
+    DELETE_NAME = 13
+
+    NEGATE = 20
+    POSITIVE = 21
+    NOT = 22
+
+    ADD = 30
+    SUBTRACT = 31
+    MULTIPLY = 32
+    DIVIDE = 33
+    REMAINDER = 34
+    POWER = 35
+    EQUALS = 36
+    NOT_EQUALS = 37
+    LESS = 38
+    LESS_EQUAL = 39
+    MORE = 40
+    MORE_EQUAL = 41
+
+
+@dataclass
+class CodeObject:
+    """
+    One function body, or the top level of a program. Instruction `i` is `opcodes[i]` applied to
+    `operands[i]`, which indexes the program's constants, names, call sites or functions.
+    """
+
+    name: str
+    parameters: list[int] = field(default_factory=list)
+    opcodes: array[int] = field(default_factory=lambda: array("B"))
+    operands: array[int] = field(default_factory=lambda: array("i"))
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def emit(self, opcode: Opcode, operand: int = NO_OPERAND) -> int:
+        self.opcodes.append(opcode)
+        self.operands.append(operand)
+
+        return len(self.opcodes) - 1
+
+    def patch(self, instruction: int, operand: int) -> None:
+        self.operands[instruction] = operand
+
+
+@dataclass
+class BytecodeProgram:
+    """A compiled program. Call sites are `(name, argument count)` pairs, the name indexing `names`"""
+
+    main: CodeObject
+    functions: list[CodeObject] = field(default_factory=list)
+    constants: list[Constant] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    call_sites: list[tuple[int, int]] = field(default_factory=list)
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from vdsh.core.errors import InvalidProfileError
+
+CALL_PROFILE_VERSION = 1
+DEFAULT_HOT_CALL_SHARE = 0.01
+
+
+@dataclass
+class CallProfile:
+    """Runtime call counts of VDSH functions, keyed by name so they survive a rebuild"""
+
+    calls: dict[str, int] = field(default_factory=dict)
+    hot_call_share: float = DEFAULT_HOT_CALL_SHARE
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def is_hot(self, name: str) -> bool:
+        calls = self.calls.get(name, 0)
+
+        return calls > 0 and calls >= self.total_calls * self.hot_call_share
+
+    def to_json(self) -> dict[str, Any]:
+        return {"version": CALL_PROFILE_VERSION, "calls": dict(self.calls)}
+
+    @classmethod
+    def from_json(cls, data: Any) -> "CallProfile":
+        if not isinstance(data, dict) or data.get("version") != CALL_PROFILE_VERSION:
+            raise InvalidProfileError(reason="unsupported call profile version")
+
+        calls = data.get("calls")
+        if not isinstance(calls, dict) or not all(
+            isinstance(name, str) and isinstance(count, int) for name, count in calls.items()
+        ):
+            raise InvalidProfileError(reason="call counts must map function names to integers")
+
+        return cls(calls)
@@ -0,0 +1,126 @@
+import types
+import zlib
+from dataclasses import dataclass, field, fields
+from enum import Enum, IntEnum
+from functools import cache
+from typing import Any, TypeAliasType, Union, get_args, get_origin, get_type_hints
+
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.models.position import Position
+from vdsh.core.models.token import BaseToken
+
+
+class FieldKind(IntEnum):
+    POSITION = 0
+    STRING = 1
+    FLOAT = 2
+    ENUM = 3
+    REFERENCE = 4
+    OPTIONAL_REFERENCE = 5
+    REFERENCE_LIST = 6
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    name: str
+    kind: FieldKind
+    is_token: bool = False
+    members: tuple[Enum, ...] = ()
+    indices: dict[Enum, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Schema:
+    token_kinds: list[type[BaseToken]]
+    node_kinds: list[type[BaseASTNode]]
+    plans: dict[type, list[FieldPlan]]
+    fingerprint: int
+
+
+def _all_subclasses[T](cls: type[T]) -> list[type[T]]:
+    subclasses = []
+    pending = [cls]
+
+    while pending:
+        current = pending.pop()
+        subclasses.append(current)
+        pending.extend(current.__subclasses__())
+
+    return sorted(subclasses, key=lambda subclass: subclass.__qualname__)
+
+
+def _resolve_alias(annotation: Any) -> Any:
+    while isinstance(annotation, TypeAliasType):
+        annotation = annotation.__value__
+
+    return annotation
+
+
+def _is_reference_type(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseASTNode | BaseToken)
+
+
+def _is_token_type(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseToken)
+
+
+def _plan_field(name: str, annotation: Any) -> FieldPlan:
+    annotation = _resolve_alias(annotation)
+    origin = get_origin(annotation)
+
+    if annotation is Position:
+        return FieldPlan(name, FieldKind.POSITION)
+    if annotation is str:
+        return FieldPlan(name, FieldKind.STRING)
+    if annotation is float:
+        return FieldPlan(name, FieldKind.FLOAT)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        members = tuple(annotation)
+        return FieldPlan(
+            name,
+            FieldKind.ENUM,
+            members=members,
+            indices={member: index for index, member in enumerate(members)},
+        )
+    if _is_reference_type(annotation):
+        return FieldPlan(name, FieldKind.REFERENCE, is_token=_is_token_type(annotation))
+    if origin is list:
+        item = _resolve_alias(get_args(annotation)[0])
+        if _is_reference_type(item):
+            return FieldPlan(name, FieldKind.REFERENCE_LIST, is_token=_is_token_type(item))
+    if origin in (Union, types.UnionType):
+        arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+        item = _resolve_alias(arguments[0])
+        if len(arguments) == 1 and _is_reference_type(item):
+            return FieldPlan(name, FieldKind.OPTIONAL_REFERENCE, is_token=_is_token_type(item))
+
+    raise TypeError(f"Cannot serialize field {name!r} of type {annotation!r}")
+
+
+@cache
+def ast_schema() -> Schema:
+    """Describes the fields of every token and node class, used by the flat AST encodings"""
+    token_kinds = _all_subclasses(BaseToken)
+    node_kinds = _all_subclasses(BaseASTNode)
+    plans = {}
+    description = []
+
+    kinds: list[type[BaseToken | BaseASTNode]] = [*token_kinds, *node_kinds]
+    for cls in kinds:
+        hints = get_type_hints(cls)
+        plans[cls] = [_plan_field(item.name, hints[item.name]) for item in fields(cls)]
+        description.append(
+            f"{cls.__qualname__}({','.join(f'{plan.name}:{plan.kind}' for plan in plans[cls])})",
+        )
+
+    for cls in token_kinds:
+        payload = plans[cls][2:]
+        if len(payload) > 1 or any(plan.kind == FieldKind.POSITION for plan in payload):
+            raise TypeError(f"Token {cls.__qualname__} does not fit the token table")
+
+    return Schema(
+        token_kinds=token_kinds,
+        node_kinds=node_kinds,
+        plans=plans,
+        fingerprint=zlib.crc32(";".join(description).encode()),
+    )
@@ -0,0 +1,76 @@
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from vdsh.core.models.position import Position
+
+SOURCE_MAP_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SourceMapping:
+    first_line: int
+    last_line: int
+    start: Position
+    end: Position
+
+
+@dataclass
+class SourceMap:
+    """Maps 1-based line ranges of a generated script to the VDSH source they came from"""
+
+    mappings: list[SourceMapping] = field(default_factory=list)
+
+    def lookup(self, line: int) -> SourceMapping | None:
+        containing = [
+            mapping for mapping in self.mappings if mapping.first_line <= line <= mapping.last_line
+        ]
+
+        return min(
+            containing,
+            key=lambda mapping: mapping.last_line - mapping.first_line,
+            default=None,
+        )
+
+    def shifted(self, offset: int) -> "SourceMap":
+        return SourceMap(
+            [
+                replace(
+                    mapping,
+                    first_line=mapping.first_line + offset,
+                    last_line=mapping.last_line + offset,
+                )
+                for mapping in self.mappings
+            ],
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": SOURCE_MAP_VERSION,
+            "mappings": [
+                [
+                    mapping.first_line,
+                    mapping.last_line,
+                    mapping.start.row,
+                    mapping.start.column,
+                    mapping.end.row,
+                    mapping.end.column,
+                ]
+                for mapping in self.mappings
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "SourceMap":
+        return cls(
+            [
+                SourceMapping(
+                    first_line,
+                    last_line,
+                    Position(start_row, start_column),
+                    Position(end_row, end_column),
+                )
+                for first_line, last_line, start_row, start_column, end_row, end_column in data[
+                    "mappings"
+                ]
+            ],
+        )
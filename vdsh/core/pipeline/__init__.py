@@ -1,8 +1,19 @@
 from vdsh.core.pipeline.code_generator import CodeGenerator
 from vdsh.core.pipeline.optimizer import Optimizer
 from vdsh.core.pipeline.parser import Parser
+from vdsh.core.pipeline.pass_manager import OptimizationLevel, PassManager, PassStatistics
 from vdsh.core.pipeline.pipeline import Pipeline
 from vdsh.core.pipeline.tokenizer import Tokenizer
 from vdsh.core.pipeline.type_checker import TypeChecker
 
-__all__ = ["CodeGenerator", "Optimizer", "Parser", "Pipeline", "Tokenizer", "TypeChecker"]
+__all__ = [
+    "CodeGenerator",
+    "OptimizationLevel",
+    "Optimizer",
+    "Parser",
+    "PassManager",
+    "PassStatistics",
+    "Pipeline",
+    "Tokenizer",
+    "TypeChecker",
+]
@@ -0,0 +1,40 @@
+from enum import Enum
+
+from vdsh.core.pipeline.backends.posix import PosixCodeGenerator
+from vdsh.core.pipeline.backends.profiling import ProfilingCodeGenerator
+from vdsh.core.pipeline.code_generator import (
+    DEFAULT_MEMO_MAX_ENTRIES,
+    CallingConvention,
+    CodeGenerator,
+)
+
+
+class Target(Enum):
+    BASH = "bash"
+    SH = "sh"
+
+
+BACKENDS: dict[Target, type[CodeGenerator]] = {
+    Target.BASH: CodeGenerator,
+    Target.SH: PosixCodeGenerator,
+}
+
+
+def create_code_generator(
+    target: Target = Target.BASH,
+    calling_convention: CallingConvention = CallingConvention.REGISTER,
+    memo_max_entries: int | None = DEFAULT_MEMO_MAX_ENTRIES,
+) -> CodeGenerator:
+    return BACKENDS[target](
+        calling_convention=calling_convention,
+        memo_max_entries=memo_max_entries,
+    )
+
+
+__all__ = [
+    "BACKENDS",
+    "PosixCodeGenerator",
+    "ProfilingCodeGenerator",
+    "Target",
+    "create_code_generator",
+]
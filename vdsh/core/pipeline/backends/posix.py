@@ -0,0 +1,43 @@
+from vdsh.core.errors import UnsupportedOperatorError
+from vdsh.core.models.ast import BinaryOperationNode, BlockNode, MemoizedFuncStatementNode
+from vdsh.core.models.token import Operator
+from vdsh.core.pipeline.code_generator import ArithmeticGenerator, CodeGenerator
+from vdsh.core.pipeline.cost import ARITHMETIC_EXPANSION_COST
+from vdsh.core.types import visits
+
+POSIX_TARGET_NAME = "sh"
+
+
+class PosixArithmeticGenerator(ArithmeticGenerator):
+    @visits(BinaryOperationNode)
+    def _generate_binary_operation(self, node: BinaryOperationNode) -> str:
+        if node.operator.kind == Operator.POWER:
+            raise UnsupportedOperatorError(operator=node.operator, target=POSIX_TARGET_NAME)
+
+        return super()._generate_binary_operation(node)
+
+
+class PosixCodeGenerator(CodeGenerator):
+    """Generates POSIX sh, relying only on `local` beyond the standard, as dash and ash do"""
+
+    def _create_arithmetic_generator(self) -> ArithmeticGenerator:
+        return PosixArithmeticGenerator(self)
+
+    def _generate_function_header(self, name: str) -> str:
+        return f"{name}() {{"
+
+    def _generate_test(self, condition: str) -> str:
+        self._costs.count(ARITHMETIC_EXPANSION_COST)
+        return f"[ $(({condition})) -ne 0 ]"
+
+    def _generate_arithmetic_command(self, expression: str) -> str:
+        self._costs.count(ARITHMETIC_EXPANSION_COST)
+        return f": $(({expression}))"
+
+    def _generate_counting_loop(self, condition: str, update: str, block: BlockNode) -> str:
+        body = self._generate_body(block, self._generate_arithmetic_command(update))
+
+        return f"while {self._generate_test(condition)}; do\n{body}\ndone"
+
+    def _generate_memoized_func_statement(self, node: MemoizedFuncStatementNode) -> str:
+        return self.visit(node.function)
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from vdsh.core.errors import InvalidProfileError
+from vdsh.core.models.ast import (
+    BaseASTNode,
+    FuncDeclerationNode,
+    FuncStatementNode,
+    MemoizedFuncStatementNode,
+    ProgramNode,
+)
+from vdsh.core.models.call_profile import CallProfile
+from vdsh.core.models.position import Position
+from vdsh.core.pipeline.code_generator import (
+    DEFAULT_MEMO_MAX_ENTRIES,
+    CallingConvention,
+    CodeGenerator,
+)
+from vdsh.core.pipeline.passes.tree import describe_statement, node_span
+
+PROFILE_FILE_VARIABLE = "VDSH_PROFILE_FILE"
+PROFILED_BODY_FORMAT = "{name}__PROFILED"
+PROFILE_START = "__VDSH_PROFILE_START"
+PROFILE_RECORD = "__VDSH_PROFILE_RECORD"
+PROFILE_PRELUDE = f"""declare -a __VDSH_PROFILE_CALLS=() __VDSH_PROFILE_TIMES=()
+function {PROFILE_RECORD}(){{
+local now=${{EPOCHREALTIME/[.,]/}}
+local start=${{2/[.,]/}}
+((__VDSH_PROFILE_CALLS[$1]+=1, __VDSH_PROFILE_TIMES[$1]+=now-start))
+}}
+function __VDSH_PROFILE_WRITE(){{
+local id
+for id in "${{!__VDSH_PROFILE_CALLS[@]}}"; do
+echo "$id ${{__VDSH_PROFILE_CALLS[$id]}} ${{__VDSH_PROFILE_TIMES[$id]}}"
+done > "${{{PROFILE_FILE_VARIABLE}:-vdsh.profile}}"
+}}
+trap __VDSH_PROFILE_WRITE EXIT"""
+
+
+@dataclass(frozen=True)
+class ProfileSpan:
+    label: str
+    start: Position
+    end: Position
+    function_name: str | None = None
+
+
+@dataclass(frozen=True)
+class ProfileEntry:
+    span: ProfileSpan
+    calls: int
+    total_microseconds: int
+
+
+class ProfilingCodeGenerator(CodeGenerator):
+    """Times every function and top-level statement with bash's `EPOCHREALTIME`"""
+
+    def __init__(self, memo_max_entries: int | None = DEFAULT_MEMO_MAX_ENTRIES) -> None:
+        super().__init__(
+            calling_convention=CallingConvention.REGISTER,
+            memo_max_entries=memo_max_entries,
+        )
+        self.spans: list[ProfileSpan] = []
+
+    def transform(self, data: BaseASTNode) -> str:
+        self.spans = []
+        code = super().transform(data)
+        self.source_map = self.source_map.shifted(PROFILE_PRELUDE.count("\n") + 1)
+
+        return PROFILE_PRELUDE + "\n" + code
+
+    def _add_span(
+        self,
+        label: str,
+        node: BaseASTNode,
+        function_name: str | None = None,
+    ) -> int | None:
+        span = node_span(node)
+        if span is None:
+            return None
+
+        self.spans.append(ProfileSpan(label, *span, function_name=function_name))
+        return len(self.spans) - 1
+
+    def _generate_function(self, name: str, declaration: FuncDeclerationNode) -> str:
+        function_name = declaration.identifier.name
+        span_id = self._add_span(f"func {function_name}", declaration, function_name)
+        body_name = PROFILED_BODY_FORMAT.format(name=name)
+
+        return "\n".join(
+            [
+                super()._generate_function(body_name, declaration),
+                self._generate_function_header(name),
+                f"local {PROFILE_START}=$EPOCHREALTIME",
+                f'{body_name} "$@"',
+                f"{PROFILE_RECORD} {span_id} ${PROFILE_START}",
+                "}",
+            ],
+        )
+
+    def _generate_program(self, node: ProgramNode) -> str:
+        lines = []
+
+        for statement in node.statements:
+            code = self._generate_statements([statement])
+            is_definition = isinstance(statement, FuncStatementNode | MemoizedFuncStatementNode)
+            span_id = (
+                None if is_definition else self._add_span(describe_statement(statement), statement)
+            )
+
+            if span_id is None:
+                lines.append(code)
+            else:
+                lines.extend(
+                    [
+                        f"{PROFILE_START}=$EPOCHREALTIME",
+                        code,
+                        f"{PROFILE_RECORD} {span_id} ${PROFILE_START}",
+                    ],
+                )
+
+        return "\n".join(lines)
+
+
+def read_profile(path: Path, spans: list[ProfileSpan]) -> list[ProfileEntry]:
+    entries = []
+
+    for line in path.read_text().splitlines():
+        try:
+            span_id, calls, total_microseconds = (int(value) for value in line.split())
+            span = spans[span_id]
+        except (ValueError, IndexError) as error:
+            raise InvalidProfileError(reason=f"malformed profile line: {line!r}") from error
+
+        entries.append(ProfileEntry(span, calls, total_microseconds))
+
+    return sorted(entries, key=lambda entry: entry.total_microseconds, reverse=True)
+
+
+def collect_call_profile(entries: list[ProfileEntry]) -> CallProfile:
+    calls: dict[str, int] = {}
+
+    for entry in entries:
+        if entry.span.function_name is not None:
+            calls[entry.span.function_name] = calls.get(entry.span.function_name, 0) + entry.calls
+
+    return CallProfile(calls)
@@ -0,0 +1,295 @@
+from vdsh.core.errors import ArithmeticEvaluationError
+from vdsh.core.models.ast import (
+    AssignmentNode,
+    BaseASTNode,
+    BinaryOperationNode,
+    BlockNode,
+    CallNode,
+    ContinueStatementNode,
+    ForStatementNode,
+    FuncStatementNode,
+    IdentifierNode,
+    IfStatementNode,
+    LetStatementNode,
+    MemoizedFuncStatementNode,
+    NumberLiteralNode,
+    ProgramNode,
+    ReturnStatementNode,
+    StringLiteralNode,
+    UnaryOperationNode,
+    UnsetStatementNode,
+    WhileStatementNode,
+)
+from vdsh.core.models.bytecode import BytecodeProgram, CodeObject, Constant, Opcode
+from vdsh.core.models.token import Operator
+from vdsh.core.types import BaseTransformer, BaseVisitor, visits
+
+MAIN_CODE_NAME = "<main>"
+BINARY_OPCODES = {
+    Operator.PLUS: Opcode.ADD,
+    Operator.MINUS: Opcode.SUBTRACT,
+    Operator.STAR: Opcode.MULTIPLY,
+    Operator.SLASH: Opcode.DIVIDE,
+    Operator.PERCENT: Opcode.REMAINDER,
+    Operator.POWER: Opcode.POWER,
+    Operator.EQUALS: Opcode.EQUALS,
+    Operator.NOT_EQUALS: Opcode.NOT_EQUALS,
+    Operator.LESS: Opcode.LESS,
+    Operator.LESS_EQUAL: Opcode.LESS_EQUAL,
+    Operator.MORE: Opcode.MORE,
+    Operator.MORE_EQUAL: Opcode.MORE_EQUAL,
+}
+UNARY_OPCODES = {
+    Operator.MINUS: Opcode.NEGATE,
+    Operator.PLUS: Opcode.POSITIVE,
+    Operator.NOT: Opcode.NOT,
+}
+
+
+class BytecodeCompiler(
+    BaseVisitor[BaseASTNode, None],
+    BaseTransformer[BaseASTNode, BytecodeProgram],
+):
+    """
+    Compiles a program into bytecode for the `VirtualMachine`. Every function body becomes its own
+    code object, defined when the statement that declares it runs, as in the generated bash.
+    """
+
+    def __init__(self) -> None:
+        self._program = BytecodeProgram(main=CodeObject(name=MAIN_CODE_NAME))
+        self._code = self._program.main
+        self._constant_ids: dict[tuple[type, Constant], int] = {}
+        self._name_ids: dict[str, int] = {}
+        self._call_site_ids: dict[tuple[int, int], int] = {}
+        self._continue_targets: list[list[int]] = []
+
+    def transform(self, data: BaseASTNode) -> BytecodeProgram:
+        self._program = BytecodeProgram(main=CodeObject(name=MAIN_CODE_NAME))
+        self._code = self._program.main
+        self._constant_ids = {}
+        self._name_ids = {}
+        self._call_site_ids = {}
+        self._continue_targets = []
+
+        self._compile_statement(data)
+        self._code.emit(Opcode.HALT)
+
+        return self._program
+
+    def _constant(self, value: Constant) -> int:
+        key = (type(value), value)
+        index = self._constant_ids.get(key)
+        if index is None:
+            index = self._constant_ids[key] = len(self._program.constants)
+            self._program.constants.append(value)
+
+        return index
+
+    def _name(self, name: str) -> int:
+        index = self._name_ids.get(name)
+        if index is None:
+            index = self._name_ids[name] = len(self._program.names)
+            self._program.names.append(name)
+
+        return index
+
+    def _call_site(self, name: str, argument_count: int) -> int:
+        key = (self._name(name), argument_count)
+        index = self._call_site_ids.get(key)
+        if index is None:
+            index = self._call_site_ids[key] = len(self._program.call_sites)
+            self._program.call_sites.append(key)
+
+        return index
+
+    def _compile_statement(self, statement: BaseASTNode) -> None:
+        self.visit(statement)
+
+        if isinstance(statement, CallNode):
+            self._code.emit(Opcode.POP)
+
+    def _compile_statements(self, statements: list[BaseASTNode]) -> None:
+        for statement in statements:
+            self._compile_statement(statement)
+
+    @visits(ProgramNode, BlockNode)
+    def _compile_block(self, node: ProgramNode | BlockNode) -> None:
+        self._compile_statements(node.statements)
+
+    @visits(NumberLiteralNode)
+    def _compile_number_literal(self, node: NumberLiteralNode) -> None:
+        if not node.number.value.is_integer():
+            raise ArithmeticEvaluationError(reason=f"{node.number.value} is not an integer")
+
+        self._code.emit(Opcode.LOAD_CONST, self._constant(int(node.number.value)))
+
+    @visits(StringLiteralNode)
+    def _compile_string_literal(self, node: StringLiteralNode) -> None:
+        self._code.emit(Opcode.LOAD_CONST, self._constant(node.string.value))
+
+    @visits(IdentifierNode)
+    def _compile_identifier(self, node: IdentifierNode) -> None:
+        self._code.emit(Opcode.LOAD_NAME, self._name(node.identifier.name))
+
+    @visits(UnaryOperationNode)
+    def _compile_unary_operation(self, node: UnaryOperationNode) -> None:
+        opcode = UNARY_OPCODES.get(node.operator.kind)
+        if opcode is None:
+            raise ArithmeticEvaluationError(
+                reason=f"unsupported operator {node.operator.kind.value}",
+            )
+
+        self.visit(node.value)
+        self._code.emit(opcode)
+
+    @visits(BinaryOperationNode)
+    def _compile_binary_operation(self, node: BinaryOperationNode) -> None:
+        operator = node.operator.kind
+
+        if operator in (Operator.AND, Operator.OR):
+            self._compile_short_circuit(node, operator)
+            return
+
+        opcode = BINARY_OPCODES.get(operator)
+        if opcode is None:
+            raise ArithmeticEvaluationError(reason=f"unsupported operator {operator.value}")
+
+        self.visit(node.left)
+        self.visit(node.right)
+        self._code.emit(opcode)
+
+    def _compile_short_circuit(self, node: BinaryOperationNode, operator: Operator) -> None:
+        """`a && b` and `a || b` evaluate to 0 or 1 and skip `b` once `a` decides the result"""
+        code = self._code
+        self.visit(node.left)
+
+        if operator == Operator.AND:
+            left_jump = code.emit(Opcode.JUMP_IF_FALSE)
+            self.visit(node.right)
+            right_jump = code.emit(Opcode.JUMP_IF_FALSE)
+            code.emit(Opcode.LOAD_CONST, self._constant(1))
+            end_jump = code.emit(Opcode.JUMP)
+            code.patch(left_jump, len(code))
+            code.patch(right_jump, len(code))
+            code.emit(Opcode.LOAD_CONST, self._constant(0))
+        else:
+            left_jump = code.emit(Opcode.JUMP_IF_FALSE)
+            code.emit(Opcode.LOAD_CONST, self._constant(1))
+            end_jump = code.emit(Opcode.JUMP)
+            code.patch(left_jump, len(code))
+            self.visit(node.right)
+            # Negating twice turns the right operand into 0 or 1
+            code.emit(Opcode.NOT)
+            code.emit(Opcode.NOT)
+
+        code.patch(end_jump, len(code))
+
+    @visits(AssignmentNode)
+    def _compile_assignment(self, node: AssignmentNode) -> None:
+        self.visit(node.value)
+        self._code.emit(Opcode.STORE_NAME, self._name(node.identifier.name))
+
+    @visits(LetStatementNode)
+    def _compile_let_statement(self, node: LetStatementNode) -> None:
+        self.visit(node.assignment.value)
+        self._code.emit(Opcode.STORE_LOCAL, self._name(node.assignment.identifier.name))
+
+    @visits(IfStatementNode)
+    def _compile_if_statement(self, node: IfStatementNode) -> None:
+        code = self._code
+        self.visit(node.condition)
+        else_jump = code.emit(Opcode.JUMP_IF_FALSE)
+        self._compile_statements(node.block.statements)
+
+        if node.else_block is None:
+            code.patch(else_jump, len(code))
+            return
+
+        end_jump = code.emit(Opcode.JUMP)
+        code.patch(else_jump, len(code))
+        self._compile_statements(node.else_block.statements)
+        code.patch(end_jump, len(code))
+
+    @visits(WhileStatementNode)
+    def _compile_while_statement(self, node: WhileStatementNode) -> None:
+        self._compile_loop(node.condition, node.block.statements, None)
+
+    @visits(ForStatementNode)
+    def _compile_for_statement(self, node: ForStatementNode) -> None:
+        self._compile_statement(node.initializer)
+        self._compile_loop(node.condition, node.block.statements, node.update)
+
+    def _compile_loop(
+        self,
+        condition: BaseASTNode,
+        statements: list[BaseASTNode],
+        update: BaseASTNode | None,
+    ) -> None:
+        code = self._code
+        start = len(code)
+        self.visit(condition)
+        exit_jump = code.emit(Opcode.JUMP_IF_FALSE)
+
+        self._continue_targets.append([])
+        self._compile_statements(statements)
+        for continue_jump in self._continue_targets.pop():
+            code.patch(continue_jump, len(code))
+
+        if update is not None:
+            self._compile_statement(update)
+
+        code.emit(Opcode.JUMP, start)
+        code.patch(exit_jump, len(code))
+
+    @visits(ContinueStatementNode)
+    def _compile_continue_statement(self, _: ContinueStatementNode) -> None:
+        self._continue_targets[-1].append(self._code.emit(Opcode.JUMP))
+
+    @visits(UnsetStatementNode)
+    def _compile_unset_statement(self, node: UnsetStatementNode) -> None:
+        for identifier in node.identifiers:
+            self._code.emit(Opcode.DELETE_NAME, self._name(identifier.name))
+
+    @visits(ReturnStatementNode)
+    def _compile_return_statement(self, node: ReturnStatementNode) -> None:
+        if node.value is None:
+            self._code.emit(Opcode.RETURN)
+            return
+
+        self.visit(node.value)
+        self._code.emit(Opcode.RETURN_VALUE)
+
+    @visits(FuncStatementNode)
+    def _compile_func_statement(self, node: FuncStatementNode) -> None:
+        self._code.emit(Opcode.DEFINE_FUNCTION, self._compile_function(node))
+
+    @visits(MemoizedFuncStatementNode)
+    def _compile_memoized_func_statement(self, node: MemoizedFuncStatementNode) -> None:
+        self._code.emit(Opcode.DEFINE_MEMOIZED_FUNCTION, self._compile_function(node.function))
+
+    def _compile_function(self, node: FuncStatementNode) -> int:
+        declaration = node.decelration
+        function = CodeObject(
+            name=declaration.identifier.name,
+            parameters=[
+                self._name(argument.identifier.name) for argument in declaration.arguments.arguments
+            ],
+        )
+        enclosing_code, enclosing_targets = self._code, self._continue_targets
+        self._code, self._continue_targets = function, []
+
+        try:
+            self._compile_statements(declaration.block.statements)
+            function.emit(Opcode.RETURN)
+        finally:
+            self._code, self._continue_targets = enclosing_code, enclosing_targets
+
+        self._program.functions.append(function)
+        return len(self._program.functions) - 1
+
+    @visits(CallNode)
+    def _compile_call(self, node: CallNode) -> None:
+        for argument in node.arguments:
+            self.visit(argument)
+
+        self._code.emit(Opcode.CALL, self._call_site(node.identifier.name, len(node.arguments)))
@@ -1,87 +1,461 @@
+import re
+from collections.abc import Callable
+from enum import Enum
+from typing import TYPE_CHECKING
+
 from vdsh.core.models.ast import (
     ArgumentNode,
     ArgumentsNode,
+    AssignmentNode,
     BaseASTNode,
     BinaryOperationNode,
     BlockNode,
+    CallNode,
+    ContinueStatementNode,
+    ForStatementNode,
+    FuncDeclerationNode,
     FuncStatementNode,
     IdentifierNode,
+    IfStatementNode,
     LetStatementNode,
+    MemoizedFuncStatementNode,
     NumberLiteralNode,
+    ProgramNode,
+    ReturnStatementNode,
     StringLiteralNode,
     UnaryOperationNode,
+    UnsetStatementNode,
+    WhileStatementNode,
+)
+from vdsh.core.models.source_map import SourceMap, SourceMapping
+from vdsh.core.models.token import Operator
+from vdsh.core.pipeline.cost import (
+    ARITHMETIC_EXPANSION_COST,
+    COMMAND_SUBSTITUTION_COST,
+    CostCounter,
+    CostReport,
 )
-from vdsh.core.types import BaseTransformer
+from vdsh.core.pipeline.passes.tree import node_span, walk
+from vdsh.core.types import BaseTransformer, BaseVisitor, visits
+
+if TYPE_CHECKING:
+    from vdsh.core.models.position import Position
 
 VDSH_IDENTIFIER_FORMAT = "__VDSH__{name}"
+VDSH_TEMPORARY_FORMAT = "__VDSH_TEMPORARY_{index}"
+VDSH_RETURN_REGISTER = "__VDSH_RETURN"
+VDSH_MEMO_CACHE_FORMAT = "__VDSH_MEMO__{name}"
+VDSH_MEMO_BODY_FORMAT = "__VDSH_MEMO_BODY__{name}"
+VDSH_MEMO_KEY = "__VDSH_MEMO_KEY"
+DEFAULT_MEMO_MAX_ENTRIES = 1 << 16
+SOURCE_MARKER_FORMAT = "\0{index}\0"
+SOURCE_MARKER_PATTERN = re.compile("\0([0-9]+)\0")
+SHORT_CIRCUIT_OPERATORS = frozenset({Operator.AND, Operator.OR})
+
+
+def _contains_call(node: BaseASTNode) -> bool:
+    return any(isinstance(child, CallNode) for child in walk(node))
+
+
+class CallingConvention(Enum):
+    REGISTER = "register"
+    SUBSHELL = "subshell"
+
+
+class ArithmeticGenerator(BaseVisitor[BaseASTNode, str]):
+    """Generates expressions for a bash arithmetic context, where variables need no `$`"""
+
+    def __init__(self, code_generator: "CodeGenerator") -> None:
+        self.code_generator = code_generator
+
+    def default_visit(self, node: BaseASTNode) -> str:
+        return self.code_generator.visit(node)
+
+    def _generate_operand(self, node: BaseASTNode) -> str:
+        operand = self.visit(node)
+
+        if isinstance(node, BinaryOperationNode | UnaryOperationNode):
+            return f"({operand})"
+
+        return operand
+
+    @visits(BinaryOperationNode)
+    def _generate_binary_operation(self, node: BinaryOperationNode) -> str:
+        if node.operator.kind in SHORT_CIRCUIT_OPERATORS and _contains_call(node.right):
+            return self.code_generator._generate_short_circuit(node)
+
+        left = self._generate_operand(node.left)
+        right = self._generate_operand(node.right)
+
+        return f"{left}{node.operator.kind.value}{right}"
+
+    @visits(UnaryOperationNode)
+    def _generate_unary_operation(self, node: UnaryOperationNode) -> str:
+        return f"{node.operator.kind.value}{self._generate_operand(node.value)}"
+
+    @visits(IdentifierNode)
+    def _generate_identifier(self, node: IdentifierNode) -> str:
+        return VDSH_IDENTIFIER_FORMAT.format(name=node.identifier.name)
+
 
+class CodeGenerator(BaseVisitor[BaseASTNode, str], BaseTransformer[BaseASTNode, str]):
+    def __init__(
+        self,
+        calling_convention: CallingConvention = CallingConvention.REGISTER,
+        memo_max_entries: int | None = DEFAULT_MEMO_MAX_ENTRIES,
+    ) -> None:
+        self.calling_convention = calling_convention
+        self.memo_max_entries = memo_max_entries
+        self._function_depth = 0
+        self._temporary_count = 0
+        self._hoisted_lines: list[str] = []
+        self._marked_spans: list[tuple[Position, Position, int]] = []
+        self.source_map = SourceMap()
+        self.cost_report = CostReport()
+        self._costs = CostCounter()
+        self._arithmetic = self._create_arithmetic_generator()
 
-class CodeGenerator(BaseTransformer[BaseASTNode, str]):
     def transform(self, data: BaseASTNode) -> str:
-        return self._generate(data)
-
-    def _generate(self, node: BaseASTNode) -> str:
-        generators = {
-            BinaryOperationNode: self._generate_binary_operation,
-            UnaryOperationNode: self._generate_unary_operation,
-            StringLiteralNode: self._generate_string_literal,
-            IdentifierNode: self._generate_identifier,
-            NumberLiteralNode: self._generate_number_literal,
-            ArgumentsNode: self._generate_arguments,
-            LetStatementNode: self._generate_let_statement,
-            FuncStatementNode: self._generate_func_statement,
-            BlockNode: self._generate_block,
-        }
-
-        return generators[type(node)](node)
+        self._temporary_count = 0
+        self._marked_spans = []
+        self._costs = CostCounter()
+
+        code = self._resolve_source_markers(self.visit(data))
+        self.cost_report = self._costs.report()
+
+        return code
+
+    def _mark_source(self, statement: BaseASTNode, code: str) -> str:
+        span = node_span(statement)
+        if span is None:
+            return code
+
+        self._marked_spans.append((*span, code.count("\n") + 1))
+        return SOURCE_MARKER_FORMAT.format(index=len(self._marked_spans) - 1) + code
+
+    def _resolve_source_markers(self, code: str) -> str:
+        lines = code.split("\n")
+        mappings = []
+
+        for number, line in enumerate(lines, start=1):
+            if "\0" not in line:
+                continue
+
+            for marker in SOURCE_MARKER_PATTERN.finditer(line):
+                start, end, line_count = self._marked_spans[int(marker.group(1))]
+                mappings.append(SourceMapping(number, number + line_count - 1, start, end))
+
+            lines[number - 1] = SOURCE_MARKER_PATTERN.sub("", line)
+
+        self.source_map = SourceMap(mappings)
+        return "\n".join(lines)
+
+    def _create_arithmetic_generator(self) -> ArithmeticGenerator:
+        return ArithmeticGenerator(self)
+
+    def _generate_function_header(self, name: str) -> str:
+        return f"function {name}(){{"
+
+    def _generate_test(self, condition: str) -> str:
+        self._costs.count(ARITHMETIC_EXPANSION_COST)
+        return f"(({condition}))"
+
+    def _generate_arithmetic_command(self, expression: str) -> str:
+        self._costs.count(ARITHMETIC_EXPANSION_COST)
+        return f"(({expression}))"
+
+    def _generate_counting_loop(self, condition: str, update: str, block: BlockNode) -> str:
+        self._costs.count(ARITHMETIC_EXPANSION_COST)
+        return f"for ((; {condition}; {update})); do\n{self._generate_body(block)}\ndone"
+
+    def _declaration(self) -> str:
+        return "local " if self._function_depth > 0 else ""
+
+    def _create_temporary(self) -> str:
+        self._temporary_count += 1
+        return VDSH_TEMPORARY_FORMAT.format(index=self._temporary_count)
+
+    def _generate_short_circuit(self, node: BinaryOperationNode) -> str:
+        """
+        Lowers `&&` and `||` with a call on the right into an `if`, so the call only runs once the
+        left side did not decide the result. Hoisted calls and command substitutions would
+        otherwise run before the whole expression is evaluated.
+        """
+        left = self._arithmetic.visit(node.left)
+        right, right_lines = self._capture_hoisted_lines(lambda: self._arithmetic.visit(node.right))
+        temporary = self._create_temporary()
+
+        if node.operator.kind == Operator.AND:
+            initial, condition = 0, left
+        else:
+            initial, condition = 1, f"!({left})"
+
+        self._costs.count(ARITHMETIC_EXPANSION_COST)
+        self._hoisted_lines.extend(
+            [
+                f"{self._declaration()}{temporary}={initial}",
+                f"if {self._generate_test(condition)}; then",
+                *right_lines,
+                f"{temporary}=$((({right})!=0))",
+                "fi",
+            ],
+        )
+
+        return temporary
+
+    def _generate_statements(self, statements: list[BaseASTNode]) -> str:
+        lines = []
+
+        for statement in statements:
+            state = self._costs.begin_statement()
+
+            if isinstance(statement, CallNode):
+                line = self._generate_command(statement)
+            else:
+                line = self.visit(statement)
 
+            lines.append(self._mark_source(statement, "\n".join([*self._hoisted_lines, line])))
+            self._hoisted_lines.clear()
+            self._costs.end_statement(statement, state)
+
+        return "\n".join(lines)
+
+    def _capture_hoisted_lines(self, generate: Callable[[], str]) -> tuple[str, list[str]]:
+        outer_lines = self._hoisted_lines
+        self._hoisted_lines = []
+
+        try:
+            return generate(), self._hoisted_lines
+        finally:
+            self._hoisted_lines = outer_lines
+
+    def _generate_body(self, block: BlockNode, *trailing_lines: str) -> str:
+        lines = [self._generate_statements(block.statements), *trailing_lines]
+
+        return "\n".join(line for line in lines if line) or ":"
+
+    def _generate_arithmetic_statement(self, node: BaseASTNode) -> str:
+        if isinstance(node, AssignmentNode):
+            name = VDSH_IDENTIFIER_FORMAT.format(name=node.identifier.name)
+            return f"{name}={self._arithmetic.visit(node.value)}"
+
+        return self._arithmetic.visit(node)
+
+    def _generate_word(self, node: BaseASTNode) -> str:
+        value = self.visit(node)
+        return value if isinstance(node, StringLiteralNode) else f'"{value}"'
+
+    def _generate_command(self, node: CallNode) -> str:
+        words = [VDSH_IDENTIFIER_FORMAT.format(name=node.identifier.name)]
+        words.extend(self._generate_word(argument) for argument in node.arguments)
+
+        return " ".join(words)
+
+    def _generate_arithmetic_expansion(self, node: BaseASTNode) -> str:
+        self._costs.count(ARITHMETIC_EXPANSION_COST)
+        return f"$(({self._arithmetic.visit(node)}))"
+
+    @visits(BinaryOperationNode)
     def _generate_binary_operation(self, node: BinaryOperationNode) -> str:
-        return f"$(({self._generate(node.left)}{node.operator.kind.value}{self._generate(node.right)}))"
+        return self._generate_arithmetic_expansion(node)
 
+    @visits(UnaryOperationNode)
     def _generate_unary_operation(self, node: UnaryOperationNode) -> str:
-        return f"$(({node.operator.kind.value}{self._generate(node.value)}))"
+        return self._generate_arithmetic_expansion(node)
 
+    @visits(StringLiteralNode)
     def _generate_string_literal(self, node: StringLiteralNode) -> str:
-        return f'"{node.string}"'
+        return f'"{node.string.value}"'
 
+    @visits(IdentifierNode)
     def _generate_identifier(self, node: IdentifierNode) -> str:
         return f"${VDSH_IDENTIFIER_FORMAT.format(name=node.identifier.name)}"
 
+    @visits(NumberLiteralNode)
     def _generate_number_literal(self, node: NumberLiteralNode) -> str:
         if node.number.value.is_integer():
             return str(int(node.number.value))
 
-        return str(node.number)
+        return str(node.number.value)
 
+    @visits(ArgumentsNode)
     def _generate_arguments(self, node: ArgumentsNode) -> str:
         assingments = ""
 
         for index, argument in enumerate(node.arguments):
-            assingments += (
-                f"local {VDSH_IDENTIFIER_FORMAT.format(name=argument.identifier.name)}=${index}\n"
-            )
+            assingments += f"local {VDSH_IDENTIFIER_FORMAT.format(name=argument.identifier.name)}=${index + 1}\n"
 
         return assingments
 
     def _generate_argument(self, node: ArgumentNode) -> str:
         return VDSH_IDENTIFIER_FORMAT.format(name=node.identifier.name)
 
+    @visits(BlockNode)
     def _generate_block(self, node: BlockNode) -> str:
-        inner = "\n".join([self._generate(statement) for statement in node.statements])
+        inner = self._generate_statements(node.statements)
 
         return "{\n" + inner + "\n}"
 
+    @visits(CallNode)
+    def _generate_call(self, node: CallNode) -> str:
+        command = self._generate_command(node)
+
+        if self.calling_convention == CallingConvention.SUBSHELL:
+            self._costs.count(COMMAND_SUBSTITUTION_COST)
+            return f"$({command})"
+
+        temporary = self._create_temporary()
+        self._hoisted_lines.append(command)
+        self._hoisted_lines.append(f"{self._declaration()}{temporary}=${VDSH_RETURN_REGISTER}")
+
+        return f"${temporary}"
+
+    @visits(ReturnStatementNode)
+    def _generate_return_statement(self, node: ReturnStatementNode) -> str:
+        if node.value is None:
+            return "return"
+
+        value = self._generate_word(node.value)
+
+        if self.calling_convention == CallingConvention.SUBSHELL:
+            return f"echo {value}\nreturn"
+
+        return f"{VDSH_RETURN_REGISTER}={value}\nreturn"
+
+    @visits(ProgramNode)
+    def _generate_program(self, node: ProgramNode) -> str:
+        return self._generate_statements(node.statements)
+
+    @visits(AssignmentNode)
+    def _generate_assignment(self, node: AssignmentNode) -> str:
+        return (
+            f"{VDSH_IDENTIFIER_FORMAT.format(name=node.identifier.name)}={self.visit(node.value)}"
+        )
+
+    @visits(LetStatementNode)
     def _generate_let_statement(self, node: LetStatementNode) -> str:
-        return f"local {VDSH_IDENTIFIER_FORMAT.format(name=node.assignment.identifier.name)}={self._generate(node.assignment.value)}"
+        return f"{self._declaration()}{self.visit(node.assignment)}"
 
-    def _generate_func_statement(self, node: FuncStatementNode) -> str:
-        signature = (
-            f"function {VDSH_IDENTIFIER_FORMAT.format(name=node.decelration.identifier.name)}()"
+    @visits(IfStatementNode)
+    def _generate_if_statement(self, node: IfStatementNode) -> str:
+        condition, hoisted_lines = self._capture_hoisted_lines(
+            lambda: self._arithmetic.visit(node.condition),
         )
+        lines = [
+            *hoisted_lines,
+            f"if {self._generate_test(condition)}; then",
+            self._generate_body(node.block),
+        ]
 
-        arguments = self._generate_arguments(node.decelration.arguments)
-        body = "\n".join(
-            self._generate(statement) for statement in node.decelration.block.statements
+        if node.else_block is not None:
+            lines.extend(["else", self._generate_body(node.else_block)])
+
+        return "\n".join([*lines, "fi"])
+
+    @visits(ContinueStatementNode)
+    def _generate_continue_statement(self, _: ContinueStatementNode) -> str:
+        return "continue"
+
+    @visits(UnsetStatementNode)
+    def _generate_unset_statement(self, node: UnsetStatementNode) -> str:
+        names = [VDSH_IDENTIFIER_FORMAT.format(name=token.name) for token in node.identifiers]
+
+        return f"unset {' '.join(names)}"
+
+    @visits(WhileStatementNode)
+    def _generate_while_statement(self, node: WhileStatementNode) -> str:
+        condition, hoisted_lines = self._capture_hoisted_lines(
+            lambda: self._arithmetic.visit(node.condition),
+        )
+
+        if not hoisted_lines:
+            test = self._generate_test(condition)
+            return f"while {test}; do\n{self._generate_body(node.block)}\ndone"
+
+        return "\n".join(
+            [
+                "while true; do",
+                *hoisted_lines,
+                f"{self._generate_test(condition)} || break",
+                self._generate_body(node.block),
+                "done",
+            ],
+        )
+
+    @visits(ForStatementNode)
+    def _generate_for_statement(self, node: ForStatementNode) -> str:
+        initializer = self._generate_statements([node.initializer])
+        condition, condition_lines = self._capture_hoisted_lines(
+            lambda: self._arithmetic.visit(node.condition),
+        )
+        update, update_lines = self._capture_hoisted_lines(
+            lambda: self._generate_arithmetic_statement(node.update),
         )
 
-        return signature + "{\n" + arguments + body + "\n}"
+        if not condition_lines and not update_lines:
+            loop = self._generate_counting_loop(condition, update, node.block)
+            return f"{initializer}\n{loop}"
+
+        return "\n".join(
+            [
+                initializer,
+                "while true; do",
+                *condition_lines,
+                f"{self._generate_test(condition)} || break",
+                self._generate_body(
+                    node.block,
+                    *update_lines,
+                    self._generate_arithmetic_command(update),
+                ),
+                "done",
+            ],
+        )
+
+    def _generate_function(self, name: str, declaration: FuncDeclerationNode) -> str:
+        self._function_depth += 1
+        try:
+            arguments = self._generate_arguments(declaration.arguments)
+            body = self._generate_statements(declaration.block.statements)
+        finally:
+            self._function_depth -= 1
+
+        return self._generate_function_header(name) + "\n" + arguments + (body or ":") + "\n}"
+
+    @visits(FuncStatementNode)
+    def _generate_func_statement(self, node: FuncStatementNode) -> str:
+        name = VDSH_IDENTIFIER_FORMAT.format(name=node.decelration.identifier.name)
+
+        return self._generate_function(name, node.decelration)
+
+    @visits(MemoizedFuncStatementNode)
+    def _generate_memoized_func_statement(self, node: MemoizedFuncStatementNode) -> str:
+        if self.calling_convention == CallingConvention.SUBSHELL:
+            return self.visit(node.function)
+
+        declaration = node.function.decelration
+        name = declaration.identifier.name
+        cache = VDSH_MEMO_CACHE_FORMAT.format(name=name)
+        body = VDSH_MEMO_BODY_FORMAT.format(name=name)
+        eviction = []
+
+        if self.memo_max_entries is not None:
+            self._costs.count(ARITHMETIC_EXPANSION_COST)
+            eviction = [f"if ((${{#{cache}[@]}} >= {self.memo_max_entries})); then {cache}=(); fi"]
+
+        return "\n".join(
+            [
+                self._generate_function(body, declaration),
+                f"declare -A {cache}=()",
+                f"function {VDSH_IDENTIFIER_FORMAT.format(name=name)}(){{",
+                f"local {VDSH_MEMO_KEY}",
+                f"printf -v {VDSH_MEMO_KEY} '%q,' \"$@\"",
+                f"if [[ -n ${{{cache}[${VDSH_MEMO_KEY}]+set}} ]]; then",
+                f"{VDSH_RETURN_REGISTER}=${{{cache}[${VDSH_MEMO_KEY}]}}",
+                "return",
+                "fi",
+                *eviction,
+                f'{body} "$@"',
+                f"{cache}[${VDSH_MEMO_KEY}]=${VDSH_RETURN_REGISTER}",
+                "}",
+            ],
+        )
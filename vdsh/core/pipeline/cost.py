@@ -0,0 +1,114 @@
+from dataclasses import dataclass, field, replace
+
+from vdsh.core.models.ast import BaseASTNode, FuncStatementNode, MemoizedFuncStatementNode
+from vdsh.core.models.position import Position
+from vdsh.core.pipeline.passes.tree import describe_statement, node_span
+
+
+@dataclass(frozen=True)
+class ShellCost:
+    """Static process and expansion counts of a piece of shell code"""
+
+    forks: int = 0
+    subshells: int = 0
+    arithmetic_expansions: int = 0
+
+    def __add__(self, other: "ShellCost") -> "ShellCost":
+        return ShellCost(
+            self.forks + other.forks,
+            self.subshells + other.subshells,
+            self.arithmetic_expansions + other.arithmetic_expansions,
+        )
+
+    def __sub__(self, other: "ShellCost") -> "ShellCost":
+        return ShellCost(
+            self.forks - other.forks,
+            self.subshells - other.subshells,
+            self.arithmetic_expansions - other.arithmetic_expansions,
+        )
+
+
+COMMAND_SUBSTITUTION_COST = ShellCost(forks=1, subshells=1)
+ARITHMETIC_EXPANSION_COST = ShellCost(arithmetic_expansions=1)
+
+
+@dataclass(frozen=True)
+class CostEntry:
+    label: str
+    start: Position
+    end: Position
+    cost: ShellCost
+
+
+@dataclass(frozen=True)
+class CostReport:
+    total: ShellCost = field(default_factory=ShellCost)
+    functions: list[CostEntry] = field(default_factory=list)
+    statements: list[CostEntry] = field(default_factory=list)
+
+
+type _SpanKey = tuple[int, int, int, int]
+
+
+def _span_key(start: Position, end: Position) -> _SpanKey:
+    return start.row, start.column, end.row, end.column
+
+
+def _sorted(entries: list[CostEntry]) -> list[CostEntry]:
+    return sorted(entries, key=lambda entry: _span_key(entry.start, entry.end))
+
+
+class CostCounter:
+    """
+    Tallies the cost of the constructs a code generator emits. Statements are charged for their
+    own code and functions for their whole body. Copies of a statement, such as inlined function
+    bodies, share one entry that is charged for all of them.
+    """
+
+    def __init__(self) -> None:
+        self.total = ShellCost()
+        self._statement_cost = ShellCost()
+        self._statements: dict[_SpanKey, CostEntry] = {}
+        self._functions: list[CostEntry] = []
+
+    def count(self, cost: ShellCost) -> None:
+        self.total += cost
+        self._statement_cost += cost
+
+    def begin_statement(self) -> tuple[ShellCost, ShellCost]:
+        """Starts charging a nested statement, returning the state `end_statement` restores"""
+        state = self._statement_cost, self.total
+        self._statement_cost = ShellCost()
+
+        return state
+
+    def end_statement(self, statement: BaseASTNode, state: tuple[ShellCost, ShellCost]) -> None:
+        cost = self._statement_cost
+        self._statement_cost, total = state
+        span = node_span(statement)
+
+        if span is None:
+            self._statement_cost += cost
+            return
+
+        key = _span_key(*span)
+        entry = self._statements.get(key)
+        self._statements[key] = (
+            CostEntry(describe_statement(statement), *span, cost)
+            if entry is None
+            else replace(entry, cost=entry.cost + cost)
+        )
+
+        if isinstance(statement, MemoizedFuncStatementNode):
+            statement = statement.function
+
+        if isinstance(statement, FuncStatementNode):
+            name = statement.decelration.identifier.name
+            self._functions.append(CostEntry(name, *span, self.total - total))
+
+    def report(self) -> CostReport:
+        return CostReport(
+            total=self.total,
+            functions=_sorted(self._functions),
+            statements=_sorted(list(self._statements.values())),
+        )
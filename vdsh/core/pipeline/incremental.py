@@ -0,0 +1,342 @@
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from vdsh.core.errors import TypeCheckerError
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.ast import BaseASTNode, ProgramNode
+from vdsh.core.models.position import Position
+from vdsh.core.models.schema import FieldKind, ast_schema
+from vdsh.core.models.token import BaseToken
+from vdsh.core.pipeline.parser import Parser
+from vdsh.core.pipeline.tokenizer import Tokenizer
+from vdsh.core.pipeline.type_checker import TypeChecker, function_arities
+
+
+@dataclass(frozen=True)
+class TextEdit:
+    """Replaces the characters from offset `start` up to, but excluding, `end` with `text`"""
+
+    start: int
+    end: int
+    text: str
+
+
+@dataclass(frozen=True)
+class ParsedSource:
+    """
+    A source with its tokens, ending with the EOF token, and its tree. `boundaries` holds the
+    index of the first token of every top-level statement, followed by the index of the EOF token.
+    """
+
+    source: str
+    tokens: list[BaseToken]
+    tree: ProgramNode
+    boundaries: list[int]
+
+
+class _RecordingIterator:
+    """Passes tokens through to the parser, keeping every token it lexed"""
+
+    def __init__(self, tokenizer: Tokenizer) -> None:
+        self.tokenizer = tokenizer
+        self.tokens: list[BaseToken] = []
+
+    def next(self) -> BaseToken:
+        token = self.tokenizer.next()
+        self.tokens.append(token)
+
+        return token
+
+    def is_over(self) -> bool:
+        return self.tokenizer.is_over()
+
+
+def combine_edits(source: str, edits: list[TextEdit], text: str) -> TextEdit:
+    """
+    One edit that turns `source` into `text`, where `edits` did so one after another. The prefix
+    before the earliest edit and the suffix after the latest edit end are left out of it.
+    """
+    length = len(source)
+    start = suffix = length
+
+    for edit in edits:
+        start = min(start, edit.start)
+        suffix = min(suffix, length - edit.end)
+        length += len(edit.text) - (edit.end - edit.start)
+
+    return TextEdit(start=start, end=len(source) - suffix, text=text[start : len(text) - suffix])
+
+
+def _position_at(source: str, offset: int) -> Position:
+    line_start = source.rfind("\n", 0, offset) + 1
+
+    return Position(row=source.count("\n", 0, offset) + 1, column=offset - line_start + 1)
+
+
+def _position_after(start: Position, text: str) -> Position:
+    """Where the character following `text` ends up when `text` is inserted at `start`"""
+    newlines = text.count("\n")
+    if newlines == 0:
+        return Position(row=start.row, column=start.column + len(text))
+
+    return Position(row=start.row + newlines, column=len(text) - text.rfind("\n"))
+
+
+def _offset_of(source: str, position: Position, anchor: int, anchor_position: Position) -> int:
+    """The offset of `position`, found by walking back from a known offset rather than from 0"""
+    line_start = anchor - anchor_position.column + 1
+    for _ in range(anchor_position.row - position.row):
+        line_start = source.rfind("\n", 0, line_start - 1) + 1
+
+    return line_start + position.column - 1
+
+
+def _key(position: Position) -> tuple[int, int]:
+    return position.row, position.column
+
+
+REFERENCE_KINDS = (FieldKind.REFERENCE, FieldKind.OPTIONAL_REFERENCE)
+
+
+class _Shifter:
+    """Moves tokens that come after an edit to where the edit put them"""
+
+    def __init__(self, old_end: Position, new_end: Position) -> None:
+        self.old_end = old_end
+        self.new_end = new_end
+        self.row_delta = new_end.row - old_end.row
+        self.plans = ast_schema().plans
+        self._tokens: dict[int, BaseToken] = {}
+
+    def is_identity(self, token: BaseToken) -> bool:
+        """Tokens on later lines keep their position unless the edit added or removed lines"""
+        return self.row_delta == 0 and token.start.row > self.old_end.row
+
+    def position(self, position: Position) -> Position:
+        if position.row == self.old_end.row:
+            column = position.column - self.old_end.column + self.new_end.column
+            return Position(row=self.new_end.row, column=column)
+
+        return Position(row=position.row + self.row_delta, column=position.column)
+
+    def original(self, position: Position) -> Position | None:
+        """Where a position after the edit was before it, None for positions before its end"""
+        if position.row == self.new_end.row and position.column >= self.new_end.column:
+            column = position.column - self.new_end.column + self.old_end.column
+            return Position(row=self.old_end.row, column=column)
+        if position.row > self.new_end.row:
+            return Position(row=position.row - self.row_delta, column=position.column)
+
+        return None
+
+    def token(self, token: BaseToken) -> BaseToken:
+        if self.is_identity(token):
+            return token
+
+        shifted = self._tokens.get(id(token))
+        if shifted is None:
+            # Tokens are built positionally from the schema, `dataclasses.replace` is far slower
+            payload = [getattr(token, plan.name) for plan in self.plans[type(token)][2:]]
+            shifted = self._tokens[id(token)] = type(token)(
+                self.position(token.start),
+                self.position(token.end),
+                *payload,
+            )
+
+        return shifted
+
+    def node(self, node: BaseASTNode) -> BaseASTNode:
+        values = []
+
+        for plan in self.plans[type(node)]:
+            value = getattr(node, plan.name)
+            if plan.kind == FieldKind.REFERENCE_LIST:
+                value = [self._reference(item, plan.is_token) for item in value]
+            elif plan.kind in REFERENCE_KINDS and value is not None:
+                value = self._reference(value, plan.is_token)
+            values.append(value)
+
+        return type(node)(*values)
+
+    def unmoved_from(self, tokens: list[BaseToken], start: int) -> int:
+        """The index of the first token from `start` on that the edit leaves where it was"""
+        if self.row_delta != 0:
+            return len(tokens)
+
+        first_row = self.old_end.row + 1
+        return bisect_left(tokens, first_row, lo=start, key=lambda token: token.start.row)
+
+    def _reference(self, value: BaseASTNode | BaseToken, is_token: bool) -> object:
+        if is_token:
+            assert isinstance(value, BaseToken)
+            return self.token(value)
+
+        assert isinstance(value, BaseASTNode)
+        return self.node(value)
+
+
+def _parse_from(
+    source: str,
+    offset: int,
+    start: Position,
+    resync: Callable[[Position], int | None] | None = None,
+) -> tuple[list[BaseToken], list[BaseASTNode], list[int], int | None]:
+    """
+    Lexes and parses top-level statements from `offset`. Stops early at the first statement
+    boundary `resync` maps to an old statement, returning the tokens and statements before it.
+    """
+    tokens = _RecordingIterator(Tokenizer(SequenceIterator(source, start=offset), start=start))
+    parser = Parser(token_iterator=tokens)
+    statements: list[BaseASTNode] = []
+    boundaries: list[int] = []
+
+    while True:
+        next_token = parser.token_iterator.peek()
+        if resync is not None:
+            index = resync(next_token.start)
+            if index is not None:
+                return tokens.tokens[:-1], statements, boundaries, index
+
+        boundaries.append(len(tokens.tokens) - 1)
+        statement = parser.create_statement()
+        if statement is None:
+            return tokens.tokens, statements, boundaries, None
+
+        statements.append(statement)
+
+
+def parse_source(source: str) -> ParsedSource:
+    """Parses `source` from scratch, keeping what `reparse` needs to update it after an edit"""
+    tokens, statements, boundaries, _ = _parse_from(source, 0, Position(row=1, column=1))
+
+    return ParsedSource(
+        source=source,
+        tokens=tokens,
+        tree=ProgramNode(statements=statements),
+        boundaries=boundaries,
+    )
+
+
+def reparse(previous: ParsedSource, edit: TextEdit) -> ParsedSource:
+    """
+    Applies `edit` and parses the result, reusing `previous` wherever the edit cannot have changed
+    it. Lexing restarts at the statement that holds the last token before the edit, because a
+    statement can depend on the first token of the next one, and stops at the first statement
+    boundary past the edit where the new tokens line up with the old ones again. Statements before
+    the restart are reused as they are, statements from that boundary on are moved by the edit.
+    """
+    old_source = previous.source
+    old_tokens = previous.tokens
+    old_boundaries = previous.boundaries
+    old_statements = previous.tree.statements
+    source = old_source[: edit.start] + edit.text + old_source[edit.end :]
+
+    edit_start = _position_at(old_source, edit.start)
+    old_end = _position_at(old_source, edit.end)
+    shifter = _Shifter(old_end, _position_after(edit_start, edit.text))
+
+    touched = bisect_left(old_tokens, _key(edit_start), key=lambda token: _key(token.start)) - 1
+    first = bisect_left(old_boundaries, touched + 1) - 1 if touched >= 0 else 0
+    restart_index = old_boundaries[first]
+    restart = old_tokens[restart_index].start if restart_index > 0 else Position(row=1, column=1)
+    restart_offset = (
+        _offset_of(old_source, restart, edit.start, edit_start) if restart_index > 0 else 0
+    )
+
+    def resync(position: Position) -> int | None:
+        original = shifter.original(position)
+        if original is None:
+            return None
+
+        index = bisect_left(
+            old_boundaries,
+            _key(original),
+            lo=first + 1,
+            key=lambda boundary: _key(old_tokens[boundary].start),
+        )
+        if index < len(old_boundaries) and old_tokens[old_boundaries[index]].start == original:
+            return index
+
+        return None
+
+    tokens, statements, boundaries, resumed = _parse_from(source, restart_offset, restart, resync)
+
+    boundaries = [restart_index + boundary for boundary in boundaries]
+    tokens = old_tokens[:restart_index] + tokens
+    statements = old_statements[:first] + statements
+
+    if resumed is not None:
+        resume_index = old_boundaries[resumed]
+        offset = len(tokens) - resume_index
+        boundaries.extend(boundary + offset for boundary in old_boundaries[resumed:])
+
+        # Past the edit's last line, tokens and whole statements only move if lines were added or removed
+        unmoved = shifter.unmoved_from(old_tokens, resume_index)
+        unmoved_statement = bisect_left(old_boundaries, unmoved, lo=resumed)
+        tokens.extend(shifter.token(token) for token in old_tokens[resume_index:unmoved])
+        tokens.extend(old_tokens[unmoved:])
+        statements.extend(
+            shifter.node(statement) for statement in old_statements[resumed:unmoved_statement]
+        )
+        statements.extend(old_statements[unmoved_statement:])
+
+    return ParsedSource(
+        source=source,
+        tokens=tokens,
+        tree=ProgramNode(statements=statements),
+        boundaries=old_boundaries[:first] + boundaries,
+    )
+
+
+class IncrementalTypeChecker:
+    """
+    Type checks programs like `TypeChecker`, caching what it found for every top-level statement.
+    `reparse` keeps statements the edit did not touch, so only new statements are walked, and
+    only those are checked again unless the edit changed which functions are declared.
+    """
+
+    def __init__(self) -> None:
+        self._declarations: dict[int, tuple[BaseASTNode, list[tuple[str, int]]]] = {}
+        self._results: dict[int, tuple[BaseASTNode, TypeCheckerError | None]] = {}
+        self._arities: dict[str, int] = {}
+
+    def validate(self, tree: ProgramNode) -> None:
+        declarations = {}
+        for statement in tree.statements:
+            cached = self._declarations.get(id(statement))
+            if cached is None or cached[0] is not statement:
+                cached = (statement, list(function_arities(statement)))
+            declarations[id(statement)] = cached
+        self._declarations = declarations
+
+        # `walk` visits the statements of a program last to first, so earlier declarations win
+        arities: dict[str, int] = {}
+        for statement in reversed(tree.statements):
+            arities.update(declarations[id(statement)][1])
+
+        if arities != self._arities:
+            self._results = {}
+            self._arities = arities
+
+        results = {}
+        for statement in tree.statements:
+            result = self._results.get(id(statement))
+            if result is None or result[0] is not statement:
+                result = (statement, self._check(statement, arities))
+            results[id(statement)] = result
+        self._results = results
+
+        for statement in tree.statements:
+            error = results[id(statement)][1]
+            if error is not None:
+                raise error
+
+    @staticmethod
+    def _check(statement: BaseASTNode, arities: dict[str, int]) -> TypeCheckerError | None:
+        try:
+            TypeChecker().validate_statement(statement, arities)
+        except TypeCheckerError as error:
+            return error
+
+        return None
@@ -0,0 +1,338 @@
+import re
+from collections.abc import Callable
+
+from vdsh.core.errors import (
+    ArithmeticEvaluationError,
+    RecursionLimitError,
+    UnknownFunctionError,
+)
+from vdsh.core.models.ast import (
+    AssignmentNode,
+    BaseASTNode,
+    BinaryOperationNode,
+    BlockNode,
+    CallNode,
+    ContinueStatementNode,
+    ForStatementNode,
+    FuncDeclerationNode,
+    FuncStatementNode,
+    IdentifierNode,
+    IfStatementNode,
+    LetStatementNode,
+    MemoizedFuncStatementNode,
+    NumberLiteralNode,
+    ProgramNode,
+    ReturnStatementNode,
+    StringLiteralNode,
+    UnaryOperationNode,
+    UnsetStatementNode,
+    WhileStatementNode,
+)
+from vdsh.core.models.token import Operator
+from vdsh.core.types import BaseTransformer, BaseVisitor, visits
+
+type Value = int | str
+
+INTEGER_PATTERN = re.compile(r"^\s*[-+]?[0-9]+\s*$")
+INTEGER_BITS = 64
+
+
+def _wrap(value: int) -> int:
+    """Bash arithmetic is done in signed 64-bit integers"""
+    return (value + (1 << (INTEGER_BITS - 1))) % (1 << INTEGER_BITS) - (1 << (INTEGER_BITS - 1))
+
+
+def _divide(left: int, right: int) -> int:
+    if right == 0:
+        raise ArithmeticEvaluationError(reason="division by 0")
+
+    quotient = abs(left) // abs(right)
+    return quotient if (left < 0) == (right < 0) else -quotient
+
+
+def _remainder(left: int, right: int) -> int:
+    return left - right * _divide(left, right)
+
+
+def _power(left: int, right: int) -> int:
+    if right < 0:
+        raise ArithmeticEvaluationError(reason="exponent less than 0")
+
+    return _wrap(pow(left, right, 1 << INTEGER_BITS))
+
+
+BINARY_OPERATIONS: dict[Operator, Callable[[int, int], int]] = {
+    Operator.PLUS: lambda left, right: _wrap(left + right),
+    Operator.MINUS: lambda left, right: _wrap(left - right),
+    Operator.STAR: lambda left, right: _wrap(left * right),
+    Operator.SLASH: _divide,
+    Operator.PERCENT: _remainder,
+    Operator.POWER: _power,
+    Operator.EQUALS: lambda left, right: int(left == right),
+    Operator.NOT_EQUALS: lambda left, right: int(left != right),
+    Operator.LESS: lambda left, right: int(left < right),
+    Operator.LESS_EQUAL: lambda left, right: int(left <= right),
+    Operator.MORE: lambda left, right: int(left > right),
+    Operator.MORE_EQUAL: lambda left, right: int(left >= right),
+}
+UNARY_OPERATIONS: dict[Operator, Callable[[int], int]] = {
+    Operator.MINUS: lambda value: _wrap(-value),
+    Operator.PLUS: lambda value: value,
+    Operator.NOT: lambda value: int(not value),
+}
+
+
+def to_integer(value: Value) -> int:
+    """Reads a value the way bash arithmetic does, where an empty or unset variable is 0"""
+    if isinstance(value, int):
+        return value
+    if not value:
+        return 0
+    if INTEGER_PATTERN.match(value):
+        return int(value)
+
+    raise ArithmeticEvaluationError(reason=f"{value!r} is not a number")
+
+
+class _Return(Exception):  # noqa: N818
+    pass
+
+
+class _Continue(Exception):  # noqa: N818
+    pass
+
+
+class Interpreter(BaseVisitor[BaseASTNode, Value], BaseTransformer[BaseASTNode, dict[str, Value]]):
+    """
+    Evaluates a program in-process with the semantics of the generated bash: 64-bit integer
+    arithmetic, dynamically scoped `local` variables and a shared return register. Returns the
+    global variables the program leaves behind.
+    """
+
+    def __init__(self) -> None:
+        self.globals: dict[str, Value] = {}
+        self._frames: list[dict[str, Value]] = []
+        self._functions: dict[str, FuncDeclerationNode] = {}
+        self._memo_caches: dict[str, dict[tuple[Value, ...], Value]] = {}
+        self._return_register: Value = ""
+
+    def transform(self, data: BaseASTNode) -> dict[str, Value]:
+        self.globals = {}
+        self._frames = []
+        self._functions = {}
+        self._memo_caches = {}
+        self._return_register = ""
+
+        try:
+            self.visit(data)
+        except RecursionError as error:
+            raise RecursionLimitError from error
+
+        return self.globals
+
+    def _lookup(self, name: str) -> Value:
+        for frame in reversed(self._frames):
+            if name in frame:
+                return frame[name]
+
+        return self.globals.get(name, "")
+
+    def _assign(self, name: str, value: Value) -> None:
+        for frame in reversed(self._frames):
+            if name in frame:
+                frame[name] = value
+                return
+
+        self.globals[name] = value
+
+    def _unset(self, name: str) -> None:
+        for frame in reversed(self._frames):
+            if name in frame:
+                del frame[name]
+                return
+
+        self.globals.pop(name, None)
+
+    def _evaluate_integer(self, node: BaseASTNode) -> int:
+        # Arithmetic dominates numeric programs, so its most common operands skip `visit`
+        if type(node) is BinaryOperationNode:
+            return self._evaluate_binary_operation(node)
+        if type(node) is IdentifierNode:
+            value = self._lookup(node.identifier.name)
+            return value if type(value) is int else to_integer(value)
+
+        return to_integer(self.visit(node))
+
+    def _execute(self, statements: list[BaseASTNode]) -> None:
+        for statement in statements:
+            self.visit(statement)
+
+    @visits(ProgramNode, BlockNode)
+    def _execute_block(self, node: ProgramNode | BlockNode) -> Value:
+        self._execute(node.statements)
+        return ""
+
+    @visits(NumberLiteralNode)
+    def _evaluate_number_literal(self, node: NumberLiteralNode) -> Value:
+        if not node.number.value.is_integer():
+            raise ArithmeticEvaluationError(reason=f"{node.number.value} is not an integer")
+
+        return int(node.number.value)
+
+    @visits(StringLiteralNode)
+    def _evaluate_string_literal(self, node: StringLiteralNode) -> Value:
+        return node.string.value
+
+    @visits(IdentifierNode)
+    def _evaluate_identifier(self, node: IdentifierNode) -> Value:
+        return self._lookup(node.identifier.name)
+
+    @visits(UnaryOperationNode)
+    def _evaluate_unary_operation(self, node: UnaryOperationNode) -> Value:
+        operation = UNARY_OPERATIONS.get(node.operator.kind)
+        if operation is None:
+            raise ArithmeticEvaluationError(
+                reason=f"unsupported operator {node.operator.kind.value}",
+            )
+
+        return operation(self._evaluate_integer(node.value))
+
+    @visits(BinaryOperationNode)
+    def _evaluate_binary_operation(self, node: BinaryOperationNode) -> int:
+        operator = node.operator.kind
+
+        if operator == Operator.AND:
+            return int(
+                bool(self._evaluate_integer(node.left) and self._evaluate_integer(node.right)),
+            )
+        if operator == Operator.OR:
+            return int(
+                bool(self._evaluate_integer(node.left) or self._evaluate_integer(node.right)),
+            )
+
+        operation = BINARY_OPERATIONS.get(operator)
+        if operation is None:
+            raise ArithmeticEvaluationError(reason=f"unsupported operator {operator.value}")
+
+        return operation(self._evaluate_integer(node.left), self._evaluate_integer(node.right))
+
+    @visits(AssignmentNode)
+    def _execute_assignment(self, node: AssignmentNode) -> Value:
+        self._assign(node.identifier.name, self.visit(node.value))
+        return ""
+
+    @visits(LetStatementNode)
+    def _execute_let_statement(self, node: LetStatementNode) -> Value:
+        value = self.visit(node.assignment.value)
+
+        if self._frames:
+            self._frames[-1][node.assignment.identifier.name] = value
+        else:
+            self.globals[node.assignment.identifier.name] = value
+
+        return ""
+
+    @visits(IfStatementNode)
+    def _execute_if_statement(self, node: IfStatementNode) -> Value:
+        if self._evaluate_integer(node.condition):
+            self._execute(node.block.statements)
+        elif node.else_block is not None:
+            self._execute(node.else_block.statements)
+
+        return ""
+
+    @visits(WhileStatementNode)
+    def _execute_while_statement(self, node: WhileStatementNode) -> Value:
+        self._loop(node.condition, node.block.statements, None)
+        return ""
+
+    @visits(ForStatementNode)
+    def _execute_for_statement(self, node: ForStatementNode) -> Value:
+        self.visit(node.initializer)
+        self._loop(node.condition, node.block.statements, node.update)
+        return ""
+
+    def _loop(
+        self,
+        condition: BaseASTNode,
+        statements: list[BaseASTNode],
+        update: BaseASTNode | None,
+    ) -> None:
+        # The handler sits outside the loop, so iterations that do not `continue` pay nothing for it
+        while True:
+            try:
+                while self._evaluate_integer(condition):
+                    self._execute(statements)
+                    if update is not None:
+                        self.visit(update)
+
+                return
+            except _Continue:
+                if update is not None:
+                    self.visit(update)
+
+    @visits(ContinueStatementNode)
+    def _execute_continue_statement(self, _: ContinueStatementNode) -> Value:
+        raise _Continue
+
+    @visits(UnsetStatementNode)
+    def _execute_unset_statement(self, node: UnsetStatementNode) -> Value:
+        for identifier in node.identifiers:
+            self._unset(identifier.name)
+
+        return ""
+
+    @visits(ReturnStatementNode)
+    def _execute_return_statement(self, node: ReturnStatementNode) -> Value:
+        if node.value is not None:
+            self._return_register = self.visit(node.value)
+
+        raise _Return
+
+    @visits(FuncStatementNode)
+    def _execute_func_statement(self, node: FuncStatementNode) -> Value:
+        self._functions[node.decelration.identifier.name] = node.decelration
+        self._memo_caches.pop(node.decelration.identifier.name, None)
+        return ""
+
+    @visits(MemoizedFuncStatementNode)
+    def _execute_memoized_func_statement(self, node: MemoizedFuncStatementNode) -> Value:
+        self.visit(node.function)
+        self._memo_caches[node.function.decelration.identifier.name] = {}
+        return ""
+
+    def _call(self, name: str, arguments: tuple[Value, ...]) -> None:
+        declaration = self._functions.get(name)
+        if declaration is None:
+            raise UnknownFunctionError(function_name=name)
+
+        parameters = declaration.arguments.arguments
+        self._frames.append(
+            {
+                parameter.identifier.name: argument
+                for parameter, argument in zip(parameters, arguments, strict=False)
+            },
+        )
+
+        try:
+            self._execute(declaration.block.statements)
+        except _Return:
+            pass
+        finally:
+            self._frames.pop()
+
+    @visits(CallNode)
+    def _evaluate_call(self, node: CallNode) -> Value:
+        name = node.identifier.name
+        arguments = tuple(self.visit(argument) for argument in node.arguments)
+        cache = self._memo_caches.get(name)
+
+        if cache is None:
+            self._call(name, arguments)
+        elif arguments in cache:
+            self._return_register = cache[arguments]
+        else:
+            self._call(name, arguments)
+            cache[arguments] = self._return_register
+
+        return self._return_register
@@ -1,9 +1,14 @@
 from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.pipeline.pass_manager import DEFAULT_OPTIMIZATION_LEVEL, PassManager, create_passes
 from vdsh.core.types import BaseTransformer
 
 
-class Optimizer(BaseTransformer[BaseASTNode, BaseASTNode]):
-    def transform(self, data: BaseASTNode) -> BaseASTNode:
-        optimized_data = data
+class Optimizer(PassManager):
+    def __init__(
+        self,
+        passes: list[BaseTransformer[BaseASTNode, BaseASTNode]] | None = None,
+    ) -> None:
+        if passes is None:
+            passes = create_passes(DEFAULT_OPTIMIZATION_LEVEL)
 
-        return optimized_data  # noqa: RET504
+        super().__init__(passes)
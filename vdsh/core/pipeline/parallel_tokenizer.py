@@ -0,0 +1,110 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import pairwise
+
+from vdsh.core.errors import TokenizerError
+from vdsh.core.iterator import SequenceIterator
+from vdsh.core.models.position import Position
+from vdsh.core.models.token import BaseToken
+from vdsh.core.pipeline.tokenizer import NEWLINE, STRING_TERMINATOR, Tokenizer
+
+MIN_CHUNK_SIZE = 1 << 16
+
+
+def tokenize(source: str, start: Position | None = None) -> list[BaseToken]:
+    """Every token of `source`, ending with the EOF token"""
+    tokenizer = Tokenizer(SequenceIterator(source), start=start)
+    tokens = []
+
+    while not tokenizer.is_over():
+        tokens.append(tokenizer.next())
+
+    return tokens
+
+
+def split_source(source: str, chunks: int, min_chunk_size: int = MIN_CHUNK_SIZE) -> list[int]:
+    """
+    Offsets to split `source` at into about `chunks` chunks of at least `min_chunk_size`. The
+    tokenizer keeps no state between tokens but its position, so every line start outside of a
+    string literal is a safe place to restart it. Quotes are counted with `str.count`, which keeps
+    the scan far cheaper than tokenizing.
+    """
+    size = max(len(source) // max(chunks, 1), min_chunk_size)
+    starts = [0]
+    scanned = quotes = 0
+
+    while (newline := source.find(NEWLINE, starts[-1] + size)) != -1:
+        quotes += source.count(STRING_TERMINATOR, scanned, newline)
+        scanned = newline
+
+        # Inside a string, so move on to the first newline past its closing quote
+        while quotes % 2 == 1:
+            closing = source.find(STRING_TERMINATOR, scanned)
+            if closing == -1:
+                return starts
+
+            quotes += 1
+            scanned = closing + 1
+            newline = source.find(NEWLINE, scanned)
+            if newline == -1:
+                return starts
+
+            quotes += source.count(STRING_TERMINATOR, scanned, newline)
+            scanned = newline
+
+        if newline + 1 == len(source):
+            return starts
+
+        starts.append(newline + 1)
+
+    return starts
+
+
+def _tokenize_chunk(chunk: str, row: int) -> list[BaseToken] | None:
+    try:
+        return tokenize(chunk, Position(row=row, column=1))
+    except TokenizerError:
+        # The errors are dataclasses that do not survive pickling, the caller raises it again
+        return None
+
+
+def tokenize_parallel(
+    source: str,
+    jobs: int | None = None,
+    executor: Executor | None = None,
+    min_chunk_size: int = MIN_CHUNK_SIZE,
+) -> list[BaseToken]:
+    """
+    Tokenizes `source` in chunks on `jobs` processes, or on `executor` if given, and returns the
+    same tokens as `tokenize`. Each chunk starts on a new line, so its tokenizer starts at column 1
+    of that line and the tokens come back with their final positions. Sources too small to split
+    are tokenized in this process.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    starts = split_source(source, jobs, min_chunk_size)
+    if len(starts) == 1:
+        return tokenize(source)
+
+    bounds = list(pairwise([*starts, len(source)]))
+    chunks = [source[start:end] for start, end in bounds]
+    rows = [1]
+    for start, end in bounds[:-1]:
+        rows.append(rows[-1] + source.count(NEWLINE, start, end))
+
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            results = list(pool.map(_tokenize_chunk, chunks, rows))
+    else:
+        results = list(executor.map(_tokenize_chunk, chunks, rows))
+
+    tokens: list[BaseToken] = []
+    for chunk, row, result in zip(chunks, rows, results, strict=True):
+        if result is None:
+            result = tokenize(chunk, Position(row=row, column=1))
+
+        # Only the last chunk's EOF token ends the source
+        if tokens:
+            tokens.pop()
+        tokens.extend(result)
+
+    return tokens
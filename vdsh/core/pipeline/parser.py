@@ -2,12 +2,16 @@ from collections.abc import Callable
 from typing import TypeGuard
 
 from vdsh.core.errors import (
+    BlockMissingClosingBraceError,
     BlockMissingInitialBraceError,
     InvalidArgumentDeclarationError,
     MisingIdentifierInAssignmentError,
     MissingAssignInAssignmentError,
     MissingIdentifierInFuncDeclerationError,
+    MissingLeftParenInForError,
     MissingLeftParenInFuncDeclerationError,
+    MissingRightParenInCallError,
+    MissingRightParenInForError,
     MissingRightParenInFuncDeclerationError,
     MissingSemicolonError,
     MissingTypeIdentifierError,
@@ -24,12 +28,18 @@ from vdsh.core.models.ast import (
     BaseASTNode,
     BinaryOperationNode,
     BlockNode,
+    CallNode,
+    ForStatementNode,
     FuncDeclerationNode,
     FuncStatementNode,
     IdentifierNode,
+    IfStatementNode,
     LetStatementNode,
     NumberLiteralNode,
+    ProgramNode,
+    ReturnStatementNode,
     UnaryOperationNode,
+    WhileStatementNode,
 )
 from vdsh.core.models.token import (
     BaseToken,
@@ -45,6 +55,7 @@ from vdsh.core.types import BaseCreator
 
 type ParserPredicate[T] = Callable[[BaseToken], TypeGuard[T]]
 type ASTNodeParser = Callable[[], BaseASTNode]
+type ParserErrorFactory = Callable[[BaseToken], ParserError]
 
 
 def is_number(token: BaseToken) -> TypeGuard[NumberToken]:
@@ -90,15 +101,26 @@ class Parser(BaseCreator[BaseASTNode]):
         self._reached_eof = False
 
     def create(self) -> BaseASTNode:
-        return self._parse_statement()
+        return self._parse_program()
+
+    def create_statement(self) -> BaseASTNode | None:
+        """Parses the next top-level statement, None once the program is over"""
+        if is_eof(self.token_iterator.peek()):
+            return None
+
+        statement = self._parse_statement()
+        if is_operator(self.token_iterator.peek(), operator=Operator.SEMICOLON):
+            self._consume()
+
+        return statement
 
     def _consume(self) -> BaseToken:
         return self.token_iterator.next()
 
-    def _expect[T](self, predicate: ParserPredicate[T], error: ParserError) -> T:
+    def _expect[T](self, predicate: ParserPredicate[T], error: ParserErrorFactory) -> T:
         next_token = self.token_iterator.peek()
         if not predicate(next_token):
-            raise error
+            raise error(next_token)
 
         self._consume()
 
@@ -150,11 +172,10 @@ class Parser(BaseCreator[BaseASTNode]):
             expression = self._parse_expression()
             self._expect(
                 create_operator_predicate(Operator.RIGHT_PAREN),
-                error=UnclosedParenError(
+                error=lambda actual: UnclosedParenError(
                     opening_token=next_token,
-                    parsed_value=expression,
                     expected=Operator.RIGHT_PAREN,
-                    actual=self.token_iterator.peek(),
+                    actual=actual,
                 ),
             )
 
@@ -164,10 +185,34 @@ class Parser(BaseCreator[BaseASTNode]):
             return NumberLiteralNode(number=next_token)
 
         if is_identifier(next_token):
+            if is_operator(self.token_iterator.peek(), operator=Operator.LEFT_PAREN):
+                return self._parse_call(next_token)
+
             return IdentifierNode(identifier=next_token)
 
         raise UnexpectedTokenError(token=next_token)
 
+    def _parse_call(self, identifier: IdentifierToken) -> CallNode:
+        self._consume()
+        arguments = []
+
+        if not is_operator(self.token_iterator.peek(), operator=Operator.RIGHT_PAREN):
+            arguments.append(self._parse_bool_expression())
+
+            while is_operator(self.token_iterator.peek(), operator=Operator.COMMA):
+                self._consume()
+                arguments.append(self._parse_bool_expression())
+
+        self._expect(
+            create_operator_predicate(Operator.RIGHT_PAREN),
+            error=lambda actual: MissingRightParenInCallError(
+                function_name=identifier.name,
+                actual=actual,
+            ),
+        )
+
+        return CallNode(identifier=identifier, arguments=arguments)
+
     def _parse_power(self) -> BaseASTNode:
         return self._parse_binary_operation(
             left_parser=self._parse_atom,
@@ -230,36 +275,148 @@ class Parser(BaseCreator[BaseASTNode]):
             operators=[Operator.OR],
         )
 
+    def _parse_statements(self, is_terminator: Callable[[BaseToken], bool]) -> list[BaseASTNode]:
+        statements = []
+
+        while not is_terminator(self.token_iterator.peek()):
+            statements.append(self._parse_statement())
+
+            if is_operator(self.token_iterator.peek(), operator=Operator.SEMICOLON):
+                self._consume()
+
+        return statements
+
+    def _parse_program(self) -> ProgramNode:
+        return ProgramNode(statements=self._parse_statements(is_eof))
+
     def _parse_statement(self) -> BaseASTNode:
         next_token = self.token_iterator.peek()
 
         if is_keyword(next_token, keyword=Keyword.LET):
             self._consume()
-            assignment = self._parse_assignment()
-            self._expect(
-                create_operator_predicate(Operator.SEMICOLON),
-                error=MissingSemicolonError(actual=self.token_iterator.peek()),
-            )
-            return LetStatementNode(let=next_token, assignment=assignment)
+            let_statement = self._parse_let_statement(next_token)
+            self._expect_semicolon()
+            return let_statement
 
         if is_keyword(next_token, keyword=Keyword.FUNC):
             self._consume()
             func_decleration = self._parse_func_decleration()
             return FuncStatementNode(func=next_token, decelration=func_decleration)
 
-        return self._parse_bool_expression()
+        if is_keyword(next_token, keyword=Keyword.RETURN):
+            self._consume()
+            return self._parse_return_statement(next_token)
+
+        if is_keyword(next_token, keyword=Keyword.IF):
+            self._consume()
+            return self._parse_if_statement(next_token)
+
+        if is_keyword(next_token, keyword=Keyword.WHILE):
+            self._consume()
+            return self._parse_while_statement(next_token)
+
+        if is_keyword(next_token, keyword=Keyword.FOR):
+            self._consume()
+            return self._parse_for_statement(next_token)
+
+        return self._parse_expression_statement()
+
+    def _expect_semicolon(self) -> None:
+        self._expect(
+            create_operator_predicate(Operator.SEMICOLON),
+            error=MissingSemicolonError,
+        )
+
+    def _parse_let_statement(self, let: KeywordToken) -> LetStatementNode:
+        return LetStatementNode(let=let, assignment=self._parse_assignment())
+
+    def _parse_expression_statement(self) -> BaseASTNode:
+        expression = self._parse_bool_expression()
+
+        if isinstance(expression, IdentifierNode) and is_operator(
+            self.token_iterator.peek(),
+            operator=Operator.ASSIGN,
+        ):
+            self._consume()
+            return AssignmentNode(
+                identifier=expression.identifier,
+                value=self._parse_bool_expression(),
+            )
+
+        return expression
+
+    def _parse_if_statement(self, if_: KeywordToken) -> IfStatementNode:
+        condition = self._parse_bool_expression()
+        block = self._parse_block()
+        else_block = None
+
+        if is_keyword(self.token_iterator.peek(), keyword=Keyword.ELSE):
+            self._consume()
+
+            next_token = self.token_iterator.peek()
+            if is_keyword(next_token, keyword=Keyword.IF):
+                self._consume()
+                else_block = BlockNode(statements=[self._parse_if_statement(next_token)])
+            else:
+                else_block = self._parse_block()
+
+        return IfStatementNode(if_=if_, condition=condition, block=block, else_block=else_block)
+
+    def _parse_while_statement(self, while_: KeywordToken) -> WhileStatementNode:
+        condition = self._parse_bool_expression()
+
+        return WhileStatementNode(while_=while_, condition=condition, block=self._parse_block())
+
+    def _parse_for_statement(self, for_: KeywordToken) -> ForStatementNode:
+        self._expect(
+            create_operator_predicate(Operator.LEFT_PAREN),
+            error=MissingLeftParenInForError,
+        )
+
+        next_token = self.token_iterator.peek()
+        if is_keyword(next_token, keyword=Keyword.LET):
+            self._consume()
+            initializer: BaseASTNode = self._parse_let_statement(next_token)
+        else:
+            initializer = self._parse_expression_statement()
+        self._expect_semicolon()
+
+        condition = self._parse_bool_expression()
+        self._expect_semicolon()
+
+        update = self._parse_expression_statement()
+        self._expect(
+            create_operator_predicate(Operator.RIGHT_PAREN),
+            error=MissingRightParenInForError,
+        )
+
+        return ForStatementNode(
+            for_=for_,
+            initializer=initializer,
+            condition=condition,
+            update=update,
+            block=self._parse_block(),
+        )
+
+    def _parse_return_statement(self, return_: KeywordToken) -> ReturnStatementNode:
+        value = None
+        if not is_operator(self.token_iterator.peek(), operator=Operator.SEMICOLON):
+            value = self._parse_bool_expression()
+        self._expect_semicolon()
+
+        return ReturnStatementNode(return_=return_, value=value)
 
     def _parse_assignment(self) -> AssignmentNode:
         identifier = self._expect(
             is_identifier,
-            error=MisingIdentifierInAssignmentError(actual=self.token_iterator.peek()),
+            error=MisingIdentifierInAssignmentError,
         )
 
         self._expect(
             create_operator_predicate(Operator.ASSIGN),
-            error=MissingAssignInAssignmentError(
+            error=lambda actual: MissingAssignInAssignmentError(
                 identifier_name=identifier.name,
-                actual=self.token_iterator.peek(),
+                actual=actual,
             ),
         )
 
@@ -276,9 +433,9 @@ class Parser(BaseCreator[BaseASTNode]):
 
         self._expect(
             create_operator_predicate(Operator.COLON),
-            error=InvalidArgumentDeclarationError(
+            error=lambda actual: InvalidArgumentDeclarationError(
                 expected=Operator.COLON,
-                actual=self.token_iterator.peek(),
+                actual=actual,
             ),
         )
 
@@ -310,29 +467,32 @@ class Parser(BaseCreator[BaseASTNode]):
     def _parse_block(self) -> BlockNode:
         self._expect(
             create_operator_predicate(Operator.LEFT_BRACE),
-            error=BlockMissingInitialBraceError(actual=self.token_iterator.peek()),
+            error=BlockMissingInitialBraceError,
+        )
+        statements = self._parse_statements(
+            lambda token: is_operator(token, operator=Operator.RIGHT_BRACE) or is_eof(token),
+        )
+        self._expect(
+            create_operator_predicate(Operator.RIGHT_BRACE),
+            error=BlockMissingClosingBraceError,
         )
-        statements = []
-
-        while not is_operator(self.token_iterator.peek(), operator=Operator.RIGHT_BRACE):
-            statements.append(self._parse_statement())
 
         return BlockNode(statements=statements)
 
     def _parse_func_decleration(self) -> FuncDeclerationNode:
         identifier = self._expect(
             is_identifier,
-            error=MissingIdentifierInFuncDeclerationError(actual=self.token_iterator.peek()),
+            error=MissingIdentifierInFuncDeclerationError,
         )
 
         self._expect(
             predicate=create_operator_predicate(Operator.LEFT_PAREN),
-            error=MissingLeftParenInFuncDeclerationError(actual=self.token_iterator.peek()),
+            error=MissingLeftParenInFuncDeclerationError,
         )
         arguments = self._parse_arguments()
         self._expect(
             predicate=create_operator_predicate(Operator.RIGHT_PAREN),
-            error=MissingRightParenInFuncDeclerationError(actual=self.token_iterator.peek()),
+            error=MissingRightParenInFuncDeclerationError,
         )
         block = self._parse_block()
 
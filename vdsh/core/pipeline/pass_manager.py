@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from enum import Enum
+from time import perf_counter
+
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.models.call_profile import CallProfile
+from vdsh.core.pipeline.passes import FunctionOrderer, Inliner, Memoizer, TailCallEliminator
+from vdsh.core.pipeline.passes.tree import count_nodes
+from vdsh.core.types import BaseTransformer
+
+DEFAULT_MAX_ITERATIONS = 4
+
+
+class OptimizationLevel(Enum):
+    O0 = "0"
+    O1 = "1"
+    O2 = "2"
+
+
+DEFAULT_OPTIMIZATION_LEVEL = OptimizationLevel.O1
+
+
+@dataclass
+class PassStatistics:
+    name: str
+    runs: int = 0
+    seconds: float = 0.0
+    node_delta: int = 0
+
+
+def create_passes(
+    level: OptimizationLevel,
+    profile: CallProfile | None = None,
+) -> list[BaseTransformer[BaseASTNode, BaseASTNode]]:
+    """
+    `-O1` turns self tail calls into loops and inlines small functions, `-O2` adds memoization,
+    whose caches grow with every distinct call. A `profile` limits inlining to hot functions and
+    orders function definitions by call count.
+    """
+    passes: list[BaseTransformer[BaseASTNode, BaseASTNode]] = []
+
+    if level == OptimizationLevel.O0:
+        return passes
+
+    passes.append(TailCallEliminator())
+    if level == OptimizationLevel.O2:
+        passes.append(Memoizer())
+    passes.append(Inliner(profile=profile))
+
+    if profile is not None:
+        passes.append(FunctionOrderer(profile))
+
+    return passes
+
+
+class PassManager(BaseTransformer[BaseASTNode, BaseASTNode]):
+    """
+    Runs `passes` in order until the tree stops changing or `max_iterations` rounds have run,
+    recording the wall time and node count change of every pass in `statistics`
+    """
+
+    def __init__(
+        self,
+        passes: list[BaseTransformer[BaseASTNode, BaseASTNode]],
+        max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    ) -> None:
+        self.passes = passes
+        self.max_iterations = max_iterations
+        self.iterations = 0
+        self.statistics: list[PassStatistics] = []
+
+    @classmethod
+    def from_level(
+        cls,
+        level: OptimizationLevel,
+        profile: CallProfile | None = None,
+    ) -> "PassManager":
+        return cls(create_passes(level, profile))
+
+    def transform(self, data: BaseASTNode) -> BaseASTNode:
+        self.statistics = [PassStatistics(type(current).__name__) for current in self.passes]
+        self.iterations = 0
+        node_count = count_nodes(data)
+
+        while self.passes and self.iterations < self.max_iterations:
+            self.iterations += 1
+            previous = data
+
+            for optimization, statistics in zip(self.passes, self.statistics, strict=True):
+                data, node_count = self._run_pass(optimization, statistics, data, node_count)
+
+            if data == previous:
+                break
+
+        return data
+
+    def _run_pass(
+        self,
+        optimization: BaseTransformer[BaseASTNode, BaseASTNode],
+        statistics: PassStatistics,
+        data: BaseASTNode,
+        node_count: int,
+    ) -> tuple[BaseASTNode, int]:
+        start = perf_counter()
+        optimized_data = optimization.transform(data)
+        statistics.seconds += perf_counter() - start
+        statistics.runs += 1
+
+        if optimized_data is data:
+            return data, node_count
+
+        optimized_count = count_nodes(optimized_data)
+        statistics.node_delta += optimized_count - node_count
+
+        return optimized_data, optimized_count
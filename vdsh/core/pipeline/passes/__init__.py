@@ -0,0 +1,14 @@
+from vdsh.core.pipeline.passes.inliner import DEFAULT_INLINE_THRESHOLD, Inliner
+from vdsh.core.pipeline.passes.memoization import Memoizer
+from vdsh.core.pipeline.passes.ordering import FunctionOrderer
+from vdsh.core.pipeline.passes.purity import find_pure_functions
+from vdsh.core.pipeline.passes.tail_calls import TailCallEliminator
+
+__all__ = [
+    "DEFAULT_INLINE_THRESHOLD",
+    "FunctionOrderer",
+    "Inliner",
+    "Memoizer",
+    "TailCallEliminator",
+    "find_pure_functions",
+]
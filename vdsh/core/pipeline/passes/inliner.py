@@ -0,0 +1,229 @@
+from dataclasses import replace
+
+from vdsh.core.models.ast import (
+    AssignmentNode,
+    BaseASTNode,
+    BlockNode,
+    CallNode,
+    FuncStatementNode,
+    IdentifierNode,
+    LetStatementNode,
+    ProgramNode,
+    ReturnStatementNode,
+    UnsetStatementNode,
+)
+from vdsh.core.models.call_profile import CallProfile
+from vdsh.core.models.token import IdentifierToken, Keyword, KeywordToken
+from vdsh.core.pipeline.passes.tree import (
+    TreeRewriter,
+    count_nodes,
+    map_children,
+    node_span,
+    walk,
+)
+from vdsh.core.types import BaseTransformer, visits
+
+DEFAULT_INLINE_THRESHOLD = 32
+HOT_INLINE_THRESHOLD_FACTOR = 4
+INLINED_IDENTIFIER_FORMAT = "{function}_{index}_{name}"
+
+
+class Inliner(TreeRewriter, BaseTransformer[BaseASTNode, BaseASTNode]):
+    """
+    Inlines call statements to non-recursive, non-returning functions of at most `max_size` body
+    nodes. With a `profile`, only hot functions are inlined, under a larger size budget. Calls
+    inlined outside of any function unset their renamed bindings afterwards, so the program's
+    globals are the same as without inlining.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_INLINE_THRESHOLD,
+        profile: CallProfile | None = None,
+    ) -> None:
+        self.max_size = max_size
+        self.profile = profile
+        self._functions: dict[str, FuncStatementNode] = {}
+        self._inlined_count = 0
+        self._function_depth = 0
+
+    def transform(self, data: BaseASTNode) -> BaseASTNode:
+        if not isinstance(data, ProgramNode):
+            return data
+
+        self._functions = self._find_inlinable_functions(data)
+        self._inlined_count = 0
+        self._function_depth = 0
+
+        return self.visit(data)
+
+    def _find_inlinable_functions(self, program: ProgramNode) -> dict[str, FuncStatementNode]:
+        definitions: dict[str, list[FuncStatementNode]] = {}
+        for statement in program.statements:
+            if isinstance(statement, FuncStatementNode):
+                definitions.setdefault(statement.decelration.identifier.name, []).append(statement)
+
+        calls = {
+            name: {
+                node.identifier.name
+                for definition in functions
+                for node in walk(definition)
+                if isinstance(node, CallNode)
+            }
+            for name, functions in definitions.items()
+        }
+
+        return {
+            name: functions[0]
+            for name, functions in definitions.items()
+            if len(functions) == 1
+            and self._fits_size_budget(name, functions[0])
+            and not _is_recursive(name, calls)
+            and not _returns(functions[0])
+        }
+
+    def _fits_size_budget(self, name: str, function: FuncStatementNode) -> bool:
+        max_size = self.max_size
+
+        if self.profile is not None:
+            if not self.profile.is_hot(name):
+                return False
+
+            max_size *= HOT_INLINE_THRESHOLD_FACTOR
+
+        return count_nodes(function.decelration.block) <= max_size
+
+    @visits(ProgramNode, BlockNode)
+    def _inline_block(self, node: ProgramNode | BlockNode) -> BaseASTNode:
+        statements = self._inline_statements(node.statements)
+        if len(statements) == len(node.statements) and all(
+            statement is original
+            for statement, original in zip(statements, node.statements, strict=True)
+        ):
+            return node
+
+        return replace(node, statements=statements)
+
+    @visits(FuncStatementNode)
+    def _inline_function(self, node: FuncStatementNode) -> BaseASTNode:
+        self._function_depth += 1
+        try:
+            return map_children(node, self.visit)
+        finally:
+            self._function_depth -= 1
+
+    def _inline_statements(self, statements: list[BaseASTNode]) -> list[BaseASTNode]:
+        inlined: list[BaseASTNode] = []
+
+        for statement in statements:
+            if isinstance(statement, CallNode) and self._can_inline(statement):
+                inlined.extend(self._inline_statements(self._expand_call(statement)))
+            else:
+                inlined.append(self.visit(statement))
+
+        return inlined
+
+    def _can_inline(self, call: CallNode) -> bool:
+        function = self._functions.get(call.identifier.name)
+
+        return function is not None and len(function.decelration.arguments.arguments) == len(
+            call.arguments,
+        )
+
+    def _expand_call(self, call: CallNode) -> list[BaseASTNode]:
+        function = self._functions[call.identifier.name]
+        declaration = function.decelration
+        self._inlined_count += 1
+
+        parameters = [argument.identifier.name for argument in declaration.arguments.arguments]
+        local_names = set(parameters)
+        local_names.update(
+            node.assignment.identifier.name
+            for node in walk(declaration.block)
+            if isinstance(node, LetStatementNode)
+        )
+
+        renames = {
+            name: INLINED_IDENTIFIER_FORMAT.format(
+                function=declaration.identifier.name,
+                index=self._inlined_count,
+                name=name,
+            )
+            for name in local_names
+        }
+
+        bindings: list[BaseASTNode] = [
+            _create_binding(call, renames[parameter], value)
+            for parameter, value in zip(parameters, call.arguments, strict=True)
+        ]
+        renamer = _Renamer(renames)
+        body = [renamer.visit(statement) for statement in declaration.block.statements]
+
+        if self._function_depth > 0 or not renames:
+            return bindings + body
+
+        # Inside a function the bindings are locals, at top level they would outlive the call
+        start, end = call.identifier.start, call.identifier.end
+        unset = UnsetStatementNode(
+            identifiers=[
+                IdentifierToken(start=start, end=end, name=renames[name])
+                for name in sorted(local_names)
+            ],
+        )
+
+        return [*bindings, *body, unset]
+
+
+def _create_binding(call: CallNode, name: str, value: BaseASTNode) -> LetStatementNode:
+    """`let name = value`, spanning `value` so that source maps point at the call site"""
+    start, end = node_span(value) or (call.identifier.start, call.identifier.end)
+
+    return LetStatementNode(
+        let=KeywordToken(start=start, end=start, kind=Keyword.LET),
+        assignment=AssignmentNode(
+            identifier=IdentifierToken(start=start, end=end, name=name),
+            value=value,
+        ),
+    )
+
+
+def _is_recursive(name: str, calls: dict[str, set[str]]) -> bool:
+    pending = list(calls.get(name, ()))
+    visited: set[str] = set()
+
+    while pending:
+        callee = pending.pop()
+        if callee == name:
+            return True
+
+        if callee not in visited:
+            visited.add(callee)
+            pending.extend(calls.get(callee, ()))
+
+    return False
+
+
+def _returns(function: FuncStatementNode) -> bool:
+    return any(isinstance(node, ReturnStatementNode) for node in walk(function.decelration.block))
+
+
+def _rename_token(token: IdentifierToken, renames: dict[str, str]) -> IdentifierToken:
+    if token.name not in renames:
+        return token
+
+    return replace(token, name=renames[token.name])
+
+
+class _Renamer(TreeRewriter):
+    def __init__(self, renames: dict[str, str]) -> None:
+        self.renames = renames
+
+    @visits(IdentifierNode)
+    def _rename_identifier(self, node: IdentifierNode) -> BaseASTNode:
+        return replace(node, identifier=_rename_token(node.identifier, self.renames))
+
+    @visits(AssignmentNode)
+    def _rename_assignment(self, node: AssignmentNode) -> BaseASTNode:
+        node = replace(node, identifier=_rename_token(node.identifier, self.renames))
+
+        return map_children(node, self.visit)
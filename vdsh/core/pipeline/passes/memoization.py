@@ -0,0 +1,69 @@
+from dataclasses import replace
+
+from vdsh.core.models.ast import (
+    BaseASTNode,
+    CallNode,
+    ForStatementNode,
+    FuncStatementNode,
+    IfStatementNode,
+    MemoizedFuncStatementNode,
+    ProgramNode,
+    ReturnStatementNode,
+    WhileStatementNode,
+)
+from vdsh.core.pipeline.passes.purity import find_pure_functions
+from vdsh.core.pipeline.passes.tree import walk
+from vdsh.core.types import BaseTransformer
+
+
+class Memoizer(BaseTransformer[BaseASTNode, BaseASTNode]):
+    """Marks pure functions that return a value on every path and loop or call for memoization"""
+
+    def transform(self, data: BaseASTNode) -> BaseASTNode:
+        if not isinstance(data, ProgramNode):
+            return data
+
+        pure_functions = find_pure_functions(data)
+        statements: list[BaseASTNode] = [
+            MemoizedFuncStatementNode(function=statement)
+            if isinstance(statement, FuncStatementNode)
+            and statement.decelration.identifier.name in pure_functions
+            and _is_worth_memoizing(statement)
+            else statement
+            for statement in data.statements
+        ]
+
+        if all(
+            statement is original
+            for statement, original in zip(statements, data.statements, strict=True)
+        ):
+            return data
+
+        return replace(data, statements=statements)
+
+
+def _is_worth_memoizing(function: FuncStatementNode) -> bool:
+    nodes = list(walk(function.decelration.block))
+
+    # The cache stores the return register, so a path that leaves it unset would cache a stale value
+    returns_value = all(
+        node.value is not None for node in nodes if isinstance(node, ReturnStatementNode)
+    ) and _ends_in_return(function.decelration.block.statements)
+    is_expensive = any(
+        isinstance(node, CallNode | WhileStatementNode | ForStatementNode) for node in nodes
+    )
+
+    return returns_value and is_expensive
+
+
+def _ends_in_return(statements: list[BaseASTNode]) -> bool:
+    return any(
+        isinstance(statement, ReturnStatementNode)
+        or (
+            isinstance(statement, IfStatementNode)
+            and statement.else_block is not None
+            and _ends_in_return(statement.block.statements)
+            and _ends_in_return(statement.else_block.statements)
+        )
+        for statement in statements
+    )
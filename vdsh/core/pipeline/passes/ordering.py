@@ -0,0 +1,53 @@
+from dataclasses import replace
+
+from vdsh.core.models.ast import (
+    BaseASTNode,
+    FuncStatementNode,
+    MemoizedFuncStatementNode,
+    ProgramNode,
+)
+from vdsh.core.models.call_profile import CallProfile
+from vdsh.core.types import BaseTransformer
+
+
+class FunctionOrderer(BaseTransformer[BaseASTNode, BaseASTNode]):
+    """Hoists top-level function definitions to the start of the program, hottest first"""
+
+    def __init__(self, profile: CallProfile) -> None:
+        self.profile = profile
+
+    def transform(self, data: BaseASTNode) -> BaseASTNode:
+        if not isinstance(data, ProgramNode):
+            return data
+
+        functions = [statement for statement in data.statements if _function_name(statement)]
+        names = [_function_name(statement) for statement in functions]
+        if len(set(names)) != len(names):
+            return data
+
+        ordered = sorted(
+            functions,
+            key=lambda statement: -self.profile.calls.get(_function_name(statement) or "", 0),
+        )
+        statements = [
+            *ordered,
+            *(statement for statement in data.statements if not _function_name(statement)),
+        ]
+
+        if all(
+            statement is original
+            for statement, original in zip(statements, data.statements, strict=True)
+        ):
+            return data
+
+        return replace(data, statements=statements)
+
+
+def _function_name(statement: BaseASTNode) -> str | None:
+    if isinstance(statement, MemoizedFuncStatementNode):
+        statement = statement.function
+
+    if isinstance(statement, FuncStatementNode):
+        return statement.decelration.identifier.name
+
+    return None
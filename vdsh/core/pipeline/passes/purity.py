@@ -0,0 +1,68 @@
+from vdsh.core.models.ast import (
+    AssignmentNode,
+    BaseASTNode,
+    CallNode,
+    FuncStatementNode,
+    IdentifierNode,
+    LetStatementNode,
+    ProgramNode,
+)
+from vdsh.core.pipeline.passes.tree import walk
+
+
+def find_pure_functions(program: ProgramNode) -> set[str]:
+    """
+    Names of the top-level functions whose result depends only on their arguments. A function is
+    pure if it only reads and writes its own locals and only calls pure functions.
+    """
+    definitions: dict[str, list[FuncStatementNode]] = {}
+    for statement in program.statements:
+        if isinstance(statement, FuncStatementNode):
+            definitions.setdefault(statement.decelration.identifier.name, []).append(statement)
+
+    callees: dict[str, set[str]] = {}
+    for name, functions in definitions.items():
+        called = _local_callees(functions[0]) if len(functions) == 1 else None
+        if called is not None:
+            callees[name] = called
+
+    pure = set(callees)
+    changed = True
+    while changed:
+        impure = {name for name in pure if not callees[name] <= pure}
+        pure -= impure
+        changed = bool(impure)
+
+    return pure
+
+
+def _local_callees(function: FuncStatementNode) -> set[str] | None:
+    """The functions `function` calls, or None if it touches anything but its own locals"""
+    declaration = function.decelration
+    local_names = {argument.identifier.name for argument in declaration.arguments.arguments}
+    local_names.update(
+        node.assignment.identifier.name
+        for node in walk(declaration.block)
+        if isinstance(node, LetStatementNode)
+    )
+    callees = set()
+
+    for node in walk(declaration.block):
+        if not _touches_only_locals(node, local_names):
+            return None
+
+        if isinstance(node, CallNode):
+            callees.add(node.identifier.name)
+
+    return callees
+
+
+def _touches_only_locals(node: BaseASTNode, local_names: set[str]) -> bool:
+    if isinstance(node, FuncStatementNode):
+        return False
+    if isinstance(node, IdentifierNode):
+        return node.identifier.name in local_names
+    if isinstance(node, AssignmentNode):
+        return node.identifier.name in local_names
+
+    return True
@@ -0,0 +1,122 @@
+from dataclasses import replace
+
+from vdsh.core.models.ast import (
+    AssignmentNode,
+    BaseASTNode,
+    BlockNode,
+    CallNode,
+    ContinueStatementNode,
+    ForStatementNode,
+    FuncDeclerationNode,
+    FuncStatementNode,
+    IdentifierNode,
+    LetStatementNode,
+    NumberLiteralNode,
+    ReturnStatementNode,
+    WhileStatementNode,
+)
+from vdsh.core.models.token import Keyword, KeywordToken, NumberToken
+from vdsh.core.pipeline.passes.tree import TreeRewriter, map_children
+from vdsh.core.types import BaseTransformer, visits
+
+TAIL_CALL_IDENTIFIER_FORMAT = "{function}_tail_{name}"
+
+
+class TailCallEliminator(TreeRewriter, BaseTransformer[BaseASTNode, BaseASTNode]):
+    """Rewrites `return f(...)` inside `f` into a loop that reassigns the parameters of `f`"""
+
+    def transform(self, data: BaseASTNode) -> BaseASTNode:
+        return self.visit(data)
+
+    @visits(FuncStatementNode)
+    def _eliminate_tail_calls(self, node: FuncStatementNode) -> BaseASTNode:
+        node = map_children(node, self.visit)  # type: ignore[assignment]
+        declaration = node.decelration
+
+        rewriter = _TailCallRewriter(declaration)
+        block = rewriter.visit(declaration.block)
+        if not rewriter.rewritten_count:
+            return node
+
+        assert isinstance(block, BlockNode)
+        statements = block.statements
+        if not statements or not isinstance(statements[-1], ContinueStatementNode):
+            return_ = KeywordToken(start=node.func.start, end=node.func.end, kind=Keyword.RETURN)
+            statements = [*statements, ReturnStatementNode(return_=return_)]
+
+        loop = WhileStatementNode(
+            while_=KeywordToken(start=node.func.start, end=node.func.end, kind=Keyword.WHILE),
+            condition=NumberLiteralNode(
+                number=NumberToken(start=node.func.start, end=node.func.end, value=1.0),
+            ),
+            block=replace(block, statements=statements),
+        )
+
+        return replace(
+            node,
+            decelration=replace(declaration, block=BlockNode(statements=[loop])),
+        )
+
+
+class _TailCallRewriter(TreeRewriter):
+    def __init__(self, declaration: FuncDeclerationNode) -> None:
+        self.declaration = declaration
+        self.rewritten_count = 0
+
+    @visits(FuncStatementNode, WhileStatementNode, ForStatementNode)
+    def _skip(self, node: BaseASTNode) -> BaseASTNode:
+        return node
+
+    @visits(BlockNode)
+    def _rewrite_block(self, node: BlockNode) -> BaseASTNode:
+        statements: list[BaseASTNode] = []
+
+        for statement in node.statements:
+            if self._is_tail_call(statement):
+                assert isinstance(statement, ReturnStatementNode)
+                assert isinstance(statement.value, CallNode)
+                statements.extend(self._reassign_parameters(statement.value))
+            else:
+                statements.append(self.visit(statement))
+
+        return replace(node, statements=statements)
+
+    def _is_tail_call(self, statement: BaseASTNode) -> bool:
+        return (
+            isinstance(statement, ReturnStatementNode)
+            and isinstance(statement.value, CallNode)
+            and statement.value.identifier.name == self.declaration.identifier.name
+            and len(statement.value.arguments) == len(self.declaration.arguments.arguments)
+        )
+
+    def _reassign_parameters(self, call: CallNode) -> list[BaseASTNode]:
+        self.rewritten_count += 1
+        parameters = [argument.identifier for argument in self.declaration.arguments.arguments]
+        temporaries = [
+            replace(
+                parameter,
+                name=TAIL_CALL_IDENTIFIER_FORMAT.format(
+                    function=self.declaration.identifier.name,
+                    name=parameter.name,
+                ),
+            )
+            for parameter in parameters
+        ]
+
+        bindings: list[BaseASTNode] = [
+            LetStatementNode(
+                let=KeywordToken(
+                    start=call.identifier.start,
+                    end=call.identifier.end,
+                    kind=Keyword.LET,
+                ),
+                assignment=AssignmentNode(identifier=temporary, value=value),
+            )
+            for temporary, value in zip(temporaries, call.arguments, strict=True)
+        ]
+        assignments: list[BaseASTNode] = [
+            AssignmentNode(identifier=parameter, value=IdentifierNode(identifier=temporary))
+            for parameter, temporary in zip(parameters, temporaries, strict=True)
+        ]
+
+        return [*bindings, *assignments, ContinueStatementNode()]
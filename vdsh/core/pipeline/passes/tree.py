@@ -0,0 +1,152 @@
+from collections.abc import Callable, Iterator
+from dataclasses import fields, replace
+from functools import cache
+
+from vdsh.core.models.ast import (
+    AssignmentNode,
+    BaseASTNode,
+    CallNode,
+    FuncStatementNode,
+    LetStatementNode,
+    MemoizedFuncStatementNode,
+)
+from vdsh.core.models.position import Position
+from vdsh.core.models.schema import ast_schema
+from vdsh.core.types import BaseVisitor
+
+_field_names_cache: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(node: BaseASTNode) -> tuple[str, ...]:
+    names = _field_names_cache.get(type(node))
+    if names is None:
+        names = _field_names_cache[type(node)] = tuple(item.name for item in fields(node))
+
+    return names
+
+
+def iter_children(node: BaseASTNode) -> Iterator[BaseASTNode]:
+    for name in _field_names(node):
+        value = getattr(node, name)
+
+        if isinstance(value, BaseASTNode):
+            yield value
+        elif isinstance(value, list):
+            yield from (item for item in value if isinstance(item, BaseASTNode))
+
+
+def map_children(node: BaseASTNode, function: Callable[[BaseASTNode], BaseASTNode]) -> BaseASTNode:
+    changes: dict[str, object] = {}
+
+    for name in _field_names(node):
+        value = getattr(node, name)
+
+        if isinstance(value, BaseASTNode):
+            mapped = function(value)
+            if mapped is not value:
+                changes[name] = mapped
+        elif isinstance(value, list):
+            items = [function(item) if isinstance(item, BaseASTNode) else item for item in value]
+            if any(item is not original for item, original in zip(items, value, strict=True)):
+                changes[name] = items
+
+    return replace(node, **changes) if changes else node
+
+
+def walk(node: BaseASTNode) -> Iterator[BaseASTNode]:
+    stack = [node]
+
+    while stack:
+        current = stack.pop()
+        yield current
+
+        for name in _field_names(current):
+            value = getattr(current, name)
+
+            if isinstance(value, BaseASTNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, BaseASTNode))
+
+
+@cache
+def _edge_fields() -> dict[type[BaseASTNode], tuple[tuple[str, ...], tuple[str, ...]]]:
+    schema = ast_schema()
+
+    return {
+        cls: (
+            tuple(plan.name for plan in schema.plans[cls] if plan.is_token),
+            tuple(plan.name for plan in schema.plans[cls] if not plan.is_token),
+        )
+        for cls in schema.node_kinds
+    }
+
+
+def _is_before(position: Position, other: Position) -> bool:
+    return (position.row, position.column) < (other.row, other.column)
+
+
+def _edge(node: BaseASTNode, is_end: bool) -> Position | None:
+    token_fields, node_fields = _edge_fields()[type(node)]
+    edge = None
+
+    for name in reversed(node_fields) if is_end else node_fields:
+        child = getattr(node, name)
+        if isinstance(child, list):
+            child = (child[-1] if is_end else child[0]) if child else None
+
+        if child is not None:
+            edge = _edge(child, is_end)
+            if edge is not None:
+                break
+
+    for name in token_fields:
+        token = getattr(node, name)
+        if isinstance(token, list):
+            token = (token[-1] if is_end else token[0]) if token else None
+
+        if token is None:
+            continue
+
+        position = token.end if is_end else token.start
+        if edge is None or (_is_before(edge, position) if is_end else _is_before(position, edge)):
+            edge = position
+
+    return edge
+
+
+def node_span(node: BaseASTNode) -> tuple[Position, Position] | None:
+    """
+    The source range of `node`. Child nodes are assumed to be declared in source order, so only
+    the first and last child of every node on the way down are visited.
+    """
+    start = _edge(node, is_end=False)
+    end = _edge(node, is_end=True)
+
+    return None if start is None or end is None else (start, end)
+
+
+def describe_statement(statement: BaseASTNode) -> str:
+    if isinstance(statement, LetStatementNode):
+        return f"let {statement.assignment.identifier.name}"
+    if isinstance(statement, AssignmentNode):
+        return f"{statement.identifier.name} ="
+    if isinstance(statement, CallNode):
+        return f"{statement.identifier.name}()"
+    if isinstance(statement, MemoizedFuncStatementNode):
+        return describe_statement(statement.function)
+    if isinstance(statement, FuncStatementNode):
+        return f"func {statement.decelration.identifier.name}"
+
+    return type(statement).__name__.removesuffix("Node").removesuffix("Statement").lower()
+
+
+def count_nodes(node: BaseASTNode) -> int:
+    return sum(1 for _ in walk(node))
+
+
+class TreeRewriter(BaseVisitor[BaseASTNode, BaseASTNode]):
+    """Rebuilds the tree, recursing into the children of every node without a handler"""
+
+    def default_visit(self, node: BaseASTNode) -> BaseASTNode:
+        return map_children(node, self.visit)
@@ -11,8 +11,12 @@ class Pipeline:
     type_checker: BaseValidator[BaseASTNode]
     code_generator: BaseTransformer[BaseASTNode, str]
 
-    def run(self) -> str:
+    def lower(self) -> BaseASTNode:
+        """Parses, optimizes and checks the program, returning the tree the code generator sees"""
         ast = self.parser.create()
         ast = self.optimizer.transform(ast)
         self.type_checker.validate(ast)
-        return self.code_generator.transform(ast)
+        return ast
+
+    def run(self) -> str:
+        return self.code_generator.transform(self.lower())
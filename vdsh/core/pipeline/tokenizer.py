@@ -8,7 +8,7 @@ from vdsh.core.errors import (
     UnexpectedCharacterError,
     UnterminatedStringError,
 )
-from vdsh.core.iterator import BaseIterator, PeekableIterator
+from vdsh.core.iterator import BaseIterator, SequenceIterator
 from vdsh.core.models import Position
 from vdsh.core.models.token import (
     BaseToken,
@@ -42,36 +42,57 @@ def _build_operators_by_first_char(operators_name_map: dict[str, Operator]) -> d
 OPERATORS_NAME_MAP = {operator.value: operator for operator in Operator}
 OPERATORS_BY_FIRST_CHAR = _build_operators_by_first_char(OPERATORS_NAME_MAP)
 STRING_TERMINATOR = '"'
+NEWLINE = "\n"
+
+
+def _read_source(char_iterator: BaseIterator[str]) -> tuple[str, int]:
+    """The string behind `char_iterator` and its offset, the chars of other iterators are joined"""
+    if isinstance(char_iterator, SequenceIterator) and isinstance(char_iterator.sequence, str):
+        return char_iterator.sequence, char_iterator.offset
+
+    chars = []
+    while not char_iterator.is_over():
+        chars.append(char_iterator.next())
+
+    return "".join(chars), 0
 
 
 class Tokenizer(BaseIterator[BaseToken]):
-    def __init__(self, char_iterator: BaseIterator[str]) -> None:
-        self.char_iterator = PeekableIterator(char_iterator)
-        self.position = Position(row=1, column=1)
+    """
+    Lexes the string behind `char_iterator` in place. Lexemes are scanned by offset and sliced out
+    of the source once they end, instead of being built up a char at a time.
+    """
+
+    def __init__(self, char_iterator: BaseIterator[str], start: Position | None = None) -> None:
+        self.source, self.offset = _read_source(char_iterator)
+        self.position = start.copy() if start is not None else Position(row=1, column=1)
         self._reached_eof = False
 
-    def _advance_position(self, char: str) -> None:
-        if char == "\n":
-            self.position.row += 1
-            self.position.column = 0
+    def _advance(self, end: int) -> None:
+        """Moves past `source[offset:end]`, keeping `position` at the char at `end`"""
+        newline = self.source.rfind(NEWLINE, self.offset, end)
+        if newline == -1:
+            self.position.column += end - self.offset
         else:
-            self.position.column += 1
+            self.position.row += self.source.count(NEWLINE, self.offset, newline + 1)
+            self.position.column = end - newline
 
-    def _consume(self) -> str:
-        char = self.char_iterator.next()
-        self.last_position = self.position.copy()
-        self._advance_position(char)
+        self.offset = end
 
-        return char
+    def _last_position(self) -> Position:
+        """The position of the char before `position`, which is on the same row after a lexeme"""
+        return Position(row=self.position.row, column=self.position.column - 1)
 
     def _read_while(self, predicate: Callable[[str], bool]) -> str:
-        result = []
-        while not self.char_iterator.is_over():
-            ch = self.char_iterator.peek()
-            if not predicate(ch):
-                break
-            result.append(self._consume())
-        return "".join(result)
+        source = self.source
+        start = end = self.offset
+        length = len(source)
+
+        while end < length and predicate(source[end]):
+            end += 1
+
+        self._advance(end)
+        return source[start:end]
 
     def _skip_whitespace(self) -> None:
         self._read_while(str.isspace)
@@ -86,7 +107,7 @@ class Tokenizer(BaseIterator[BaseToken]):
     def _read_number(self) -> NumberToken:
         start = self.position.copy()
         text = self._read_number_text()
-        end = self.last_position.copy()
+        end = self._last_position()
 
         try:
             value = float(text)
@@ -97,19 +118,14 @@ class Tokenizer(BaseIterator[BaseToken]):
 
     def _read_string(self) -> StringToken:
         start = self.position.copy()
-        self._consume()
-
-        value = ""
-        while not self.char_iterator.is_over():
-            char = self._consume()
+        closing = self.source.find(STRING_TERMINATOR, self.offset + 1)
+        if closing == -1:
+            raise UnterminatedStringError(start=start)
 
-            if char == STRING_TERMINATOR:
-                end = self.last_position.copy()
-                return StringToken(start=start, end=end, value=value)
+        value = self.source[self.offset + 1 : closing]
+        self._advance(closing + 1)
 
-            value += char
-
-        raise UnterminatedStringError(start=start)
+        return StringToken(start=start, end=self._last_position(), value=value)
 
     def _read_identifier_text(self) -> str:
         return self._read_while(str.isalpha)
@@ -117,7 +133,7 @@ class Tokenizer(BaseIterator[BaseToken]):
     def _read_identifier_or_keyword(self) -> BaseToken:
         start = self.position.copy()
         text = self._read_identifier_text()
-        end = self.last_position.copy()
+        end = self._last_position()
 
         for kw in Keyword:
             if text == kw.value:
@@ -127,9 +143,9 @@ class Tokenizer(BaseIterator[BaseToken]):
 
     def _read_operator(self, candidates: list[str]) -> OperatorToken:
         start = self.position.copy()
-        value = self._consume()
-        value = self._extend_operator(value, candidates)
-        end = self.last_position.copy()
+        value = self._extend_operator(self.source[self.offset], candidates)
+        self._advance(self.offset + len(value))
+        end = self._last_position()
 
         if value not in Operator:
             raise InvalidOperatorError(start=start, end=end, value=value)
@@ -137,26 +153,27 @@ class Tokenizer(BaseIterator[BaseToken]):
         return OperatorToken(start=start, end=end, kind=Operator(value))
 
     def _extend_operator(self, current: str, candidates: list[str]) -> str:
-        while not self.char_iterator.is_over():
-            nxt = self.char_iterator.peek()
-            trial = current + nxt
+        source = self.source
+
+        while self.offset + len(current) < len(source):
+            trial = current + source[self.offset + len(current)]
 
             if not any(op.startswith(trial) for op in candidates):
                 break
 
-            current += self._consume()
+            current = trial
 
         return current
 
     def next(self) -> BaseToken:
         self._skip_whitespace()
 
-        if self.char_iterator.is_over():
+        if self.offset >= len(self.source):
             self._reached_eof = True
             pos = self.position.copy()
             return EOFToken(start=pos, end=pos)
 
-        ch = self.char_iterator.peek()
+        ch = self.source[self.offset]
 
         if ch.isdigit():
             return self._read_number()
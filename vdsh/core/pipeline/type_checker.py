@@ -1,7 +1,67 @@
-from vdsh.core.models.ast import BaseASTNode
-from vdsh.core.types import BaseValidator
+from collections.abc import Iterator
 
+from vdsh.core.errors import (
+    ArgumentCountMismatchError,
+    ReturnOutsideFunctionError,
+    UndefinedFunctionError,
+)
+from vdsh.core.models.ast import BaseASTNode, CallNode, FuncStatementNode, ReturnStatementNode
+from vdsh.core.pipeline.passes.tree import iter_children, walk
+from vdsh.core.types import BaseValidator, BaseVisitor, visits
+
+
+def function_arities(node: BaseASTNode) -> Iterator[tuple[str, int]]:
+    """The name and argument count of every function declared in `node`, in `walk` order"""
+    for child in walk(node):
+        if isinstance(child, FuncStatementNode):
+            yield child.decelration.identifier.name, len(child.decelration.arguments.arguments)
+
+
+class TypeChecker(BaseVisitor[BaseASTNode, None], BaseValidator[BaseASTNode]):
+    def __init__(self) -> None:
+        self._arities: dict[str, int] = {}
+        self._function_depth = 0
 
-class TypeChecker(BaseValidator[BaseASTNode]):
     def validate(self, data: BaseASTNode) -> None:
-        return None
+        self.validate_statement(data, dict(function_arities(data)))
+
+    def validate_statement(self, statement: BaseASTNode, arities: dict[str, int]) -> None:
+        """Checks a top-level `statement` of a program that declares the functions in `arities`"""
+        self._arities = arities
+        self._function_depth = 0
+        self.visit(statement)
+
+    def default_visit(self, node: BaseASTNode) -> None:
+        for child in iter_children(node):
+            self.visit(child)
+
+    @visits(CallNode)
+    def _check_call(self, node: CallNode) -> None:
+        name = node.identifier.name
+
+        if name not in self._arities:
+            raise UndefinedFunctionError(function_name=name)
+
+        if self._arities[name] != len(node.arguments):
+            raise ArgumentCountMismatchError(
+                function_name=name,
+                expected=self._arities[name],
+                actual=len(node.arguments),
+            )
+
+        self.default_visit(node)
+
+    @visits(FuncStatementNode)
+    def _check_func_statement(self, node: FuncStatementNode) -> None:
+        self._function_depth += 1
+        try:
+            self.default_visit(node)
+        finally:
+            self._function_depth -= 1
+
+    @visits(ReturnStatementNode)
+    def _check_return_statement(self, node: ReturnStatementNode) -> None:
+        if self._function_depth == 0:
+            raise ReturnOutsideFunctionError
+
+        self.default_visit(node)
@@ -0,0 +1,222 @@
+from vdsh.core.errors import RecursionLimitError, UnknownFunctionError
+from vdsh.core.models.bytecode import BytecodeProgram, CodeObject, Opcode
+from vdsh.core.models.token import Operator
+from vdsh.core.pipeline import interpreter
+from vdsh.core.pipeline.bytecode_compiler import BINARY_OPCODES, UNARY_OPCODES
+from vdsh.core.pipeline.interpreter import Value, to_integer
+from vdsh.core.types import BaseTransformer
+
+MAX_CALL_DEPTH = 10_000
+OPCODE_COUNT = max(Opcode) + 1
+
+type _CallRecord = tuple[CodeObject, int, dict[tuple[Value, ...], Value] | None, tuple[Value, ...]]
+
+# Opcodes as plain integers, so the dispatch loop compares against fast local values
+LOAD_CONST = int(Opcode.LOAD_CONST)
+LOAD_NAME = int(Opcode.LOAD_NAME)
+STORE_NAME = int(Opcode.STORE_NAME)
+STORE_LOCAL = int(Opcode.STORE_LOCAL)
+POP = int(Opcode.POP)
+JUMP = int(Opcode.JUMP)
+JUMP_IF_FALSE = int(Opcode.JUMP_IF_FALSE)
+CALL = int(Opcode.CALL)
+RETURN_VALUE = int(Opcode.RETURN_VALUE)
+RETURN = int(Opcode.RETURN)
+DEFINE_FUNCTION = int(Opcode.DEFINE_FUNCTION)
+DEFINE_MEMOIZED_FUNCTION = int(Opcode.DEFINE_MEMOIZED_FUNCTION)
+HALT = int(Opcode.HALT)
+DELETE_NAME = int(Opcode.DELETE_NAME)
+ADD = int(Opcode.ADD)
+SUBTRACT = int(Opcode.SUBTRACT)
+LESS = int(Opcode.LESS)
+FIRST_UNARY = int(Opcode.NEGATE)
+FIRST_BINARY = int(Opcode.ADD)
+MIN_INTEGER = -(1 << 63)
+MAX_INTEGER = (1 << 63) - 1
+
+
+class VirtualMachine(BaseTransformer[BytecodeProgram, dict[str, Value]]):
+    """
+    Runs a `BytecodeProgram` on a value stack, with the semantics of the `Interpreter`. Calls push
+    a frame onto an explicit call stack, so recursion depth is not bound by Python's own stack.
+    """
+
+    def __init__(self, max_call_depth: int = MAX_CALL_DEPTH) -> None:
+        self.max_call_depth = max_call_depth
+        self.globals: dict[str, Value] = {}
+
+    def transform(self, data: BytecodeProgram) -> dict[str, Value]:  # noqa: C901
+        constants = data.constants
+        names = data.names
+        call_sites = [(names[name], count) for name, count in data.call_sites]
+        binary_operations = _operation_table(BINARY_OPCODES, interpreter.BINARY_OPERATIONS)
+        unary_operations = _operation_table(UNARY_OPCODES, interpreter.UNARY_OPERATIONS)
+
+        variables: dict[str, Value] = {}
+        frames: list[dict[str, Value]] = []
+        functions: dict[str, CodeObject] = {}
+        memo_caches: dict[str, dict[tuple[Value, ...], Value]] = {}
+        call_stack: list[_CallRecord] = []
+        stack: list[Value] = []
+        push = stack.append
+        pop = stack.pop
+        register: Value = ""
+        self.globals = variables
+
+        code = data.main
+        opcodes = code.opcodes
+        operands = code.operands
+        scope = variables
+        pc = 0
+
+        while True:
+            opcode = opcodes[pc]
+            operand = operands[pc]
+            pc += 1
+
+            if opcode == LOAD_NAME:
+                name = names[operand]
+                if name in scope:
+                    push(scope[name])
+                else:
+                    push(_lookup(name, frames, variables))
+            elif opcode == LOAD_CONST:
+                push(constants[operand])
+            elif opcode >= FIRST_BINARY:
+                right = pop()
+                left = pop()
+                if type(left) is not int:
+                    left = to_integer(left)
+                if type(right) is not int:
+                    right = to_integer(right)
+
+                # The most common operators skip the call, unless the result has to wrap around
+                if opcode == ADD:
+                    result = left + right
+                elif opcode == SUBTRACT:
+                    result = left - right
+                elif opcode == LESS:
+                    push(int(left < right))
+                    continue
+                else:
+                    push(binary_operations[opcode](left, right))  # type: ignore[misc]
+                    continue
+
+                if MIN_INTEGER <= result <= MAX_INTEGER:
+                    push(result)
+                else:
+                    push(binary_operations[opcode](left, right))  # type: ignore[misc]
+            elif opcode == JUMP_IF_FALSE:
+                value = pop()
+                if not (value if type(value) is int else to_integer(value)):
+                    pc = operand
+            elif opcode == JUMP:
+                pc = operand
+            elif opcode == STORE_NAME:
+                name = names[operand]
+                if name in scope:
+                    scope[name] = pop()
+                else:
+                    _assign(name, pop(), frames, variables)
+            elif opcode == STORE_LOCAL:
+                scope[names[operand]] = pop()
+            elif opcode == POP:
+                pop()
+            elif opcode == CALL:
+                name, count = call_sites[operand]
+                arguments = tuple(stack[len(stack) - count :])
+                del stack[len(stack) - count :]
+
+                cache = memo_caches.get(name)
+                if cache is not None and arguments in cache:
+                    register = cache[arguments]
+                    push(register)
+                    continue
+
+                function = functions.get(name)
+                if function is None:
+                    raise UnknownFunctionError(function_name=name)
+                if len(call_stack) >= self.max_call_depth:
+                    raise RecursionLimitError
+
+                call_stack.append((code, pc, cache, arguments))
+                scope = {
+                    names[parameter]: argument
+                    for parameter, argument in zip(function.parameters, arguments, strict=False)
+                }
+                frames.append(scope)
+                code = function
+                opcodes = code.opcodes
+                operands = code.operands
+                pc = 0
+            elif opcode in (RETURN_VALUE, RETURN):
+                if opcode == RETURN_VALUE:
+                    register = pop()
+
+                code, pc, cache, arguments = call_stack.pop()
+                if cache is not None:
+                    cache[arguments] = register
+
+                frames.pop()
+                scope = frames[-1] if frames else variables
+                opcodes = code.opcodes
+                operands = code.operands
+                push(register)
+            elif opcode >= FIRST_UNARY:
+                value = pop()
+                push(unary_operations[opcode](value if type(value) is int else to_integer(value)))  # type: ignore[misc]
+            elif opcode == DEFINE_FUNCTION:
+                function = data.functions[operand]
+                functions[function.name] = function
+                memo_caches.pop(function.name, None)
+            elif opcode == DEFINE_MEMOIZED_FUNCTION:
+                function = data.functions[operand]
+                functions[function.name] = function
+                memo_caches[function.name] = {}
+            elif opcode == DELETE_NAME:
+                _unset(names[operand], frames, variables)
+            elif opcode == HALT:
+                return variables
+
+
+def _operation_table[F](
+    opcodes: dict[Operator, Opcode],
+    operations: dict[Operator, F],
+) -> list[F | None]:
+    """The interpreter's operations indexed by opcode, so both engines share one set of semantics"""
+    table: list[F | None] = [None] * OPCODE_COUNT
+    for operator, opcode in opcodes.items():
+        table[opcode] = operations[operator]
+
+    return table
+
+
+def _lookup(name: str, frames: list[dict[str, Value]], variables: dict[str, Value]) -> Value:
+    for frame in reversed(frames):
+        if name in frame:
+            return frame[name]
+
+    return variables.get(name, "")
+
+
+def _assign(
+    name: str,
+    value: Value,
+    frames: list[dict[str, Value]],
+    variables: dict[str, Value],
+) -> None:
+    for frame in reversed(frames):
+        if name in frame:
+            frame[name] = value
+            return
+
+    variables[name] = value
+
+
+def _unset(name: str, frames: list[dict[str, Value]], variables: dict[str, Value]) -> None:
+    for frame in reversed(frames):
+        if name in frame:
+            del frame[name]
+            return
+
+    variables.pop(name, None)
@@ -0,0 +1,126 @@
+import asyncio
+import contextlib
+import os
+import signal
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from time import perf_counter
+
+from vdsh.core.compiler import Compiler, CompileResult
+from vdsh.core.errors import VDSHError
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class OutputStream(Enum):
+    STDOUT = "stdout"
+    STDERR = "stderr"
+
+
+type OutputHandler = Callable[[str, OutputStream, str], None]
+
+
+@dataclass(frozen=True)
+class ScriptRun:
+    """
+    The outcome of one script. `exit_code` is None if the script did not compile, with the
+    reason in `error`, or if it was killed for running longer than the timeout.
+    """
+
+    name: str
+    exit_code: int | None = None
+    seconds: float = 0.0
+    timed_out: bool = False
+    error: VDSHError | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.exit_code == 0
+
+
+@dataclass
+class ScriptRunner:
+    """
+    Compiles and runs many VDSH scripts as concurrent subprocesses, at most `max_concurrency` at a
+    time. Every output line is passed to `on_output` as soon as it is read, with its script name.
+    """
+
+    compiler: Compiler = field(default_factory=Compiler)
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    timeout: float | None = None
+    on_output: OutputHandler | None = None
+
+    async def run(self, sources: Mapping[str, str]) -> list[ScriptRun]:
+        """Runs `sources`, keyed by script name, and returns their outcomes in the same order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return list(
+            await asyncio.gather(
+                *(self._run_source(name, source, semaphore) for name, source in sources.items()),
+            ),
+        )
+
+    async def _run_source(self, name: str, source: str, semaphore: asyncio.Semaphore) -> ScriptRun:
+        try:
+            result = await self.compiler.compile_async(source)
+        except VDSHError as error:
+            return ScriptRun(name=name, error=error)
+
+        async with semaphore:
+            return await self._execute(name, result)
+
+    async def _execute(self, name: str, result: CompileResult) -> ScriptRun:
+        start = perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            self.compiler.options.target.value,
+            "-c",
+            result.script,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        assert process.stdout is not None
+        assert process.stderr is not None
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._forward(name, OutputStream.STDOUT, process.stdout),
+                    self._forward(name, OutputStream.STDERR, process.stderr),
+                    process.wait(),
+                ),
+                self.timeout,
+            )
+        except TimeoutError:
+            # The script runs in its own session, so this also kills the commands it started
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(process.pid, signal.SIGKILL)
+            await process.wait()
+            return ScriptRun(name=name, seconds=perf_counter() - start, timed_out=True)
+
+        return ScriptRun(name=name, exit_code=process.returncode, seconds=perf_counter() - start)
+
+    async def _forward(self, name: str, stream: OutputStream, reader: asyncio.StreamReader) -> None:
+        async for line in reader:
+            if self.on_output is not None:
+                self.on_output(name, stream, line.decode(errors="replace").rstrip("\n"))
+
+
+async def run_many(
+    sources: Mapping[str, str],
+    *,
+    compiler: Compiler | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: float | None = None,
+    on_output: OutputHandler | None = None,
+) -> list[ScriptRun]:
+    runner = ScriptRunner(
+        compiler=compiler or Compiler(),
+        max_concurrency=max_concurrency,
+        timeout=timeout,
+        on_output=on_output,
+    )
+
+    return await runner.run(sources)
@@ -0,0 +1,6 @@
+from vdsh.core.serialization.ast_serializer import dump, dumps, load, loads
+from vdsh.core.serialization.bytecode_serializer import dumps as dumps_bytecode
+from vdsh.core.serialization.bytecode_serializer import loads as loads_bytecode
+from vdsh.core.serialization.json_serializer import to_json
+
+__all__ = ["dump", "dumps", "dumps_bytecode", "load", "loads", "loads_bytecode", "to_json"]
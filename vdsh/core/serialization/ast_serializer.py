@@ -0,0 +1,423 @@
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from typing import IO, Any
+
+from vdsh.core.errors import InvalidASTCacheError
+from vdsh.core.models import Position
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.models.schema import FieldKind, FieldPlan, Schema, ast_schema
+from vdsh.core.models.token import BaseToken
+
+MAGIC = b"VDSHAST\0"
+FORMAT_VERSION = 2
+TOKEN_COLUMNS = 6
+INT_TABLES = TOKEN_COLUMNS + 2
+HEADER = struct.Struct(f"<8sHBxIIIIII{INT_TABLES}s")
+INT_TYPECODES = "bhiq"
+FLOAT_TYPECODE = "d"
+NONE_REFERENCE = 0
+REFERENCE_KINDS = frozenset(
+    {FieldKind.REFERENCE, FieldKind.OPTIONAL_REFERENCE, FieldKind.REFERENCE_LIST},
+)
+
+
+def _pack(values: list[int]) -> array[int]:
+    """Stores `values` in the narrowest signed integer type that holds all of them"""
+    low, high = min(values, default=0), max(values, default=0)
+
+    for typecode in INT_TYPECODES:
+        packed = array(typecode)
+        bits = packed.itemsize * 8 - 1
+        if -(1 << bits) <= low and high < 1 << bits:
+            packed.fromlist(values)
+            return packed
+
+    raise OverflowError(f"{high} does not fit in a 64-bit integer")
+
+
+class _Encoder:
+    """
+    Flattens a tree into a token table and a node table, children before their parents. Tokens
+    are stored in the order the decoder consumes them, so nodes do not refer to them. Nodes refer
+    to their children by distance back in the table and token positions are stored as
+    differences, so most values fit in a byte or two.
+    """
+
+    def __init__(self) -> None:
+        self.schema = ast_schema()
+        self.token_ids = {cls: index for index, cls in enumerate(self.schema.token_kinds)}
+        self.node_ids = {cls: index for index, cls in enumerate(self.schema.node_kinds)}
+        self.strings: list[str] = []
+        self.floats: array[float] = array(FLOAT_TYPECODE)
+        self.token_columns: list[list[int]] = [[] for _ in range(TOKEN_COLUMNS)]
+        self.node_words: list[int] = []
+        self._previous_row = 0
+        self._string_ids: dict[str, int] = {}
+        self._float_ids: dict[str, int] = {}
+        self._node_references: dict[int, int] = {}
+
+    def encode(self, root: BaseASTNode) -> bytes:
+        self._encode_nodes(root)
+
+        encoded_strings = [string.encode() for string in self.strings]
+        blob = b"".join(encoded_strings)
+        tables = [
+            _pack([len(string) for string in encoded_strings]),
+            *(_pack(column) for column in self.token_columns),
+            _pack(self.node_words),
+        ]
+
+        header = HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            sys.byteorder == "big",
+            self.schema.fingerprint,
+            len(self.strings),
+            len(blob),
+            len(self.floats),
+            len(self.token_columns[0]),
+            len(self.node_words),
+            "".join(table.typecode for table in tables).encode(),
+        )
+
+        return b"".join(
+            [
+                header,
+                tables[0].tobytes(),
+                blob,
+                self.floats.tobytes(),
+                *(table.tobytes() for table in tables[1:]),
+            ],
+        )
+
+    def _intern(self, string: str) -> int:
+        index = self._string_ids.get(string)
+        if index is None:
+            index = self._string_ids[string] = len(self.strings)
+            self.strings.append(string)
+
+        return index
+
+    def _intern_float(self, value: float) -> int:
+        # Keyed by the exact representation, so that -0.0 and 0.0 stay apart
+        key = value.hex()
+        index = self._float_ids.get(key)
+        if index is None:
+            index = self._float_ids[key] = len(self.floats)
+            self.floats.append(value)
+
+        return index
+
+    def _encode_value(self, plan: FieldPlan, value: Any) -> int:
+        if plan.kind == FieldKind.STRING:
+            return self._intern(value)
+        if plan.kind == FieldKind.ENUM:
+            return plan.indices[value]
+
+        return self._intern_float(value)
+
+    def _encode_token(self, token: BaseToken) -> None:
+        payload = [
+            self._encode_value(plan, getattr(token, plan.name))
+            for plan in self.schema.plans[type(token)][2:]
+        ]
+        row = (
+            self.token_ids[type(token)],
+            token.start.row - self._previous_row,
+            token.start.column,
+            token.end.row - token.start.row,
+            token.end.column - token.start.column,
+            payload[0] if payload else 0,
+        )
+
+        for column, value in zip(self.token_columns, row, strict=True):
+            column.append(value)
+
+        self._previous_row = token.start.row
+
+    def _encode_nodes(self, root: BaseASTNode) -> None:
+        """Encodes the tree in post-order, without recursing, so deep trees can be cached"""
+        pending: list[tuple[BaseASTNode, bool]] = [(root, False)]
+
+        while pending:
+            node, is_expanded = pending.pop()
+            if id(node) in self._node_references:
+                continue
+
+            if is_expanded:
+                self._encode_node(node)
+                continue
+
+            pending.append((node, True))
+            pending.extend((child, False) for child in reversed(self._children(node)))
+
+    def _children(self, node: BaseASTNode) -> list[BaseASTNode]:
+        children = []
+
+        for plan in self.schema.plans[type(node)]:
+            if plan.is_token or plan.kind not in REFERENCE_KINDS:
+                continue
+
+            value = getattr(node, plan.name)
+            if isinstance(value, list):
+                children.extend(value)
+            elif value is not None:
+                children.append(value)
+
+        return children
+
+    def _encode_token_field(self, plan: FieldPlan, value: Any, words: list[int]) -> None:
+        """Tokens are not referred to, only the number of tokens in the field is stored"""
+        if plan.kind == FieldKind.REFERENCE:
+            self._encode_token(value)
+            return
+
+        tokens = value if isinstance(value, list) else [] if value is None else [value]
+        words.append(len(tokens))
+
+        for token in tokens:
+            self._encode_token(token)
+
+    def _reference(self, node: BaseASTNode) -> int:
+        return len(self._node_references) - self._node_references[id(node)]
+
+    def _encode_node(self, node: BaseASTNode) -> None:
+        words: list[int] = [self.node_ids[type(node)]]
+
+        for plan in self.schema.plans[type(node)]:
+            value = getattr(node, plan.name)
+
+            if plan.is_token:
+                self._encode_token_field(plan, value, words)
+                continue
+
+            match plan.kind:
+                case FieldKind.REFERENCE:
+                    words.append(self._reference(value))
+                case FieldKind.OPTIONAL_REFERENCE:
+                    words.append(NONE_REFERENCE if value is None else self._reference(value))
+                case FieldKind.REFERENCE_LIST:
+                    words.append(len(value))
+                    words.extend(self._reference(item) for item in value)
+                case FieldKind.POSITION:
+                    words.extend((value.row, value.column))
+                case _:
+                    words.append(self._encode_value(plan, value))
+
+        self.node_words.extend(words)
+        self._node_references[id(node)] = len(self._node_references)
+
+
+class _Reader:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.offset = 0
+        self.swap = False
+
+    def header(self) -> tuple[Any, ...]:
+        if len(self.data) < HEADER.size:
+            raise InvalidASTCacheError(reason="truncated header")
+
+        values = HEADER.unpack_from(self.data)
+        self.offset = HEADER.size
+        self.swap = bool(values[2]) != (sys.byteorder == "big")
+
+        return values
+
+    def raw(self, size: int) -> bytes:
+        if self.offset + size > len(self.data):
+            raise InvalidASTCacheError(reason="truncated cache")
+
+        chunk = self.data[self.offset : self.offset + size]
+        self.offset += size
+
+        return chunk
+
+    def array(self, typecode: str, length: int) -> array[Any]:
+        values = array(typecode)
+        values.frombytes(self.raw(length * values.itemsize))
+        if self.swap:
+            values.byteswap()
+
+        return values
+
+
+def _payload_table(plans: list[FieldPlan], strings: list[str], floats: array[float]) -> Any:
+    if not plans:
+        return None
+    if plans[0].kind == FieldKind.STRING:
+        return strings
+    if plans[0].kind == FieldKind.ENUM:
+        return plans[0].members
+
+    return floats
+
+
+def _decode_tokens(
+    schema: Schema,
+    columns: list[array[int]],
+    strings: list[str],
+    floats: array[float],
+) -> list[Any]:
+    token_kinds = schema.token_kinds
+    payload_tables = [_payload_table(schema.plans[cls][2:], strings, floats) for cls in token_kinds]
+    tokens: list[Any] = []
+    append = tokens.append
+
+    kinds, row_steps, start_columns, row_spans, column_spans, payloads = columns
+    rows = accumulate(row_steps)
+
+    for kind, start_row, start_column, row_span, column_span, payload in zip(
+        kinds,
+        rows,
+        start_columns,
+        row_spans,
+        column_spans,
+        payloads,
+        strict=True,
+    ):
+        table = payload_tables[kind]
+        start = Position(start_row, start_column)
+        end = Position(start_row + row_span, start_column + column_span)
+
+        if table is None:
+            append(token_kinds[kind](start, end))
+        else:
+            append(token_kinds[kind](start, end, table[payload]))
+
+    return tokens
+
+
+def _decode_nodes(  # noqa: C901
+    schema: Schema,
+    tokens: list[Any],
+    words: array[int],
+    strings: list[str],
+    floats: array[float],
+) -> list[Any]:
+    node_kinds = schema.node_kinds
+    decoders = [
+        [(plan.kind, plan.is_token, plan.members) for plan in schema.plans[cls]]
+        for cls in node_kinds
+    ]
+    nodes: list[Any] = []
+    position = 0
+    token_index = 0
+    end = len(words)
+
+    while position < end:
+        kind = words[position]
+        position += 1
+        arguments: list[Any] = []
+
+        for field_kind, is_token, members in decoders[kind]:
+            if is_token and field_kind == FieldKind.REFERENCE:
+                arguments.append(tokens[token_index])
+                token_index += 1
+                continue
+
+            word = words[position]
+            position += 1
+
+            if is_token:
+                items = tokens[token_index : token_index + word]
+                token_index += word
+                if field_kind == FieldKind.REFERENCE_LIST:
+                    arguments.append(items)
+                else:
+                    arguments.append(items[0] if items else None)
+            elif field_kind == FieldKind.REFERENCE:
+                arguments.append(nodes[-word])
+            elif field_kind == FieldKind.REFERENCE_LIST:
+                arguments.append([nodes[-index] for index in words[position : position + word]])
+                position += word
+            elif field_kind == FieldKind.OPTIONAL_REFERENCE:
+                arguments.append(None if word == NONE_REFERENCE else nodes[-word])
+            elif field_kind == FieldKind.POSITION:
+                arguments.append(Position(word, words[position]))
+                position += 1
+            elif field_kind == FieldKind.STRING:
+                arguments.append(strings[word])
+            elif field_kind == FieldKind.ENUM:
+                arguments.append(members[word])
+            else:
+                arguments.append(floats[word])
+
+        nodes.append(node_kinds[kind](*arguments))
+
+    if token_index != len(tokens):
+        raise InvalidASTCacheError(reason="corrupted token table")
+
+    return nodes
+
+
+def _decode(data: bytes) -> BaseASTNode:
+    schema = ast_schema()
+    reader = _Reader(data)
+    (
+        magic,
+        version,
+        _,
+        fingerprint,
+        strings_count,
+        blob_size,
+        floats_count,
+        tokens_count,
+        words,
+        typecodes,
+    ) = reader.header()
+
+    if magic != MAGIC:
+        raise InvalidASTCacheError(reason="not a VDSH AST cache")
+    if version != FORMAT_VERSION or fingerprint != schema.fingerprint:
+        raise InvalidASTCacheError(reason="cache was written by an incompatible VDSH version")
+
+    table_typecodes = typecodes.decode("ascii", "replace")
+    if any(typecode not in INT_TYPECODES for typecode in table_typecodes):
+        raise InvalidASTCacheError(reason="unknown integer table type")
+
+    lengths_typecode, *column_typecodes, words_typecode = table_typecodes
+    lengths = reader.array(lengths_typecode, strings_count)
+    blob = reader.raw(blob_size)
+    floats = reader.array(FLOAT_TYPECODE, floats_count)
+    columns = [reader.array(typecode, tokens_count) for typecode in column_typecodes]
+    node_words = reader.array(words_typecode, words)
+
+    if reader.offset != len(data):
+        raise InvalidASTCacheError(reason="unexpected trailing data")
+
+    strings = []
+    start = 0
+    for length in lengths:
+        strings.append(blob[start : start + length].decode())
+        start += length
+
+    try:
+        tokens = _decode_tokens(schema, columns, strings, floats)
+        nodes = _decode_nodes(schema, tokens, node_words, strings, floats)
+    except IndexError as error:
+        raise InvalidASTCacheError(reason="corrupted node table") from error
+
+    root = nodes[-1] if nodes else None
+    if not isinstance(root, BaseASTNode):
+        raise InvalidASTCacheError(reason="cache does not contain an AST")
+
+    return root
+
+
+def dumps(node: BaseASTNode) -> bytes:
+    return _Encoder().encode(node)
+
+
+def loads(data: bytes) -> BaseASTNode:
+    return _decode(data)
+
+
+def dump(node: BaseASTNode, file: IO[bytes]) -> None:
+    file.write(dumps(node))
+
+
+def load(file: IO[bytes]) -> BaseASTNode:
+    return loads(file.read())
@@ -0,0 +1,219 @@
+import struct
+import sys
+from array import array
+from typing import Any
+
+from vdsh.core.errors import InvalidBytecodeCacheError
+from vdsh.core.models.bytecode import BytecodeProgram, CodeObject, Constant, Opcode
+
+MAGIC = b"VDSHBC\0\0"
+FORMAT_VERSION = 1
+DIGEST_SIZE = 32
+HEADER = struct.Struct(f"<8sHBx{DIGEST_SIZE}sIIIIIII")
+OPCODE_TYPECODE = "B"
+INT_TYPECODE = "i"
+INTEGER_CONSTANT = 0
+STRING_CONSTANT = 1
+CODE_COLUMNS = 3
+VALID_OPCODES = frozenset(Opcode)
+
+
+class _Encoder:
+    """Lays a program out as a string table followed by flat integer columns"""
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+
+    def _intern(self, string: str) -> int:
+        index = self._string_ids.get(string)
+        if index is None:
+            index = self._string_ids[string] = len(self.strings)
+            self.strings.append(string)
+
+        return index
+
+    def encode(self, program: BytecodeProgram, source_digest: bytes) -> bytes:
+        names = array(INT_TYPECODE, [self._intern(name) for name in program.names])
+        constant_kinds = array(
+            OPCODE_TYPECODE,
+            [
+                STRING_CONSTANT if isinstance(value, str) else INTEGER_CONSTANT
+                for value in program.constants
+            ],
+        )
+        constants = array(INT_TYPECODE, [self._intern(str(value)) for value in program.constants])
+        call_sites = array(INT_TYPECODE, [word for site in program.call_sites for word in site])
+
+        codes = [program.main, *program.functions]
+        table = array(INT_TYPECODE)
+        parameters = array(INT_TYPECODE)
+        opcodes = array(OPCODE_TYPECODE)
+        operands = array(INT_TYPECODE)
+
+        for code in codes:
+            table.extend((self._intern(code.name), len(code.parameters), len(code)))
+            parameters.extend(code.parameters)
+            opcodes.extend(code.opcodes)
+            operands.extend(code.operands)
+
+        encoded_strings = [string.encode() for string in self.strings]
+        lengths = array(INT_TYPECODE, [len(string) for string in encoded_strings])
+        blob = b"".join(encoded_strings)
+
+        header = HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            sys.byteorder == "big",
+            source_digest,
+            len(self.strings),
+            len(blob),
+            len(names),
+            len(constants),
+            len(program.call_sites),
+            len(codes),
+            len(opcodes),
+        )
+
+        return b"".join(
+            [
+                header,
+                lengths.tobytes(),
+                blob,
+                names.tobytes(),
+                constant_kinds.tobytes(),
+                constants.tobytes(),
+                call_sites.tobytes(),
+                table.tobytes(),
+                parameters.tobytes(),
+                opcodes.tobytes(),
+                operands.tobytes(),
+            ],
+        )
+
+
+class _Reader:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.offset = 0
+        self.swap = False
+
+    def header(self) -> tuple[Any, ...]:
+        if len(self.data) < HEADER.size:
+            raise InvalidBytecodeCacheError(reason="truncated header")
+
+        values = HEADER.unpack_from(self.data)
+        self.offset = HEADER.size
+        self.swap = bool(values[2]) != (sys.byteorder == "big")
+
+        return values
+
+    def raw(self, size: int) -> bytes:
+        if self.offset + size > len(self.data):
+            raise InvalidBytecodeCacheError(reason="truncated cache")
+
+        chunk = self.data[self.offset : self.offset + size]
+        self.offset += size
+
+        return chunk
+
+    def array(self, typecode: str, length: int) -> array[int]:
+        values = array(typecode)
+        values.frombytes(self.raw(length * values.itemsize))
+        if self.swap:
+            values.byteswap()
+
+        return values
+
+
+def _decode(data: bytes, source_digest: bytes) -> BytecodeProgram:
+    reader = _Reader(data)
+    (
+        magic,
+        version,
+        _,
+        digest,
+        strings_count,
+        blob_size,
+        names_count,
+        constants_count,
+        call_sites_count,
+        codes_count,
+        instructions_count,
+    ) = reader.header()
+
+    if magic != MAGIC:
+        raise InvalidBytecodeCacheError(reason="not a VDSH bytecode cache")
+    if version != FORMAT_VERSION:
+        raise InvalidBytecodeCacheError(reason="cache was written by an incompatible VDSH version")
+    if digest != source_digest:
+        raise InvalidBytecodeCacheError(reason="cache is out of date")
+
+    lengths = reader.array(INT_TYPECODE, strings_count)
+    blob = reader.raw(blob_size)
+    names = reader.array(INT_TYPECODE, names_count)
+    constant_kinds = reader.array(OPCODE_TYPECODE, constants_count)
+    constants = reader.array(INT_TYPECODE, constants_count)
+    call_sites = reader.array(INT_TYPECODE, call_sites_count * 2)
+    table = reader.array(INT_TYPECODE, codes_count * CODE_COLUMNS)
+    parameters_count = sum(table[1::CODE_COLUMNS])
+    parameters = reader.array(INT_TYPECODE, parameters_count)
+    opcodes = reader.array(OPCODE_TYPECODE, instructions_count)
+    operands = reader.array(INT_TYPECODE, instructions_count)
+
+    if reader.offset != len(data):
+        raise InvalidBytecodeCacheError(reason="unexpected trailing data")
+    if not VALID_OPCODES.issuperset(opcodes):
+        raise InvalidBytecodeCacheError(reason="unknown opcode")
+
+    strings = []
+    start = 0
+    for length in lengths:
+        strings.append(blob[start : start + length].decode())
+        start += length
+
+    try:
+        constant_values: list[Constant] = [
+            strings[index] if kind == STRING_CONSTANT else int(strings[index])
+            for kind, index in zip(constant_kinds, constants, strict=True)
+        ]
+        codes = []
+        parameter_position = instruction_position = 0
+
+        for row in range(0, len(table), CODE_COLUMNS):
+            name, parameter_count, instruction_count = table[row : row + CODE_COLUMNS]
+            parameter_end = parameter_position + parameter_count
+            instruction_end = instruction_position + instruction_count
+            codes.append(
+                CodeObject(
+                    name=strings[name],
+                    parameters=list(parameters[parameter_position:parameter_end]),
+                    opcodes=opcodes[instruction_position:instruction_end],
+                    operands=operands[instruction_position:instruction_end],
+                ),
+            )
+            parameter_position = parameter_end
+            instruction_position = instruction_end
+
+        return BytecodeProgram(
+            main=codes[0],
+            functions=codes[1:],
+            constants=constant_values,
+            names=[strings[index] for index in names],
+            call_sites=list(zip(call_sites[::2], call_sites[1::2], strict=True)),
+        )
+    except (IndexError, ValueError) as error:
+        raise InvalidBytecodeCacheError(reason="corrupted cache") from error
+
+
+def dumps(program: BytecodeProgram, source_digest: bytes) -> bytes:
+    """Encodes `program` together with the digest of what it was compiled from"""
+    if len(source_digest) != DIGEST_SIZE:
+        raise ValueError(f"Source digest must be {DIGEST_SIZE} bytes long")
+
+    return _Encoder().encode(program, source_digest)
+
+
+def loads(data: bytes, source_digest: bytes) -> BytecodeProgram:
+    """Decodes a cache, rejecting one that was compiled from anything but `source_digest`"""
+    return _decode(data, source_digest)
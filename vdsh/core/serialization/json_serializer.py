@@ -0,0 +1,46 @@
+from functools import cache
+from typing import Any
+
+from vdsh.core.models.ast import BaseASTNode
+from vdsh.core.models.schema import FieldKind, ast_schema
+from vdsh.core.models.token import BaseToken
+
+TYPE_KEY = "type"
+
+
+@cache
+def _field_kinds() -> dict[type, list[tuple[str, FieldKind]]]:
+    return {
+        cls: [(plan.name, plan.kind) for plan in plans] for cls, plans in ast_schema().plans.items()
+    }
+
+
+def _encode(value: Any, field_kinds: dict[type, list[tuple[str, FieldKind]]]) -> dict[str, Any]:
+    cls = type(value)
+    encoded: dict[str, Any] = {TYPE_KEY: cls.__name__}
+
+    for name, kind in field_kinds[cls]:
+        field = getattr(value, name)
+
+        if kind == FieldKind.REFERENCE:
+            encoded[name] = _encode(field, field_kinds)
+        elif kind == FieldKind.REFERENCE_LIST:
+            encoded[name] = [_encode(item, field_kinds) for item in field]
+        elif kind == FieldKind.POSITION:
+            encoded[name] = [field.row, field.column]
+        elif kind == FieldKind.OPTIONAL_REFERENCE:
+            encoded[name] = None if field is None else _encode(field, field_kinds)
+        elif kind == FieldKind.ENUM:
+            encoded[name] = field.value
+        else:
+            encoded[name] = field
+
+    return encoded
+
+
+def to_json(value: BaseASTNode | BaseToken) -> dict[str, Any]:
+    """
+    Converts a token or a tree into plain JSON data. Every object names its class under `type`,
+    positions become `[row, column]` pairs and enum members their values.
+    """
+    return _encode(value, _field_kinds())
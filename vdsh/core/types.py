@@ -1,4 +1,7 @@
-from typing import Protocol
+from collections.abc import Callable
+from typing import Any, ClassVar, Protocol
+
+from vdsh.core.errors import UnhandledNodeError
 
 
 class BaseCreator[T](Protocol):
@@ -27,3 +30,63 @@ class StaticTransformer[O](BaseTransformer[None, O]):
 
     def transform(self, data: None = None) -> O:
         return data or self.value
+
+
+VISITED_TYPES_ATTRIBUTE = "__visits__"
+
+
+def visits[F: Callable[..., Any]](*node_types: type) -> Callable[[F], F]:
+    """Registers the decorated method as the `BaseVisitor` handler of `node_types`"""
+
+    def decorator(method: F) -> F:
+        setattr(method, VISITED_TYPES_ATTRIBUTE, node_types)
+        return method
+
+    return decorator
+
+
+class BaseVisitor[N, R]:
+    """
+    Dispatches `visit` to the method registered with `@visits` for the class of the node.
+
+    Handlers are looked up along the node's MRO, so a handler registered for a base class also
+    handles its subclasses, and the resolved handler is cached per visitor and node class.
+    """
+
+    _handler_names: ClassVar[dict[type, str]] = {}
+    _dispatch_cache: ClassVar[dict[type, Callable[[Any, Any], Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        handler_names = dict(cls._handler_names)
+        for name, attribute in vars(cls).items():
+            for node_type in getattr(attribute, VISITED_TYPES_ATTRIBUTE, ()):
+                handler_names[node_type] = name
+
+        cls._handler_names = handler_names
+        cls._dispatch_cache = {}
+
+    def visit(self, node: N) -> R:
+        handler = self._dispatch_cache.get(type(node))
+        if handler is None:
+            handler = self._resolve_handler(type(node))
+
+        return handler(self, node)  # type: ignore[no-any-return]
+
+    @classmethod
+    def _resolve_handler(cls, node_type: type) -> Callable[[Any, Any], Any]:
+        handler = next(
+            (
+                getattr(cls, cls._handler_names[candidate])
+                for candidate in node_type.__mro__
+                if candidate in cls._handler_names
+            ),
+            cls.default_visit,
+        )
+        cls._dispatch_cache[node_type] = handler
+
+        return handler
+
+    def default_visit(self, node: N) -> R:
+        raise UnhandledNodeError(visitor=type(self).__name__, node=type(node).__name__)